@@ -0,0 +1,166 @@
+"""
+Activity Log Module for PayEase
+Append-only feed of employee, payroll and attendance changes for the dashboard
+"""
+
+from datetime import datetime
+
+from mysql.connector import Error
+
+
+class ActivityLog:
+    """Writes change events to activity_log and reads back the newest entries"""
+
+    def __init__(self, db):
+        """
+        Initialize activity log
+
+        Args:
+            db (DatabaseConnection): Database holding the activity_log table
+        """
+        self.db = db
+
+    def on_change(self, event, details):
+        """Change listener: turn a committed write into an activity entry"""
+        entry = self.describe(event, details)
+        if entry:
+            icon, title, detail, employee_id = entry
+            self.record(event, icon, title, detail, employee_id)
+
+    @staticmethod
+    def describe(event, details):
+        """
+        Map a change event to what the feed shows
+
+        Returns:
+            tuple: (icon, title, detail, employee_id) or None to skip the event
+        """
+        employee_id = details.get('employee_id')
+
+        if event == 'employee_added':
+            employee = details.get('employee') or {}
+            return ("👤", "Employee Added", employee.get('Position') or '', employee_id)
+
+        if event == 'employee_batch_added':
+            employees = details.get('employees') or []
+            if not employees:
+                return None
+            return ("👥", "Employees Onboarded", f"{len(employees)} new staff members", None)
+
+        if event == 'employee_updated':
+            changes = details.get('changes') or {}
+            if details.get('archived_changed'):
+                if changes.get('is_archived'):
+                    return ("📁", "Employee Archived", "Moved to archive", employee_id)
+                return ("↩️", "Employee Restored", "Back to active staff", employee_id)
+            return ("✏️", "Employee Updated", "Profile details changed", employee_id)
+
+        if event == 'employee_deleted':
+            return ("🗑", "Employee Deleted", details.get('name') or employee_id or '', None)
+
+        if event == 'payroll_added':
+            record = details.get('record') or {}
+            return ("💰", "Payroll Processed", f"{record.get('month', '')} {record.get('year', '')}".strip(),
+                    record.get('employee_id'))
+
+        if event == 'payroll_batch_added':
+            records = details.get('records') or []
+            if not records:
+                return None
+            first = records[0]
+            return ("💰", "Payroll Run",
+                    f"{len(records)} payslips for {first.get('month', '')} {first.get('year', '')}".strip(), None)
+
+        if event == 'payroll_deleted':
+            previous = details.get('previous') or {}
+            return ("🗑", "Payroll Deleted", f"{previous.get('month', '')} {previous.get('year', '')}".strip(),
+                    previous.get('employee_id'))
+
+        if event == 'payroll_status_changed':
+            return ("✅", f"Payroll {details.get('status')}", f"Payroll #{details.get('payroll_id')}", None)
+
+        if event == 'attendance_saved':
+            record = details.get('record') or {}
+            return ("📅", "Attendance Recorded", f"{record.get('status', '')} on {record.get('date', '')}",
+                    employee_id)
+
+        if event == 'attendance_imported':
+            return ("📥", "Attendance Imported", f"{details.get('count', 0)} records", None)
+
+        if event == 'attendance_deleted':
+            previous = details.get('previous') or {}
+            return ("📅", "Attendance Deleted", f"Record for {previous.get('date', '')}", employee_id)
+
+        return None
+
+    def record(self, event_type, icon, title, detail='', employee_id=None):
+        """
+        Append one entry to the feed
+
+        Returns:
+            bool: True if the entry was written
+        """
+        try:
+            query = """
+                INSERT INTO activity_log (event_type, icon, title, detail, employee_id, created_at)
+                VALUES (%s, %s, %s, %s, %s, %s)
+            """
+            with self.db.checkout() as (connection, cursor):
+                cursor.execute(query, (event_type, icon, title, (detail or '')[:255], employee_id, datetime.now()))
+                connection.commit()
+            return True
+
+        except Error as e:
+            print(f"[ACTIVITY] Failed to record {event_type}: {e}")
+            return False
+
+    def recent_activity(self, limit=4):
+        """
+        Newest feed entries, read backwards along the primary key
+
+        Args:
+            limit (int): Number of entries
+
+        Returns:
+            list: Dicts with icon, title, subtitle, created_at
+        """
+        try:
+            query = """
+                SELECT a.icon, a.title, a.detail, a.created_at, e.FullName AS employee_name
+                FROM activity_log a
+                LEFT JOIN employees e ON a.employee_id = e.Employee_ID
+                ORDER BY a.id DESC
+                LIMIT %s
+            """
+            with self.db.checkout() as (connection, cursor):
+                cursor.execute(query, (int(limit),))
+                rows = cursor.fetchall()
+
+            activities = []
+            for row in rows:
+                parts = [part for part in (row.get('employee_name'), row.get('detail')) if part]
+                activities.append({
+                    'icon': row['icon'],
+                    'title': row['title'],
+                    'subtitle': " - ".join(parts),
+                    'created_at': row['created_at']
+                })
+            return activities
+
+        except Error as e:
+            print(f"[ACTIVITY] Failed to load recent activity: {e}")
+            return []
+
+
+def format_time_ago(timestamp, now=None):
+    """Short relative time for the dashboard ('Just now', '5m ago', '3h ago', '2d ago')"""
+    if not timestamp:
+        return "Recently"
+    seconds = int(((now or datetime.now()) - timestamp).total_seconds())
+    if seconds < 60:
+        return "Just now"
+    if seconds < 3600:
+        return f"{seconds // 60}m ago"
+    if seconds < 86400:
+        return f"{seconds // 3600}h ago"
+    return f"{seconds // 86400}d ago"
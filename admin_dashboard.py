@@ -1,10 +1,14 @@
 import sys
+from decimal import Decimal
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QFrame, QScrollArea, QSizePolicy, QTableWidgetItem, QMessageBox
 )
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
+from Model.dashboard_stats import get_dashboard_stats_cache
+from Model.activity_log import ActivityLog, format_time_ago
+from Controller.utils.async_query import AsyncQueryRunner
 
 
 class StatCard(QFrame):
@@ -59,22 +63,28 @@ class StatCard(QFrame):
         layout.addSpacing(4)
 
         # Value
-        value_label = QLabel(value)
-        value_label.setStyleSheet(
+        self.value_label = QLabel(value)
+        self.value_label.setStyleSheet(
             "color: #000000; font-size: 26px; font-weight: bold; background: transparent; border: none; padding: 0px; margin: 0px;")
-        value_label.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(value_label)
+        self.value_label.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.value_label)
         layout.addSpacing(4)
 
         # Change indicator
-        change_label = QLabel(change_text)
-        change_label.setStyleSheet(
+        self.change_label = QLabel(change_text)
+        self.change_label.setStyleSheet(
             f"color: {change_color}; font-size: 12px; background: transparent; border: none; padding: 0px; margin: 0px;")
-        change_label.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(change_label)
+        self.change_label.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.change_label)
 
         self.setLayout(layout)
 
+    def set_value(self, value, change_text=None):
+        """Update the displayed value (and optionally the change indicator)"""
+        self.value_label.setText(value)
+        if change_text is not None:
+            self.change_label.setText(change_text)
+
     def get_icon_bg_color(self, icon_text):
         colors = {
             "👥": "#E3F2FD",
@@ -319,6 +329,9 @@ class AdminDashboard(QMainWindow):
         if not self.db.is_connected():
             self.db.connect()
 
+        # Dashboard queries run in the background so the window paints at once
+        self.query_runner = AsyncQueryRunner(self)
+
         # Initialize navigation state early
         self.current_view = "dashboard"
         self.nav_buttons = {}
@@ -374,47 +387,17 @@ class AdminDashboard(QMainWindow):
         main_layout.addWidget(self.scroll)
 
     def get_dashboard_stats(self):
-        """Fetch real stats from database"""
+        """Fetch stats from the cached dashboard counters (runs on a worker thread)"""
         try:
-            # Total active employees
-            total_employees = 0
-            total_payroll = 0.0
-            payroll_records = 0
-
             if self.db:
-                # Count active employees
-                employees = self.db.get_all_employees()
-                for emp in employees:
-                    is_archived = emp.get('is_archived', False) or emp.get('archived', False)
-                    if not is_archived:
-                        full_name = emp.get('FullName') or emp.get('full_name', '')
-                        if full_name and str(full_name) != '0':
-                            total_employees += 1
-
-                # Get payroll stats
-                payroll_records_list = self.db.get_all_payroll()
-                payroll_records = len(payroll_records_list)
-
-                # Calculate total payroll amount
-                for record in payroll_records_list:
-                    try:
-                        net_salary = float(record.get('net_salary', 0))
-                        total_payroll += net_salary
-                    except (ValueError, TypeError):
-                        pass
-
-            return {
-                'total_employees': total_employees,
-                'total_payroll': total_payroll,
-                'payroll_records': payroll_records
-            }
+                return get_dashboard_stats_cache(self.db).get_stats()
         except Exception as e:
             print(f"[DASHBOARD] Error fetching stats: {e}")
-            return {
-                'total_employees': 0,
-                'total_payroll': 0.0,
-                'payroll_records': 0
-            }
+        return {
+            'total_employees': 0,
+            'total_payroll': Decimal('0.00'),
+            'payroll_records': 0
+        }
 
     def create_dashboard_content(self):
         """Create the dashboard content widget"""
@@ -428,9 +411,6 @@ class AdminDashboard(QMainWindow):
         banner = self.create_welcome_banner()
         content_layout.addWidget(banner)
 
-        # Get real stats from database
-        stats = self.get_dashboard_stats()
-
         # Stats cards
         stats_container = QWidget()
         stats_container.setStyleSheet("background: transparent;")
@@ -438,11 +418,14 @@ class AdminDashboard(QMainWindow):
         stats_layout.setContentsMargins(0, 0, 0, 0)
         stats_layout.setSpacing(20)
 
-        # Real data from database
-        stat1 = StatCard("👥", "Total Employees", str(stats['total_employees']),
+        # Real data from database, filled in once the background query returns
+        stat1 = StatCard("👥", "Total Employees", "…",
                          "Active staff members", "#4CAF50")
-        stat2 = StatCard("💵", "Total Payroll", f"₱{stats['total_payroll']:,.2f}",
-                         f"{stats['payroll_records']} processed", "#4CAF50")
+        stat2 = StatCard("💵", "Total Payroll", "…",
+                         "Loading...", "#4CAF50")
+        self.employees_stat_card = stat1
+        self.payroll_stat_card = stat2
+        self.query_runner.submit('stats', self.get_dashboard_stats, on_result=self.show_dashboard_stats)
         stat3 = StatCard("⏱", "Attendance Records", "Track & Manage",
                          "Mark employee attendance", "#FFC107")
         stat4 = StatCard("✅", "Data Synced", "Live",
@@ -482,6 +465,12 @@ class AdminDashboard(QMainWindow):
         content_layout.addStretch()
         return content_widget
 
+    def show_dashboard_stats(self, stats):
+        """Put the loaded statistics into the stat cards"""
+        self.employees_stat_card.set_value(str(stats['total_employees']))
+        self.payroll_stat_card.set_value(f"₱{stats['total_payroll']:,.2f}",
+                                         f"{stats['payroll_records']} processed")
+
     def create_header(self):
         """Create the top navigation header"""
         header = QFrame()
@@ -642,42 +631,68 @@ class AdminDashboard(QMainWindow):
 
         layout.addSpacing(10)
 
-        # Activity items - from database
-        activities = []
+        # Activity items - from database, filled in once the background query returns
+        self.activity_layout = QVBoxLayout()
+        self.activity_layout.setSpacing(5)
+        layout.addLayout(self.activity_layout)
 
-        try:
-            if self.db:
-                # Get recent payroll records
-                payroll_records = self.db.get_all_payroll()
-                for i, record in enumerate(payroll_records[:4]):
-                    employee_name = record.get('employee_name', 'Employee')
-                    month = record.get('month', '')
-                    activities.append(("💰", "Payroll Processed", f"{employee_name} - {month}", "Recently"))
-
-                # If we don't have 4 items, add default activities
-                while len(activities) < 4:
-                    activities.append(("📊", "System Ready", "Waiting for payroll data", "Ready"))
-        except Exception as e:
-            print(f"[DASHBOARD] Error loading activities: {e}")
-            activities = [
-                ("📊", "System Ready", "Connected to database", "Live"),
-                ("🔄", "Real-time Sync", "Data updates automatically", "Active"),
-                ("✅", "All Systems", "Online and operational", "Running"),
-                ("📋", "Dashboard", "View all staff and payroll", "Available")
-            ]
+        loading = QLabel("Loading activity...")
+        loading.setStyleSheet("color: #999999; font-size: 13px; background: transparent; padding: 10px 0px;")
+        self.activity_layout.addWidget(loading)
+
+        self.query_runner.submit(
+            'activity', self.get_recent_activities,
+            on_result=self.show_activities, on_error=self.show_default_activities
+        )
+
+        return frame
+
+    def get_recent_activities(self):
+        """
+        Newest activity feed entries, padded to four (runs on a worker thread)
+
+        Returns:
+            list: (icon, title, subtitle, time_text) tuples
+        """
+        activities = []
+        if self.db:
+            # Newest entries from the activity feed
+            for entry in ActivityLog(self.db).recent_activity(4):
+                activities.append((entry['icon'], entry['title'], entry['subtitle'],
+                                   format_time_ago(entry['created_at'])))
+
+            # If we don't have 4 items, add default activities
+            while len(activities) < 4:
+                activities.append(("📊", "System Ready", "Waiting for payroll data", "Ready"))
+        return activities
+
+    def show_default_activities(self, message=None):
+        """Fallback activity list when the feed cannot be loaded"""
+        print(f"[DASHBOARD] Error loading activities: {message}")
+        self.show_activities([
+            ("📊", "System Ready", "Connected to database", "Live"),
+            ("🔄", "Real-time Sync", "Data updates automatically", "Active"),
+            ("✅", "All Systems", "Online and operational", "Running"),
+            ("📋", "Dashboard", "View all staff and payroll", "Available")
+        ])
+
+    def show_activities(self, activities):
+        """Replace the activity list with the given items"""
+        while self.activity_layout.count():
+            item = self.activity_layout.takeAt(0)
+            if item.widget():
+                item.widget().deleteLater()
 
         for i, (icon, title, subtitle, time) in enumerate(activities):
             activity = ActivityItem(icon, title, subtitle, time)
-            layout.addWidget(activity)
+            self.activity_layout.addWidget(activity)
 
             # Add separator line except for last item
             if i < len(activities) - 1:
                 separator = QFrame()
                 separator.setFrameShape(QFrame.Shape.HLine)
                 separator.setStyleSheet("background: #F0F0F0; max-height: 1px;")
-                layout.addWidget(separator)
-
-        return frame
+                self.activity_layout.addWidget(separator)
 
     def open_add_employee(self):
         """Open the add employee window"""
@@ -0,0 +1,155 @@
+"""
+Background Query Execution - Qt helper (NO WIDGETS)
+
+Runs blocking calls (MySQL queries, bcrypt checks) on a QThreadPool so the
+GUI thread never waits on them. Results and errors come back as Qt signals,
+delivered on the GUI thread, and are handed to the callbacks given to
+submit().
+
+Requests are grouped by a key such as 'attendance' or 'login'. Submitting a
+new request under a key makes any earlier one for that key stale: if it has
+not started it is taken off the queue, otherwise its result is dropped when
+it arrives. That suits reads, where only the newest answer matters. Writes
+are submitted with supersede=False: they are never taken off the queue and
+always report back, however many are outstanding.
+"""
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class _QuerySignals(QObject):
+    """Signals a task emits from the worker thread"""
+
+    succeeded = pyqtSignal(int, object)  # request id, result
+    failed = pyqtSignal(int, str)        # request id, error message
+
+
+class _QueryTask(QRunnable):
+    """One call to run on the thread pool"""
+
+    def __init__(self, request_id, func, args, kwargs):
+        super().__init__()
+        self.request_id = request_id
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = _QuerySignals()
+
+    def run(self):
+        try:
+            result = self.func(*self.args, **self.kwargs)
+        except Exception as e:
+            print(f"[ASYNC] Request {self.request_id} failed: {e}")
+            self.signals.failed.emit(self.request_id, str(e))
+        else:
+            self.signals.succeeded.emit(self.request_id, result)
+
+
+class AsyncQueryRunner(QObject):
+    """Submits calls to a thread pool and routes their results back to the GUI thread"""
+
+    loading_changed = pyqtSignal(bool)  # True while any request is outstanding
+
+    def __init__(self, parent=None, thread_pool=None):
+        """
+        Initialize runner
+
+        Args:
+            parent (QObject): Qt parent; pending results are dropped when it is destroyed
+            thread_pool (QThreadPool): Pool to run on (defaults to the global pool)
+        """
+        super().__init__(parent)
+        self._pool = thread_pool or QThreadPool.globalInstance()
+        self._next_id = 0
+        self._latest = {}   # key -> newest request id
+        self._pending = {}  # request id -> (key, task, on_result, on_error)
+
+    def submit(self, key, func, *args, on_result=None, on_error=None, supersede=True, **kwargs):
+        """
+        Run func(*args, **kwargs) in the background
+
+        Args:
+            key (str): Request group; a newer request with the same key supersedes this one
+            func (callable): Blocking call to run
+            on_result (callable): Called on the GUI thread with the return value
+            on_error (callable): Called on the GUI thread with the error message
+            supersede (bool): False for writes: the request is never cancelled or
+                              superseded, and its result is always delivered
+
+        Returns:
+            int: Request id
+        """
+        if supersede:
+            self.cancel(key)
+
+        self._next_id += 1
+        request_id = self._next_id
+        task = _QueryTask(request_id, func, args, kwargs)
+        task.signals.succeeded.connect(self._on_succeeded)
+        task.signals.failed.connect(self._on_failed)
+
+        was_idle = not self._pending
+        if supersede:
+            self._latest[key] = request_id
+        else:
+            key = None  # Not part of any group, so nothing can make it stale
+        self._pending[request_id] = (key, task, on_result, on_error)
+        self._pool.start(task)
+
+        if was_idle:
+            self.loading_changed.emit(True)
+        return request_id
+
+    def cancel(self, key=None):
+        """
+        Make outstanding requests stale (writes submitted with supersede=False are left alone)
+
+        Args:
+            key (str): Request group to cancel, None for every group
+        """
+        keys = list(self._latest) if key is None else [key]
+        for stale_key in keys:
+            request_id = self._latest.pop(stale_key, None)
+            if request_id is None:
+                continue
+            entry = self._pending.get(request_id)
+            if entry and self._pool.tryTake(entry[1]):
+                # Never started, so no signal will arrive for it
+                self._finish(request_id)
+
+    def is_loading(self, key=None):
+        """Check if a request (for key, or any request including writes) is outstanding"""
+        if key is None:
+            return bool(self._pending)
+        return key in self._latest
+
+    def _finish(self, request_id):
+        """Forget a request; returns its entry or None"""
+        entry = self._pending.pop(request_id, None)
+        if entry is not None and not self._pending:
+            self.loading_changed.emit(False)
+        return entry
+
+    def _current(self, request_id):
+        """Entry for a finished request, or None when it was superseded or cancelled"""
+        entry = self._finish(request_id)
+        if entry is None:
+            return None
+        key = entry[0]
+        if key is None:
+            return entry  # Write: always delivered
+        if self._latest.get(key) != request_id:
+            print(f"[ASYNC] Dropped stale result for '{key}' (request {request_id})")
+            return None
+        del self._latest[key]
+        return entry
+
+    def _on_succeeded(self, request_id, result):
+        entry = self._current(request_id)
+        if entry and entry[2]:
+            entry[2](result)
+
+    def _on_failed(self, request_id, message):
+        entry = self._current(request_id)
+        if entry and entry[3]:
+            entry[3](message)
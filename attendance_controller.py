@@ -1,13 +1,23 @@
 import sys
+from bisect import bisect_left
 from datetime import datetime, date
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QPushButton, QFrame, QTableWidget, QTableWidgetItem,
+    QLabel, QPushButton, QFrame, QTableView, QStyledItemDelegate, QToolTip,
     QLineEdit, QComboBox, QMessageBox, QHeaderView, QDialog,
     QScrollArea, QDateEdit, QTimeEdit, QGridLayout
 )
-from PyQt6.QtCore import Qt, QDate, QTime
-from PyQt6.QtGui import QFont, QColor
+from PyQt6.QtCore import (
+    Qt, QDate, QTime, QTimer, QEvent, QRect,
+    QAbstractTableModel, QAbstractProxyModel, QModelIndex, pyqtSignal
+)
+from PyQt6.QtGui import QFont, QColor, QPainter
+from Controller.utils.async_query import AsyncQueryRunner
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; attendance filtering falls back to plain lists
+    np = None
 
 
 class AddAttendanceDialog(QDialog):
@@ -263,6 +273,290 @@ class AddAttendanceDialog(QDialog):
         }
 
 
+class AttendanceStore:
+    """
+    Attendance records held column by column.
+
+    Display strings are built once when records are loaded. Filtering never
+    touches Qt: match() compares small integer codes (one per distinct
+    employee name and per status), with NumPy when it is installed. A
+    keystroke costs one scan over the distinct names plus one vectorised
+    pass over the rows.
+    """
+
+    def __init__(self, records=()):
+        self.load(records)
+
+    def load(self, records):
+        """Replace the contents with a list of attendance records"""
+        self.records = list(records)
+        self.names = []
+        self.positions = []
+        self.dates = []
+        self.clock_ins = []
+        self.clock_outs = []
+        self.statuses = []
+
+        self._name_keys = []   # Distinct lower-cased names; name_codes index into this
+        self._status_keys = []  # Distinct statuses; status_codes index into this
+        name_lookup = {}
+        status_lookup = {}
+        name_codes = []
+        status_codes = []
+
+        for record in self.records:
+            name = str(record.get('employee_name', 'Unknown') or 'Unknown')
+            status = record.get('status', 'Present') or ''
+
+            self.names.append(name)
+            self.positions.append(str(record.get('position', '') or ''))
+            self.dates.append(str(record.get('date', '')))
+            self.clock_ins.append(str(record.get('clock_in', '') or '-'))
+            self.clock_outs.append(str(record.get('clock_out', '') or '-'))
+            self.statuses.append(status)
+
+            key = name.lower()
+            if key not in name_lookup:
+                name_lookup[key] = len(self._name_keys)
+                self._name_keys.append(key)
+            name_codes.append(name_lookup[key])
+
+            if status not in status_lookup:
+                status_lookup[status] = len(self._status_keys)
+                self._status_keys.append(status)
+            status_codes.append(status_lookup[status])
+
+        if np is not None:
+            self.name_codes = np.array(name_codes, dtype=np.int32)
+            self.status_codes = np.array(status_codes, dtype=np.int16)
+        else:
+            self.name_codes = name_codes
+            self.status_codes = status_codes
+
+    def __len__(self):
+        return len(self.records)
+
+    def match(self, search='', status=None):
+        """
+        Rows matching a name search and a status
+
+        Args:
+            search (str): Text to look for in the employee name (case-insensitive)
+            status (str): Status to keep, None or "All Status" for every status
+
+        Returns:
+            list: Matching row numbers in ascending order
+        """
+        search = (search or '').strip().lower()
+        if status == "All Status":
+            status = None
+
+        if not search and status is None:
+            return list(range(len(self.records)))
+
+        names = None
+        if search:
+            names = [code for code, key in enumerate(self._name_keys) if search in key]
+        status_code = None
+        if status is not None:
+            if status not in self._status_keys:
+                return []
+            status_code = self._status_keys.index(status)
+
+        if np is not None:
+            mask = np.ones(len(self.records), dtype=bool)
+            if names is not None:
+                mask &= np.isin(self.name_codes, names)
+            if status_code is not None:
+                mask &= self.status_codes == status_code
+            return np.flatnonzero(mask).tolist()
+
+        names = set(names) if names is not None else None
+        return [
+            row for row in range(len(self.records))
+            if (names is None or self.name_codes[row] in names)
+            and (status_code is None or self.status_codes[row] == status_code)
+        ]
+
+
+class AttendanceTableModel(QAbstractTableModel):
+    """Read-only table over an AttendanceStore; Qt asks only for visible rows"""
+
+    HEADERS = ["Name", "Position", "Date", "Clock In", "Clock Out", "Status", "Actions"]
+    STATUS_COLUMN = 5
+    ACTIONS_COLUMN = 6
+
+    STATUS_COLORS = {
+        'Present': QColor('#059669'),
+        'Absent': QColor('#DC2626'),
+        'Late': QColor('#F59E0B'),
+    }
+    DEFAULT_STATUS_COLOR = QColor('#3B82F6')
+
+    def __init__(self, store=None, parent=None):
+        super().__init__(parent)
+        self.store = store or AttendanceStore()
+        self._name_font = QFont("Arial", 12)
+        self._status_font = QFont("Arial", 12, QFont.Weight.Bold)
+
+    def set_records(self, records):
+        """Load new records into the store"""
+        self.beginResetModel()
+        self.store.load(records)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.store)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        store = self.store
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return store.names[row]
+            if column == 1:
+                return store.positions[row]
+            if column == 2:
+                return store.dates[row]
+            if column == 3:
+                return store.clock_ins[row]
+            if column == 4:
+                return store.clock_outs[row]
+            if column == self.STATUS_COLUMN:
+                return store.statuses[row]
+            return None
+        if role == Qt.ItemDataRole.FontRole:
+            if column == 0:
+                return self._name_font
+            if column == self.STATUS_COLUMN:
+                return self._status_font
+        if role == Qt.ItemDataRole.ForegroundRole and column == self.STATUS_COLUMN:
+            return self.STATUS_COLORS.get(store.statuses[row], self.DEFAULT_STATUS_COLOR)
+        return None
+
+
+class AttendanceFilterProxyModel(QAbstractProxyModel):
+    """
+    Shows the rows of an AttendanceTableModel that match the search text and
+    status. The matching row numbers come from AttendanceStore.match(), so a
+    filter change costs no per-row Python calls through Qt.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._search = ''
+        self._status = None
+
+    def setSourceModel(self, source_model):
+        self.beginResetModel()
+        super().setSourceModel(source_model)
+        source_model.modelReset.connect(self.refilter)
+        self._rows = source_model.store.match(self._search, self._status)
+        self.endResetModel()
+
+    def set_filters(self, search=None, status=None):
+        """Change the search text and/or status and refilter"""
+        if search is not None:
+            self._search = search
+        if status is not None:
+            self._status = status
+        self.refilter()
+
+    def refilter(self):
+        """Recompute the visible rows from the source store"""
+        self.beginResetModel()
+        self._rows = self.sourceModel().store.match(self._search, self._status)
+        self.endResetModel()
+
+    def record(self, row):
+        """Attendance record behind a visible row"""
+        return self.sourceModel().store.records[self._rows[row]]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.sourceModel().columnCount()
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not (0 <= row < len(self._rows)):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=QModelIndex()):
+        return QModelIndex()
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid():
+            return QModelIndex()
+        return self.sourceModel().index(self._rows[proxy_index.row()], proxy_index.column())
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        position = bisect_left(self._rows, source_index.row())
+        if position < len(self._rows) and self._rows[position] == source_index.row():
+            return self.index(position, source_index.column())
+        return QModelIndex()
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        return self.sourceModel().headerData(section, orientation, role)
+
+
+class DeleteButtonDelegate(QStyledItemDelegate):
+    """Paints the red delete button in the actions column and reports clicks"""
+
+    delete_clicked = pyqtSignal(int)  # Visible row
+
+    BUTTON_SIZE = 32
+
+    def _button_rect(self, rect):
+        return QRect(
+            rect.x() + (rect.width() - self.BUTTON_SIZE) // 2,
+            rect.y() + (rect.height() - self.BUTTON_SIZE) // 2,
+            self.BUTTON_SIZE, self.BUTTON_SIZE
+        )
+
+    def paint(self, painter, option, index):
+        button_rect = self._button_rect(option.rect)
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor('#EF4444'))
+        painter.drawRoundedRect(button_rect, 5, 5)
+        painter.setPen(QColor('white'))
+        painter.drawText(button_rect, Qt.AlignmentFlag.AlignCenter, "🗑")
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.Type.MouseButtonRelease and \
+                self._button_rect(option.rect).contains(event.position().toPoint()):
+            self.delete_clicked.emit(index.row())
+            return True
+        return False
+
+    def helpEvent(self, event, view, option, index):
+        if event.type() == QEvent.Type.ToolTip and self._button_rect(option.rect).contains(event.pos()):
+            QToolTip.showText(event.globalPos(), "Delete Record", view)
+            return True
+        return super().helpEvent(event, view, option, index)
+
+
 class AttendanceManagementWindow(QMainWindow):
     """Attendance Management - can show all employees or specific employee"""
 
@@ -274,14 +568,16 @@ class AttendanceManagementWindow(QMainWindow):
         self.setWindowTitle("PayEase - Attendance Management")
         self.setMinimumSize(1400, 800)
 
-        # Ensure attendance table exists
-        if self.db:
-            self.ensure_attendance_table()
+        # Attendance table itself is created by the schema migrations on connect
+        if self.db and not self.db.is_connected():
+            self.db.connect()
+
+        # Database calls run in the background; results arrive through the runner
+        self.query_runner = AsyncQueryRunner(self)
 
         # Load data
-        self.employees = self.get_employees()
+        self.employees = []
         self.attendance_records = []
-        self.filtered_records = []
 
         self.setStyleSheet("""
             QMainWindow {
@@ -290,113 +586,49 @@ class AttendanceManagementWindow(QMainWindow):
         """)
 
         self.init_ui()
+        self.load_employees()
         self.load_attendance()
 
-    def ensure_attendance_table(self):
-        """Ensure attendance table exists"""
-        try:
-            if not self.db.is_connected():
-                self.db.connect()
-
-            create_table_query = """
-                                 CREATE TABLE IF NOT EXISTS attendance \
-                                 ( \
-                                     id \
-                                     INT \
-                                     AUTO_INCREMENT \
-                                     PRIMARY \
-                                     KEY, \
-                                     employee_id \
-                                     VARCHAR \
-                                 ( \
-                                     50 \
-                                 ) NOT NULL,
-                                     date DATE NOT NULL,
-                                     clock_in TIME,
-                                     clock_out TIME,
-                                     status VARCHAR \
-                                 ( \
-                                     20 \
-                                 ) DEFAULT 'Present',
-                                     notes TEXT,
-                                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                                     INDEX idx_employee_id \
-                                 ( \
-                                     employee_id \
-                                 ),
-                                     INDEX idx_date \
-                                 ( \
-                                     date \
-                                 ),
-                                     UNIQUE KEY unique_attendance \
-                                 ( \
-                                     employee_id, \
-                                     date \
-                                 )
-                                     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 \
-                                 """
-            self.db.cursor.execute(create_table_query)
-            self.db.connection.commit()
-            print("[ATTENDANCE] Table checked/created successfully")
-        except Exception as e:
-            print(f"[ATTENDANCE] Error creating table: {e}")
-
-    def get_employees(self):
-        """Get active employees from database"""
+    def load_employees(self):
+        """Load active employees for the add-attendance dialog"""
         if self.db:
-            try:
-                employees = self.db.get_all_employees()
-                active_employees = []
-                for emp in employees:
-                    is_archived = emp.get('is_archived', False) or emp.get('archived', False)
-                    if not is_archived:
-                        full_name = emp.get('FullName') or emp.get('full_name', '')
-                        if full_name and str(full_name) != '0':
-                            active_employees.append(emp)
-                return active_employees
-            except Exception as e:
-                print(f"[ATTENDANCE] Error getting employees: {e}")
-        return []
+            self.query_runner.submit(
+                'employees', self.db.get_active_employees,
+                on_result=self.set_employees,
+                on_error=lambda message: print(f"[ATTENDANCE] Error getting employees: {message}")
+            )
+
+    def set_employees(self, employees):
+        """Store the loaded employee list"""
+        self.employees = employees
 
     def load_attendance(self):
         """Load attendance records from database"""
-        if self.db:
-            try:
-                # If specific employee, filter by that employee
-                if self.selected_employee:
-                    emp_id = self.selected_employee.get('Employee_ID') or self.selected_employee.get('id')
-                    query = """
-                            SELECT a.*, \
-                                   e.FullName as employee_name, \
-                                   e.Position as position,
-                            e.Department as department
-                            FROM attendance a
-                                LEFT JOIN employees e \
-                            ON a.employee_id = e.Employee_ID
-                            WHERE a.employee_id = %s
-                            ORDER BY a.date DESC, a.clock_in DESC \
-                            """
-                    self.db.cursor.execute(query, (emp_id,))
-                else:
-                    # Show all employees
-                    query = """
-                            SELECT a.*, \
-                                   e.FullName as employee_name, \
-                                   e.Position as position,
-                            e.Department as department
-                            FROM attendance a
-                                LEFT JOIN employees e \
-                            ON a.employee_id = e.Employee_ID
-                            ORDER BY a.date DESC, a.clock_in DESC \
-                            """
-                    self.db.cursor.execute(query)
-
-                self.attendance_records = self.db.cursor.fetchall()
-                self.filtered_records = self.attendance_records
-                self.display_attendance(self.filtered_records)
-            except Exception as e:
-                print(f"[ATTENDANCE] Error loading attendance: {e}")
-                self.display_attendance([])
+        if not self.db:
+            self.display_attendance(self.attendance_records)
+            return
+
+        # If specific employee, filter by that employee
+        emp_id = None
+        if self.selected_employee:
+            emp_id = self.selected_employee.get('Employee_ID') or self.selected_employee.get('id')
+
+        self.count_label.setText("Loading attendance records...")
+        self.query_runner.submit(
+            'attendance', self.db.get_attendance_records, emp_id,
+            on_result=self.on_attendance_loaded, on_error=self.on_attendance_error
+        )
+
+    def on_attendance_loaded(self, records):
+        """Show records returned by the background query"""
+        self.attendance_records = records
+        self.display_attendance(records)
+
+    def on_attendance_error(self, message):
+        """Report a failed background load"""
+        print(f"[ATTENDANCE] Error loading attendance: {message}")
+        self.display_attendance([])
+        self.count_label.setText("Could not load attendance records")
 
     def init_ui(self):
         main_widget = QWidget()
@@ -438,8 +670,8 @@ class AttendanceManagementWindow(QMainWindow):
         title_container.addWidget(title_label)
         title_container.addStretch()
 
-        add_btn = QPushButton("➕ Add Attendance")
-        add_btn.setStyleSheet("""
+        self.add_btn = QPushButton("➕ Add Attendance")
+        self.add_btn.setStyleSheet("""
             QPushButton {
                 background: #0047FF;
                 color: white;
@@ -453,10 +685,10 @@ class AttendanceManagementWindow(QMainWindow):
                 background: #0039CC;
             }
         """)
-        add_btn.clicked.connect(self.add_attendance)
+        self.add_btn.clicked.connect(self.add_attendance)
 
         title_row.addLayout(title_container)
-        title_row.addWidget(add_btn)
+        title_row.addWidget(self.add_btn)
         content_layout.addLayout(title_row)
 
         # Filters section (only show if not specific employee)
@@ -510,6 +742,12 @@ class AttendanceManagementWindow(QMainWindow):
         """)
         self.search_input.textChanged.connect(self.search_attendance)
 
+        # Filter once typing pauses instead of on every keystroke
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
+        self.search_timer.timeout.connect(self.apply_search)
+
         self.status_filter = QComboBox()
         self.status_filter.addItems(["All Status", "Present", "Absent", "Late", "Half Day", "Leave"])
         self.status_filter.setStyleSheet("""
@@ -574,27 +812,34 @@ class AttendanceManagementWindow(QMainWindow):
         table_header_layout.addLayout(attendance_title_layout)
         table_layout.addWidget(table_header_widget)
 
-        # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(7)
-        self.table.setHorizontalHeaderLabels([
-            "Name", "Position", "Date", "Clock In", "Clock Out", "Status", "Actions"
-        ])
+        # Table: records live in a columnar store, filters run in the proxy
+        self.table_model = AttendanceTableModel(parent=self)
+        self.proxy_model = AttendanceFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.table_model)
+
+        self.table = QTableView()
+        self.table.setModel(self.proxy_model)
+
+        self.delete_delegate = DeleteButtonDelegate(self.table)
+        self.delete_delegate.delete_clicked.connect(
+            lambda row: self.delete_attendance(self.proxy_model.record(row))
+        )
+        self.table.setItemDelegateForColumn(AttendanceTableModel.ACTIONS_COLUMN, self.delete_delegate)
 
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 border: none;
                 background: white;
                 gridline-color: #E5E7EB;
                 font-size: 13px;
                 color: #1F2937;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 15px 10px;
                 border-bottom: 1px solid #E5E7EB;
                 color: #1F2937;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background: #E3F2FD;
                 color: #1F2937;
             }
@@ -646,100 +891,40 @@ class AttendanceManagementWindow(QMainWindow):
         header.setSectionResizeMode(6, QHeaderView.ResizeMode.Fixed)
 
         self.table.verticalHeader().setVisible(False)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         self.table.setShowGrid(True)
         self.table.verticalHeader().setDefaultSectionSize(55)
+        # Fixed row heights let the view skip measuring rows it does not show
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+
+        # Empty state
+        self.empty_label = QLabel("No attendance records found")
+        self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.empty_label.setStyleSheet("""
+            color: #6B7280;
+            font-size: 13px;
+            font-style: italic;
+            background: transparent;
+            padding: 20px;
+        """)
+        self.empty_label.hide()
 
         table_layout.addWidget(self.table)
+        table_layout.addWidget(self.empty_label)
         return table_frame
 
     def display_attendance(self, records):
         """Display attendance records in table"""
-        self.table.setRowCount(0)
-
-        for record in records:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-
-            # Get data
-            employee_name = record.get('employee_name', 'Unknown') or 'Unknown'
-            position = record.get('position', '') or ''
-            date_val = record.get('date', '')
-            clock_in = record.get('clock_in', '') or '-'
-            clock_out = record.get('clock_out', '') or '-'
-            status = record.get('status', 'Present')
-
-            # Name
-            name_item = QTableWidgetItem(str(employee_name))
-            name_item.setFont(QFont("Arial", 12))
-            self.table.setItem(row, 0, name_item)
-
-            # Position
-            self.table.setItem(row, 1, QTableWidgetItem(str(position)))
-
-            # Date
-            self.table.setItem(row, 2, QTableWidgetItem(str(date_val)))
-
-            # Clock in
-            self.table.setItem(row, 3, QTableWidgetItem(str(clock_in)))
-
-            # Clock out
-            self.table.setItem(row, 4, QTableWidgetItem(str(clock_out)))
-
-            # Status - colored text
-            status_item = QTableWidgetItem(status)
-            if status == 'Present':
-                status_item.setForeground(QColor('#059669'))
-            elif status == 'Absent':
-                status_item.setForeground(QColor('#DC2626'))
-            elif status == 'Late':
-                status_item.setForeground(QColor('#F59E0B'))
-            else:
-                status_item.setForeground(QColor('#3B82F6'))
-            status_item.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-            self.table.setItem(row, 5, status_item)
-
-            # Actions
-            action_widget = QWidget()
-            action_layout = QHBoxLayout(action_widget)
-            action_layout.setContentsMargins(5, 5, 5, 5)
-            action_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-            delete_btn = QPushButton("🗑")
-            delete_btn.setFixedSize(32, 32)
-            delete_btn.setStyleSheet("""
-                QPushButton {
-                    background: #EF4444;
-                    color: white;
-                    border: none;
-                    border-radius: 5px;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background: #DC2626;
-                }
-            """)
-            delete_btn.setToolTip("Delete Record")
-            delete_btn.clicked.connect(lambda checked, r=record: self.delete_attendance(r))
-
-            action_layout.addWidget(delete_btn)
-            self.table.setCellWidget(row, 6, action_widget)
-
-        # Update count
-        self.count_label.setText(f"Showing {len(records)} of {len(self.attendance_records)} records")
+        self.table_model.set_records(records)
+        self.update_count()
 
-        # Empty state
-        if len(records) == 0:
-            self.table.setRowCount(1)
-            no_data_item = QTableWidgetItem("No attendance records found")
-            no_data_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            no_data_item.setForeground(QColor("#6B7280"))
-            font = QFont("Arial", 13)
-            font.setItalic(True)
-            no_data_item.setFont(font)
-            self.table.setSpan(0, 0, 1, 7)
-            self.table.setItem(0, 0, no_data_item)
+    def update_count(self):
+        """Refresh the record count and the empty state after loading or filtering"""
+        shown = self.proxy_model.rowCount()
+        self.count_label.setText(f"Showing {shown} of {len(self.table_model.store)} records")
+        self.table.setVisible(shown > 0)
+        self.empty_label.setVisible(shown == 0)
 
     def add_attendance(self):
         """Open dialog to add attendance"""
@@ -753,36 +938,25 @@ class AttendanceManagementWindow(QMainWindow):
 
             # Save to database
             if self.db:
-                try:
-                    query = """
-                            INSERT INTO attendance (employee_id, date, clock_in, clock_out, status)
-                            VALUES (%s, %s, %s, %s, %s) ON DUPLICATE KEY \
-                            UPDATE \
-                                clock_in = \
-                            VALUES (clock_in), clock_out = \
-                            VALUES (clock_out), status = \
-                            VALUES (status) \
-                            """
-                    self.db.cursor.execute(query, (
-                        data['employee_id'],
-                        data['date'],
-                        data['clock_in'],
-                        data['clock_out'],
-                        data['status']
-                    ))
-                    self.db.connection.commit()
-
-                    QMessageBox.information(
-                        self,
-                        "Success",
-                        "Attendance record added successfully!"
-                    )
-
-                    # Reload data
-                    self.load_attendance()
-
-                except Exception as e:
-                    QMessageBox.critical(self, "Error", f"Failed to add attendance:\n{str(e)}")
+                self.add_btn.setEnabled(False)
+                self.query_runner.submit(
+                    'save', self.db.add_attendance, data,
+                    on_result=lambda result: self.on_attendance_saved(result, "Failed to add attendance"),
+                    on_error=lambda message: self.on_attendance_saved((False, message), "Failed to add attendance"),
+                    supersede=False
+                )
+
+    def on_attendance_saved(self, result, failure_title):
+        """Report the outcome of a background add or delete and reload"""
+        self.add_btn.setEnabled(True)
+        success, message = result
+        if success:
+            QMessageBox.information(self, "Success", message)
+
+            # Reload data
+            self.load_attendance()
+        else:
+            QMessageBox.critical(self, "Error", f"{failure_title}:\n{message}")
 
     def delete_attendance(self, record):
         """Delete attendance record"""
@@ -799,39 +973,26 @@ class AttendanceManagementWindow(QMainWindow):
 
         if reply == QMessageBox.StandardButton.Yes:
             if self.db and 'id' in record:
-                try:
-                    query = "DELETE FROM attendance WHERE id = %s"
-                    self.db.cursor.execute(query, (record['id'],))
-                    self.db.connection.commit()
-
-                    QMessageBox.information(self, "Success", "Attendance record deleted successfully!")
-                    self.load_attendance()
-
-                except Exception as e:
-                    QMessageBox.critical(self, "Error", f"Failed to delete record:\n{str(e)}")
+                self.query_runner.submit(
+                    'delete', self.db.delete_attendance, record['id'],
+                    on_result=lambda result: self.on_attendance_saved(result, "Failed to delete record"),
+                    on_error=lambda message: self.on_attendance_saved((False, message), "Failed to delete record"),
+                    supersede=False
+                )
 
     def search_attendance(self, search_term):
-        """Search attendance records"""
-        if search_term.strip():
-            search_lower = search_term.lower()
-            filtered = [
-                r for r in self.attendance_records
-                if search_lower in str(r.get('employee_name', '')).lower()
-            ]
-            self.display_attendance(filtered)
-        else:
-            self.filter_by_status(self.status_filter.currentText() if hasattr(self, 'status_filter') else "All Status")
+        """Search attendance records (applied when typing pauses)"""
+        self.search_timer.start()
+
+    def apply_search(self):
+        """Filter by the current search text"""
+        self.proxy_model.set_filters(search=self.search_input.text())
+        self.update_count()
 
     def filter_by_status(self, status):
         """Filter by status"""
-        if status == "All Status":
-            self.filtered_records = self.attendance_records
-        else:
-            self.filtered_records = [
-                r for r in self.attendance_records
-                if r.get('status', '') == status
-            ]
-        self.display_attendance(self.filtered_records)
+        self.proxy_model.set_filters(status=status)
+        self.update_count()
 
     @staticmethod
     def get_attendance_count(db, employee_id, month=None, year=None):
@@ -839,34 +1000,15 @@ class AttendanceManagementWindow(QMainWindow):
         Get attendance count for an employee (for payroll integration)
         Returns number of present/working days
         """
-        try:
-            if month and year:
-                query = """
-                        SELECT COUNT(*) as days
-                        FROM attendance
-                        WHERE employee_id = %s
-                            AND MONTH ( \
-                            date) = %s
-                          AND YEAR (date) = %s
-                          AND status IN ('Present' \
-                            , 'Late' \
-                            , 'Half Day') \
-                        """
-                db.cursor.execute(query, (employee_id, month, year))
-            else:
-                query = """
-                        SELECT COUNT(*) as days
-                        FROM attendance
-                        WHERE employee_id = %s
-                          AND status IN ('Present', 'Late', 'Half Day') \
-                        """
-                db.cursor.execute(query, (employee_id,))
-
-            result = db.cursor.fetchone()
-            return result['days'] if result else 0
-        except Exception as e:
-            print(f"[ATTENDANCE] Error getting attendance count: {e}")
-            return 0
+        return db.get_attendance_count(employee_id, month, year)
+
+    @staticmethod
+    def get_attendance_breakdown(db, month, year):
+        """
+        Get present/late/half-day counts for every employee in a month (for payroll runs)
+        Returns {employee_id: {'present', 'late', 'half_day', 'days'}} from a single query
+        """
+        return db.get_attendance_breakdown(month, year)
 
 
 def main():
@@ -0,0 +1,231 @@
+"""
+Attendance Import Module for PayEase
+Streams time-clock exports (CSV/TSV) into the attendance table in batches
+
+Rows flow through generators (read -> validate -> batch), so memory stays
+bounded by the batch size no matter how large the export is. Each batch is
+upserted with one executemany() in its own transaction.
+
+Usage:
+    python -m Model.attendance_import export.csv [--batch-size 5000]
+"""
+
+import argparse
+import csv
+import sys
+import time
+from datetime import datetime
+
+from Model.database import get_db_connection
+
+
+DEFAULT_BATCH_SIZE = 5000
+MAX_REJECT_SAMPLES = 100  # Rejected rows kept for the report; the rest are only counted
+
+VALID_STATUSES = {'Present', 'Absent', 'Late', 'Half Day', 'Leave'}
+DATE_FORMATS = ('%Y-%m-%d', '%m/%d/%Y', '%d-%m-%Y')
+TIME_FORMATS = ('%H:%M:%S', '%H:%M', '%I:%M %p', '%I:%M:%S %p')
+
+# Accepted header names for each field (lower-case)
+COLUMN_ALIASES = {
+    'employee_id': ('employee_id', 'employee id', 'emp_id', 'id'),
+    'date': ('date', 'work_date', 'day'),
+    'clock_in': ('clock_in', 'clock in', 'time_in', 'in'),
+    'clock_out': ('clock_out', 'clock out', 'time_out', 'out'),
+    'status': ('status',),
+}
+
+
+def read_rows(source, delimiter=None):
+    """
+    Yield (line_number, row dict) from a CSV or TSV export
+
+    Args:
+        source (str or file): Path or open text file
+        delimiter (str): Field delimiter; guessed from the file when None
+
+    Yields:
+        tuple: (line_number, {field: value}) with fields mapped through COLUMN_ALIASES
+    """
+    handle = open(source, newline='', encoding='utf-8-sig') if isinstance(source, str) else source
+    try:
+        if delimiter is None:
+            if isinstance(source, str) and source.lower().endswith(('.tsv', '.tab')):
+                delimiter = '\t'
+            else:
+                sample = handle.readline()
+                delimiter = '\t' if sample.count('\t') > sample.count(',') else ','
+                handle.seek(0)
+
+        reader = csv.reader(handle, delimiter=delimiter)
+        header = [name.strip().lower() for name in next(reader, [])]
+        positions = {}
+        for field, aliases in COLUMN_ALIASES.items():
+            for alias in aliases:
+                if alias in header:
+                    positions[field] = header.index(alias)
+                    break
+
+        missing = {'employee_id', 'date'} - set(positions)
+        if missing:
+            raise ValueError(f"Missing required column(s): {', '.join(sorted(missing))}")
+
+        for line_number, values in enumerate(reader, start=2):
+            if not any(value.strip() for value in values):
+                continue
+            yield line_number, {
+                field: values[index].strip() if index < len(values) else ''
+                for field, index in positions.items()
+            }
+    finally:
+        if handle is not source:
+            handle.close()
+
+
+def _parse(value, formats, kind):
+    """Parse a date or time string with the first matching format"""
+    for fmt in formats:
+        try:
+            parsed = datetime.strptime(value, fmt)
+            return parsed.date() if kind == 'date' else parsed.time()
+        except ValueError:
+            continue
+    raise ValueError(f"Invalid {kind}: {value!r}")
+
+
+def validate_rows(rows, known_ids, report):
+    """
+    Yield attendance tuples for valid rows; record the rest in report
+
+    Args:
+        rows (iterable): (line_number, row dict) from read_rows()
+        known_ids (set): Employee IDs that exist
+        report (dict): Import report; 'rejected' and 'rejected_samples' are updated
+
+    Yields:
+        tuple: (employee_id, date, clock_in, clock_out, status)
+    """
+    for line_number, row in rows:
+        report['read'] += 1
+        try:
+            employee_id = row.get('employee_id', '')
+            if employee_id not in known_ids:
+                raise ValueError(f"Unknown employee ID: {employee_id!r}")
+
+            work_date = _parse(row.get('date', ''), DATE_FORMATS, 'date')
+            clock_in = _parse(row['clock_in'], TIME_FORMATS, 'time') if row.get('clock_in') else None
+            clock_out = _parse(row['clock_out'], TIME_FORMATS, 'time') if row.get('clock_out') else None
+
+            status = row.get('status') or 'Present'
+            if status not in VALID_STATUSES:
+                raise ValueError(f"Invalid status: {status!r}")
+
+            yield (employee_id, work_date, clock_in, clock_out, status)
+
+        except ValueError as e:
+            report['rejected'] += 1
+            if len(report['rejected_samples']) < MAX_REJECT_SAMPLES:
+                report['rejected_samples'].append({'line': line_number, 'error': str(e), 'row': row})
+
+
+def batched(items, size):
+    """Yield lists of up to size items"""
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class AttendanceImporter:
+    """Imports time-clock exports into the attendance table"""
+
+    def __init__(self, db=None):
+        """
+        Initialize importer
+
+        Args:
+            db (DatabaseConnection): Database to import into
+        """
+        self.db = db or get_db_connection()
+
+    def import_file(self, source, batch_size=DEFAULT_BATCH_SIZE, delimiter=None, progress_callback=None):
+        """
+        Stream an export into the attendance table
+
+        Batches that were committed stay committed if a later batch fails.
+
+        Args:
+            source (str or file): Path or open text file (CSV or TSV)
+            batch_size (int): Rows per executemany() and transaction
+            delimiter (str): Field delimiter; guessed when None
+            progress_callback (callable): Called as (imported, rejected, rows_per_second) after each batch
+
+        Returns:
+            dict: success, message, read, imported, rejected, rejected_samples,
+                  elapsed_seconds, rows_per_second
+        """
+        report = {
+            'success': True, 'message': '', 'read': 0, 'imported': 0, 'rejected': 0,
+            'rejected_samples': [], 'elapsed_seconds': 0.0, 'rows_per_second': 0.0
+        }
+        start = time.perf_counter()
+
+        try:
+            known_ids = self.db.get_employee_ids()
+            rows = validate_rows(read_rows(source, delimiter), known_ids, report)
+
+            for batch in batched(rows, batch_size):
+                success, count, message = self.db.upsert_attendance_batch(batch)
+                if not success:
+                    report['success'] = False
+                    report['message'] = f"Stopped after {report['imported']} records: {message}"
+                    break
+
+                report['imported'] += count
+                elapsed = time.perf_counter() - start
+                rate = report['imported'] / elapsed if elapsed > 0 else 0.0
+                print(f"[IMPORT] {report['imported']} records imported ({rate:,.0f} rows/s), "
+                      f"{report['rejected']} rejected")
+                if progress_callback:
+                    progress_callback(report['imported'], report['rejected'], rate)
+
+        except (OSError, ValueError, csv.Error) as e:
+            report['success'] = False
+            report['message'] = f"Could not read export: {e}"
+
+        report['elapsed_seconds'] = time.perf_counter() - start
+        if report['elapsed_seconds'] > 0:
+            report['rows_per_second'] = report['read'] / report['elapsed_seconds']
+        if report['success']:
+            report['message'] = (f"Imported {report['imported']} of {report['read']} rows "
+                                 f"({report['rejected']} rejected)")
+        print(f"[IMPORT] {report['message']} in {report['elapsed_seconds']:.1f}s")
+        return report
+
+
+def main(argv=None):
+    """Command line entry point; returns the process exit code"""
+    parser = argparse.ArgumentParser(description="Import a time-clock export into attendance")
+    parser.add_argument('path', help="CSV or TSV export with employee_id, date, clock_in, clock_out, status")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument('--delimiter', default=None, help="Field delimiter (guessed when omitted)")
+    args = parser.parse_args(argv)
+
+    db = get_db_connection(pool_size=0)
+    if not db.is_connected() and not db.connect():
+        print("[IMPORT] Could not connect to the database")
+        return 2
+
+    delimiter = '\t' if args.delimiter in ('\\t', 'tab') else args.delimiter
+    report = AttendanceImporter(db).import_file(args.path, args.batch_size, delimiter)
+    for sample in report['rejected_samples'][:20]:
+        print(f"[IMPORT] Line {sample['line']}: {sample['error']}")
+    return 0 if report['success'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,43 @@
+"""
+Attendance Rollup Maintenance for PayEase
+Rebuilds and checks the attendance_monthly table from the command line
+
+Usage:
+    python -m Model.attendance_rollup check
+    python -m Model.attendance_rollup rebuild
+"""
+
+import argparse
+import sys
+
+from Model.database import get_db_connection
+
+
+def main(argv=None):
+    """Command line entry point; returns the process exit code"""
+    parser = argparse.ArgumentParser(description="Maintain the attendance_monthly rollup")
+    parser.add_argument('command', choices=['check', 'rebuild'],
+                        help="check: report differences from attendance; rebuild: recompute every row")
+    args = parser.parse_args(argv)
+
+    db = get_db_connection(pool_size=0)
+    if not db.is_connected() and not db.connect():
+        print("[ROLLUP] Could not connect to the database")
+        return 2
+
+    if args.command == 'rebuild':
+        success, rows, message = db.rebuild_attendance_monthly()
+        print(f"[ROLLUP] {message}")
+        return 0 if success else 1
+
+    problems = db.check_attendance_monthly()
+    for problem in problems[:50]:
+        print(f"[ROLLUP] {problem}")
+    if len(problems) > 50:
+        print(f"[ROLLUP] ... and {len(problems) - 50} more")
+    print(f"[ROLLUP] {'OK' if not problems else f'{len(problems)} differences found; run rebuild to fix'}")
+    return 0 if not problems else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
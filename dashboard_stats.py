@@ -0,0 +1,179 @@
+"""
+Dashboard Statistics Cache for PayEase
+Keeps admin dashboard counters in memory and adjusts them as writes happen
+"""
+
+import threading
+import time
+
+from Model.database import get_db_connection
+from Controller.utils.money import to_centavos, from_centavos
+
+
+def is_active_employee(employee):
+    """Same rule the dashboard uses: not archived and has a real name"""
+    if not employee:
+        return False
+    if employee.get('is_archived') or employee.get('archived'):
+        return False
+    full_name = employee.get('FullName') or employee.get('full_name', '')
+    return bool(full_name) and str(full_name) != '0'
+
+
+class DashboardStatsCache:
+    """
+    Active-employee count, payroll total and payroll record count.
+
+    Counters are loaded with aggregate queries, then adjusted incrementally
+    from the database change events. A full recompute runs whenever the
+    cached values are older than ttl seconds, as a safety net against
+    writes made outside this process.
+
+    A recompute races with writes: one that commits before the queries but
+    notifies after them would be counted twice, and one that notifies
+    while the recompute runs would be lost. Every change bumps a
+    generation counter, and a recompute that saw it move is not cached.
+    """
+
+    def __init__(self, db, ttl=300):
+        """
+        Initialize cache
+
+        Args:
+            db (DatabaseConnection): Database to read from and listen to
+            ttl (float): Seconds before a full recompute
+        """
+        self.db = db
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._total_employees = 0
+        self._total_payroll_centavos = 0
+        self._payroll_records = 0
+        self._loaded_at = None
+        self._generation = 0  # Bumped by every change event and invalidation
+
+        self.db.add_change_listener(self.on_change)
+
+    def get_stats(self):
+        """
+        Get dashboard statistics
+
+        Returns:
+            dict: total_employees, total_payroll (Decimal), payroll_records
+        """
+        with self._lock:
+            expired = self._loaded_at is None or time.monotonic() - self._loaded_at > self.ttl
+
+        if expired:
+            return self.recompute()
+
+        with self._lock:
+            return {
+                'total_employees': self._total_employees,
+                'total_payroll': from_centavos(self._total_payroll_centavos),
+                'payroll_records': self._payroll_records
+            }
+
+    def recompute(self):
+        """
+        Reload every counter from the database
+
+        The values are cached only if no change arrived while the queries
+        ran; otherwise they are returned once and the next read recomputes.
+
+        Returns:
+            dict: total_employees, total_payroll (Decimal), payroll_records as read
+        """
+        with self._lock:
+            generation = self._generation
+
+        total_employees = self.db.count_active_employees()
+        summary = self.db.get_payroll_summary()
+
+        with self._lock:
+            if generation == self._generation:
+                self._total_employees = total_employees
+                self._total_payroll_centavos = to_centavos(summary['total_amount'])
+                self._payroll_records = summary['total_records']
+                self._loaded_at = time.monotonic()
+                cached = True
+            else:
+                self._loaded_at = None
+                cached = False
+
+        print(f"[STATS] Dashboard stats recomputed: {total_employees} employees, "
+              f"{summary['total_records']} payroll records"
+              f"{'' if cached else ' (writes arrived meanwhile; not cached)'}")
+        return {
+            'total_employees': total_employees,
+            'total_payroll': summary['total_amount'],
+            'payroll_records': summary['total_records']
+        }
+
+    def invalidate(self):
+        """Force a full recompute on the next read"""
+        with self._lock:
+            self._generation += 1
+            self._loaded_at = None
+
+    def on_change(self, event, details):
+        """Adjust counters for a committed write"""
+        with self._lock:
+            # A recompute in flight may or may not have seen this write; it must not be cached
+            self._generation += 1
+            if self._loaded_at is None:
+                return  # Nothing cached yet; the next read loads fresh values
+
+            if event == 'employee_added':
+                if is_active_employee(details.get('employee')):
+                    self._total_employees += 1
+
+            elif event == 'employee_batch_added':
+                self._total_employees += sum(
+                    1 for employee in details.get('employees') or [] if is_active_employee(employee))
+
+            elif event == 'employee_updated':
+                changes = details.get('changes') or {}
+                if 'FullName' in changes:
+                    # Whether the old name counted is unknown; recount on the next read
+                    self._loaded_at = None
+                elif details.get('archived_changed'):
+                    self._total_employees += -1 if changes.get('is_archived') else 1
+
+            elif event == 'employee_deleted':
+                # Whether the deleted employee was active is unknown; recount on the next read
+                self._loaded_at = None
+
+            elif event == 'payroll_added':
+                self._add_payroll(details.get('record'), 1)
+
+            elif event == 'payroll_batch_added':
+                for record in details.get('records') or []:
+                    self._add_payroll(record, 1)
+
+            elif event == 'payroll_deleted':
+                self._add_payroll(details.get('previous'), -1)
+
+            # payroll_status_changed does not affect the totals shown on the dashboard
+
+    def _add_payroll(self, record, sign):
+        """Apply one payroll record to the counters (sign is 1 or -1); caller holds the lock"""
+        if not record:
+            return
+        self._payroll_records += sign
+        try:
+            self._total_payroll_centavos += sign * to_centavos(record.get('net_salary', 0))
+        except (ValueError, TypeError):
+            self._loaded_at = None  # Unknown amount; recompute on next read
+
+
+# Shared instance for the running application
+_stats_cache_instance = None
+
+
+def get_dashboard_stats_cache(db=None):
+    """Get or create the dashboard statistics cache"""
+    global _stats_cache_instance
+    if _stats_cache_instance is None:
+        _stats_cache_instance = DashboardStatsCache(db or get_db_connection())
+    return _stats_cache_instance
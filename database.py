@@ -5,21 +5,61 @@ Uses bcrypt for secure password storage
 """
 
 import mysql.connector
-from mysql.connector import Error
-from datetime import datetime
+from mysql.connector import Error, IntegrityError, errorcode, pooling
+from mysql.connector.constants import ClientFlag
+from mysql.connector.errors import PoolError
+from contextlib import contextmanager
+from datetime import date, datetime
+from decimal import Decimal
+import calendar
+import threading
+import time
 import sys
 import os
 
 # Add parent directory to path to import from Controller
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from Controller.utils.password_manager import PasswordManager
+from Controller.utils.password_executor import get_password_executor
+from Model.migrations import (SchemaMigrator, ATTENDANCE_MONTHLY_SELECT, ATTENDANCE_MONTHLY_INSERT,
+                              UNIQUE_USERNAME_INDEX, UNIQUE_EMAIL_INDEX)
+from Model.id_allocator import IdSequence, id_order, older_than
+from Model.employee_search import EmployeeSearch
+from Model.login_guard import LoginGuard
+from Model.entity_cache import EntityCache
+from Model.row_records import record_type, to_records
+
+
+# Rows per page for paginated employee listings
+EMPLOYEE_PAGE_SIZE = 100
+
+# get_employee_by_id() cache: entries kept, and seconds before an entry is re-read
+EMPLOYEE_CACHE_SIZE = int(os.environ.get('PAYEASE_EMPLOYEE_CACHE_SIZE', '1024'))
+EMPLOYEE_CACHE_TTL = float(os.environ.get('PAYEASE_EMPLOYEE_CACHE_TTL', '60'))
+
+# cursor.rowcount reports matched rows rather than changed rows, so an UPDATE that
+# writes the values already stored still counts as finding its row
+CLIENT_FLAGS = [ClientFlag.FOUND_ROWS]
+
+# Rows fetched per round trip when streaming with iter_records()
+RECORD_BATCH_SIZE = 5000
+
+ALL_PAYROLL_QUERY = """
+    SELECT 
+        p.*,
+        e.FullName as employee_name,
+        e.Position as position
+    FROM payroll p
+    LEFT JOIN employees e ON p.employee_id = e.Employee_ID
+    ORDER BY p.processed_date DESC
+"""
 
 
 class DatabaseConnection:
     """Manages MySQL database connection and operations"""
 
-    def __init__(self, host='localhost', user='root', password='', database='payease_db'):
+    def __init__(self, host='localhost', user='root', password='', database='payease_db',
+                 pool_size=None, pool_timeout=10):
         """
         Initialize database connection
 
@@ -28,90 +68,96 @@ class DatabaseConnection:
             user (str): MySQL username
             password (str): MySQL password
             database (str): Database name
+            pool_size (int): Number of pooled connections (None = single shared connection)
+            pool_timeout (float): Seconds to wait for a free pooled connection
         """
         self.host = host
         self.user = user
         self.password = password
         self.database = database
+        self.pool_size = pool_size
+        self.pool_timeout = pool_timeout
+        self.pool = None
         self.connection = None
         self.cursor = None
+        # Serializes access to the shared connection when running without a pool
+        self._shared_lock = threading.RLock()
+        # Before the components below, some of which subscribe to changes as they start
+        self._change_listeners = []
+        self.schema = SchemaMigrator(self)
+        self.employee_ids = IdSequence(self)
+        self.employee_search = EmployeeSearch(self)
+        # bcrypt work runs in worker processes, off the calling thread
+        self.passwords = get_password_executor()
+        self.login_guard = LoginGuard(self)
+        self.employee_cache = EntityCache(max_size=EMPLOYEE_CACHE_SIZE, ttl=EMPLOYEE_CACHE_TTL)
 
     def connect(self):
         """Establish connection to MySQL database"""
-        try:
-            self.connection = mysql.connector.connect(
-                host=self.host,
-                user=self.user,
-                password=self.password,
-                database=self.database
-            )
-            self.cursor = self.connection.cursor(dictionary=True)
-            print(f"[DB] Connected to {self.database} successfully")
-
-            # Check and add missing columns
-            self.ensure_archived_column()
-            self.ensure_employee_id_column()
-
-            return True
-        except Error as e:
-            print(f"[DB ERROR] Connection failed: {e}")
-            return False
-
-    def ensure_archived_column(self):
-        """Ensure the is_archived column exists in employees table"""
-        try:
-            check_query = """
-                SELECT COUNT(*) as count 
-                FROM INFORMATION_SCHEMA.COLUMNS 
-                WHERE TABLE_SCHEMA = %s 
-                AND TABLE_NAME = 'employees' 
-                AND COLUMN_NAME = 'is_archived'
-            """
-            self.cursor.execute(check_query, (self.database,))
-            result = self.cursor.fetchone()
+        with self._shared_lock:
+            try:
+                if self.pool_size:
+                    if self.pool is None:
+                        self.pool = pooling.MySQLConnectionPool(
+                            pool_name=f"payease_{self.database}_{id(self)}",
+                            pool_size=self.pool_size,
+                            pool_reset_session=True,
+                            host=self.host,
+                            user=self.user,
+                            password=self.password,
+                            database=self.database,
+                            client_flags=CLIENT_FLAGS
+                        )
+                    # Every operation borrows a pooled connection through checkout(); none is kept here
+                else:
+                    self.connection = mysql.connector.connect(
+                        host=self.host,
+                        user=self.user,
+                        password=self.password,
+                        database=self.database,
+                        client_flags=CLIENT_FLAGS
+                    )
+                    self.cursor = self.connection.cursor(dictionary=True)
+                if self.pool:
+                    print(f"[DB] Connected to {self.database} successfully (pool size: {self.pool_size})")
+                else:
+                    print(f"[DB] Connected to {self.database} successfully")
+
+                # Apply pending schema migrations (once per process). Without them the unique keys
+                # and id_sequences may be missing, so stay disconnected; the next connect() retries
+                if not self.schema.ensure_schema():
+                    self._close_unmigrated()
+                    return False
 
-            if result['count'] == 0:
-                alter_query = """
-                    ALTER TABLE employees 
-                    ADD COLUMN is_archived TINYINT(1) DEFAULT 0
-                """
-                self.cursor.execute(alter_query)
-                self.connection.commit()
-                print("[DB] Added is_archived column to employees table")
-            else:
-                print("[DB] is_archived column already exists")
-        except Error as e:
-            print(f"[DB WARNING] Could not verify/add is_archived column: {e}")
+                return True
+            except Error as e:
+                print(f"[DB ERROR] Connection failed: {e}")
+                return False
 
-    def ensure_employee_id_column(self):
-        """Ensure the employee_id column exists in accounts table"""
+    def _close_unmigrated(self):
+        """Drop the pool or shared connection after migrations failed, so is_connected() is False"""
+        print("[DB ERROR] Schema migrations did not complete; not connected")
+        if self.pool is not None:
+            self.pool = None
+            return
         try:
-            check_query = """
-                SELECT COUNT(*) as count 
-                FROM INFORMATION_SCHEMA.COLUMNS 
-                WHERE TABLE_SCHEMA = %s 
-                AND TABLE_NAME = 'accounts' 
-                AND COLUMN_NAME = 'employee_id'
-            """
-            self.cursor.execute(check_query, (self.database,))
-            result = self.cursor.fetchone()
-
-            if result['count'] == 0:
-                alter_query = """
-                    ALTER TABLE accounts 
-                    ADD COLUMN employee_id VARCHAR(50) NULL,
-                    ADD INDEX idx_employee_id (employee_id)
-                """
-                self.cursor.execute(alter_query)
-                self.connection.commit()
-                print("[DB] Added employee_id column to accounts table")
-            else:
-                print("[DB] employee_id column already exists in accounts table")
+            if self.connection:
+                self.cursor.close()
+                self.connection.close()
         except Error as e:
-            print(f"[DB WARNING] Could not verify/add employee_id column: {e}")
+            print(f"[DB ERROR] Disconnection error: {e}")
+        self.connection = None
+        self.cursor = None
 
     def disconnect(self):
         """Close database connection"""
+        # Pending login bookkeeping goes out before the connection closes
+        self.login_guard.flush()
+        if self.pool is not None:
+            # Pooled connections close as they are released and collected
+            self.pool = None
+            print("[DB] Disconnected from database")
+            return True
         try:
             if self.connection and self.connection.is_connected():
                 self.cursor.close()
@@ -123,43 +169,176 @@ class DatabaseConnection:
         return False
 
     def is_connected(self):
-        """Check if database is connected"""
-        return self.connection and self.connection.is_connected()
+        """Check if database is connected (in pooled mode: the pool is up)"""
+        if self.pool is not None:
+            return True
+        return bool(self.connection and self.connection.is_connected())
 
-    def get_next_employee_id(self):
+    def add_change_listener(self, listener):
         """
-        Get the next employee ID in format E000, E001, etc.
+        Register a callback for committed writes
 
-        Returns:
-            str: Next employee ID
+        Args:
+            listener (callable): Called as listener(event, details) after a write commits
+        """
+        if listener not in self._change_listeners:
+            self._change_listeners.append(listener)
+
+    def remove_change_listener(self, listener):
+        """Unregister a change callback"""
+        if listener in self._change_listeners:
+            self._change_listeners.remove(listener)
+
+    def _notify_change(self, event, **details):
+        """Tell listeners about a committed write; listener errors never fail the write"""
+        for listener in list(self._change_listeners):
+            try:
+                listener(event, details)
+            except Exception as e:
+                print(f"[DB WARNING] Change listener failed for {event}: {e}")
+
+    def _get_pooled_connection(self):
+        """Take a healthy connection from the pool, waiting up to pool_timeout seconds"""
+        deadline = time.monotonic() + self.pool_timeout
+        while True:
+            try:
+                connection = self.pool.get_connection()
+            except PoolError:
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(0.05)
+                continue
+
+            # Health check: revive connections dropped by the server while idle
+            try:
+                connection.ping(reconnect=True, attempts=2, delay=0)
+            except Error:
+                connection.close()
+                if time.monotonic() >= deadline:
+                    raise
+                continue
+            return connection
+
+    @contextmanager
+    def checkout(self, dictionary=True):
         """
+        Borrow a connection and cursor for a single operation.
+
+        With a pool, every checkout gets its own connection which is returned
+        to the pool afterwards, so several threads can query at once. Without
+        a pool the shared connection is used and access is serialized.
+        Uncommitted work is rolled back if the block raises.
+
+        Args:
+            dictionary (bool): Dictionary cursor (default), or a plain cursor
+                               returning tuples, for fetch_records()
+
+        Yields:
+            tuple: (connection, cursor)
+        """
+        if self.pool is None and self.pool_size and not self.connect():
+            raise Error(msg="Database connection pool is unavailable")
+
+        if self.pool is None:
+            with self._shared_lock:
+                if not self.is_connected() and not self.connect():
+                    raise Error(msg="Database connection is unavailable")
+                cursor = self.cursor if dictionary else self.connection.cursor()
+                try:
+                    yield self.connection, cursor
+                except Exception:
+                    if self.connection:
+                        self.connection.rollback()
+                    raise
+                finally:
+                    if cursor is not self.cursor:
+                        cursor.close()
+            return
+
+        connection = self._get_pooled_connection()
+        cursor = connection.cursor(dictionary=dictionary)
         try:
-            if not self.is_connected():
-                self.connect()
+            yield connection, cursor
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            cursor.close()
+            connection.close()  # Returns the connection to the pool
+
+    def fetch_records(self, query, params=()):
+        """
+        Run a query and return its rows as compact Records
 
-            query = """
-                SELECT Employee_ID FROM employees 
-                WHERE Employee_ID REGEXP '^E[0-9]+$'
-                ORDER BY CAST(SUBSTRING(Employee_ID, 2) AS UNSIGNED) DESC 
-                LIMIT 1
-            """
-            self.cursor.execute(query)
-            result = self.cursor.fetchone()
+        Records read like the dictionary cursor's rows (record['column'],
+        record.get(...), 'column' in record) but are tuples underneath, with
+        the column names kept once per query instead of once per row.
+        Iterating a Record gives its values, not its column names; use
+        keys() / items(), or dict(record) to serialize or modify it.
 
-            if result:
-                last_id = result['Employee_ID']
-                last_number = int(last_id[1:])
-                next_number = last_number + 1
-            else:
-                next_number = 0
+        Args:
+            query (str): SQL query
+            params (tuple): Query parameters
 
-            next_id = f"E{next_number:03d}"
-            print(f"[DB] Next Employee ID: {next_id}")
-            return next_id
+        Returns:
+            list: Records
 
-        except Error as e:
-            print(f"[DB ERROR] Failed to get next employee ID: {e}")
-            return "E000"
+        Raises:
+            Error: If the query fails
+        """
+        with self.checkout(dictionary=False) as (connection, cursor):
+            cursor.execute(query, params)
+            return to_records(cursor.column_names, cursor.fetchall())
+
+    def iter_records(self, query, params=(), batch_size=RECORD_BATCH_SIZE):
+        """
+        Stream a query's rows as Records, batch_size rows per round trip
+
+        The rows are read from an unbuffered cursor, so a result larger than
+        memory can be processed. The connection stays checked out until the
+        iteration ends; rows left unread when it stops early are discarded.
+
+        Args:
+            query (str): SQL query
+            params (tuple): Query parameters
+            batch_size (int): Rows fetched per round trip
+
+        Yields:
+            Record: One row at a time
+
+        Raises:
+            Error: If the query fails
+        """
+        with self.checkout(dictionary=False) as (connection, cursor):
+            cursor.execute(query, params)
+            make_record = record_type(cursor.column_names)
+            finished = False
+            try:
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        finished = True
+                        return
+                    yield from map(make_record, rows)
+            finally:
+                # The connection cannot run another statement until the result is drained
+                if not finished:
+                    while cursor.fetchmany(batch_size):
+                        pass
+
+    def get_next_employee_id(self):
+        """
+        Reserve the next employee ID (E000, E001, ... E999, E1000, ...)
+
+        Returns:
+            str: Employee ID, never handed out again
+
+        Raises:
+            Error: If the ID sequence cannot be updated
+        """
+        next_id = self.employee_ids.next_id()
+        print(f"[DB] Next Employee ID: {next_id}")
+        return next_id
 
     def create_account(self, username, password, role='employee', employee_id=None):
         """
@@ -175,41 +354,38 @@ class DatabaseConnection:
             bool: True if successful, False otherwise
         """
         try:
-            if not self.is_connected():
-                self.connect()
-
             # Hash the password securely with bcrypt
             try:
-                password_hash, salt = PasswordManager.hash_password(password)
+                password_hash, salt = self.passwords.hash(password)
                 print(f"[DB] ✅ Password securely hashed with bcrypt for: {username}")
             except ValueError as e:
                 print(f"[DB ERROR] Password validation failed: {e}")
                 return False
-
-            self.ensure_employee_id_column()
+            except RuntimeError as e:
+                print(f"[DB ERROR] Password hashing unavailable: {e}")
+                return False
 
             query = """
                 INSERT INTO accounts (username, password_hash, salt, role, employee_id, password_changed_at)
                 VALUES (%s, %s, %s, %s, %s, %s)
             """
 
-            self.cursor.execute(query, (
-                username,
-                password_hash,
-                salt,
-                role,
-                employee_id,
-                datetime.now()
-            ))
-            self.connection.commit()
+            with self.checkout() as (connection, cursor):
+                cursor.execute(query, (
+                    username,
+                    password_hash,
+                    salt,
+                    role,
+                    employee_id,
+                    datetime.now()
+                ))
+                connection.commit()
 
             print(f"[DB] Account created for user: {username} (Employee ID: {employee_id}) - Password securely hashed")
             return True
 
         except Error as e:
             print(f"[DB ERROR] Failed to create account: {e}")
-            if self.connection:
-                self.connection.rollback()
             return False
 
     def add_employee(self, employee_data):
@@ -223,48 +399,33 @@ class DatabaseConnection:
             tuple: (success: bool, employee_id: str or None, message: str)
         """
         try:
-            if not self.is_connected():
-                self.connect()
-
-            username = employee_data.get('username', '').strip()
-            password = employee_data.get('password', '').strip()
-            full_name = employee_data.get('full_name', '').strip()
-            email = employee_data.get('email', '').strip().lower()
-            role = employee_data.get('role', 'Employee').strip()
-            position = employee_data.get('position', '').strip()
-            salary = float(employee_data.get('salary', 0))
-            department = employee_data.get('department', '').strip()
-            phone = employee_data.get('phone', '').strip()
-            address = employee_data.get('address', '').strip()
-            date_hired = employee_data.get('date_hired', datetime.now().strftime('%Y-%m-%d'))
-
-            # Validation
-            if not username:
-                return (False, None, "Username is required")
-
-            if not password:
-                return (False, None, "Password is required")
-
-            if len(password) < 6:
-                return (False, None, "Password must be at least 6 characters long")
-
-            if not all([full_name, email, position, department]):
-                return (False, None, "Missing required fields")
+            employee, error = normalize_employee_data(employee_data)
+            if error:
+                return (False, None, error)
+
+            username = employee['username']
+            password = employee['password']
+            full_name = employee['full_name']
+            email = employee['email']
+            role = employee['role']
+            position = employee['position']
+            salary = employee['salary']
+            department = employee['department']
+            phone = employee['phone']
+            address = employee['address']
+            date_hired = employee['date_hired']
+
+            # With unique keys in place the INSERTs themselves report duplicates
+            if not self.has_unique_credentials():
+                duplicate = self._find_duplicate_credentials(username, email)
+                if duplicate:
+                    return (False, None, duplicate)
 
-            if "@" not in email or "." not in email:
-                return (False, None, "Invalid email format")
-
-            # Check if username already exists
-            check_username_query = "SELECT username FROM accounts WHERE username = %s"
-            self.cursor.execute(check_username_query, (username,))
-            if self.cursor.fetchone():
-                return (False, None, f"Username '{username}' is already taken")
-
-            # Check if email already exists
-            check_email_query = "SELECT Email FROM employees WHERE Email = %s"
-            self.cursor.execute(check_email_query, (email,))
-            if self.cursor.fetchone():
-                return (False, None, f"Email '{email}' is already registered")
+            try:
+                password_hash, salt = self.passwords.hash(password)
+            except (ValueError, RuntimeError) as e:
+                print(f"[DB ERROR] Password hashing failed: {e}")
+                return (False, None, f"Failed to create account: {e}")
 
             employee_id = self.get_next_employee_id()
 
@@ -273,41 +434,174 @@ class DatabaseConnection:
                 (Employee_ID, FullName, Email, Role, Position, Salary, Department, Phone, Address, data_hired, is_archived)
                 VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 0)
             """
+            account_query = """
+                INSERT INTO accounts (username, password_hash, salt, role, employee_id, password_changed_at)
+                VALUES (%s, %s, %s, %s, %s, %s)
+            """
 
-            self.cursor.execute(insert_query, (
-                employee_id, full_name, email, role, position, salary, department, phone, address, date_hired
-            ))
-            self.connection.commit()
-
-            account_role = 'admin' if role.lower() == 'admin' else 'employee'
-
-            if self.create_account(username, password, account_role, employee_id):
-                success_message = f"Employee added successfully!\n\nEmployee ID: {employee_id}\nUsername: {username}"
-                print(f"[DB] Employee added with ID: {employee_id}")
-                return (True, employee_id, success_message)
-            else:
-                self.cursor.execute("DELETE FROM employees WHERE Employee_ID = %s", (employee_id,))
-                self.connection.commit()
-                return (False, None, "Failed to create account")
+            # Employee and account are committed together, or neither is
+            try:
+                with self.checkout() as (connection, cursor):
+                    cursor.execute(insert_query, (
+                        employee_id, full_name, email, role, position, salary, department, phone, address, date_hired
+                    ))
+                    cursor.execute(account_query, (
+                        username, password_hash, salt, employee['account_role'], employee_id, datetime.now()
+                    ))
+                    connection.commit()
+            except IntegrityError as e:
+                if e.errno != errorcode.ER_DUP_ENTRY:
+                    raise
+                if UNIQUE_USERNAME_INDEX[1] in str(e.msg):
+                    return (False, None, f"Username '{username}' is already taken")
+                if UNIQUE_EMAIL_INDEX[1] in str(e.msg):
+                    return (False, None, f"Email '{email}' is already registered")
+                raise
+
+            success_message = f"Employee added successfully!\n\nEmployee ID: {employee_id}\nUsername: {username}"
+            print(f"[DB] Employee added with ID: {employee_id}")
+            self._notify_change('employee_added', employee_id=employee_id, employee={
+                'Employee_ID': employee_id, 'FullName': full_name, 'Email': email, 'Role': role,
+                'Position': position, 'Salary': salary, 'Department': department, 'is_archived': 0
+            })
+            return (True, employee_id, success_message)
 
         except ValueError as e:
             print(f"[DB ERROR] Invalid data format: {e}")
             return (False, None, f"Invalid data format: {str(e)}")
         except Error as e:
             print(f"[DB ERROR] Failed to add employee: {e}")
-            if self.connection:
-                self.connection.rollback()
             return (False, None, f"Database error: {str(e)}")
 
-    def get_all_employees(self):
-        """Retrieve all employees from the database"""
+    def has_unique_credentials(self):
+        """Check if usernames and emails are protected by unique keys (see migration 10)"""
+        try:
+            return all(self.schema.has_index(table, index) for table, index, _ in
+                       (UNIQUE_USERNAME_INDEX, UNIQUE_EMAIL_INDEX))
+        except Error as e:
+            print(f"[DB WARNING] Could not check for unique keys: {e}")
+            return False
+
+    def _find_duplicate_credentials(self, username, email):
+        """
+        Look up a username and email before inserting (used while the unique keys are missing)
+
+        Returns:
+            str: Message for the first duplicate found, or None
+        """
+        with self.checkout() as (connection, cursor):
+            cursor.execute("SELECT username FROM accounts WHERE username = %s", (username,))
+            if cursor.fetchone():
+                return f"Username '{username}' is already taken"
+
+            cursor.execute("SELECT Email FROM employees WHERE Email = %s", (email,))
+            if cursor.fetchone():
+                return f"Email '{email}' is already registered"
+        return None
+
+    def find_taken_credentials(self, usernames, emails):
+        """
+        Set-based duplicate check for bulk onboarding
+
+        Args:
+            usernames (iterable): Usernames to look up
+            emails (iterable): Emails to look up (lower-case)
+
+        Returns:
+            tuple: (taken_usernames: set, taken_emails: set), both lower-case
+
+        Raises:
+            Error: If the lookup fails (an empty result would let duplicates through)
+        """
+        lookups = (
+            ("SELECT username AS value FROM accounts WHERE username IN ({})", list(set(usernames))),
+            ("SELECT Email AS value FROM employees WHERE Email IN ({})", list(set(emails))),
+        )
+        taken = []
+        with self.checkout() as (connection, cursor):
+            for query, values in lookups:
+                found = set()
+                # Bounded IN lists keep each statement well under max_allowed_packet
+                for start in range(0, len(values), 1000):
+                    chunk = values[start:start + 1000]
+                    cursor.execute(query.format(', '.join(['%s'] * len(chunk))), chunk)
+                    found.update(str(row['value']).lower() for row in cursor.fetchall())
+                taken.append(found)
+        return taken[0], taken[1]
+
+    def allocate_employee_ids(self, count):
+        """
+        Reserve a block of consecutive employee IDs in one statement
+
+        Args:
+            count (int): Number of IDs needed
+
+        Returns:
+            list: Employee IDs in ascending order
+
+        Raises:
+            Error: If the ID sequence cannot be updated
+        """
+        return self.employee_ids.allocate(count)
+
+    def insert_employees_batch(self, records):
+        """
+        Insert employees and their accounts in one transaction
+
+        Either every employee in the batch is committed together with its
+        account, or nothing is.
+
+        Args:
+            records (list): Dicts from normalize_employee_data() with Employee_ID,
+                            password_hash and salt added
+
+        Returns:
+            tuple: (success: bool, count: int, message: str)
+        """
+        if not records:
+            return (True, 0, "No employees to add")
+
+        employee_query = """
+            INSERT INTO employees
+            (Employee_ID, FullName, Email, Role, Position, Salary, Department, Phone, Address, data_hired, is_archived)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 0)
+        """
+        account_query = """
+            INSERT INTO accounts (username, password_hash, salt, role, employee_id, password_changed_at)
+            VALUES (%s, %s, %s, %s, %s, %s)
+        """
+        now = datetime.now()
+
         try:
-            if not self.is_connected():
-                self.connect()
+            with self.checkout() as (connection, cursor):
+                cursor.executemany(employee_query, [(
+                    record['Employee_ID'], record['full_name'], record['email'], record['role'],
+                    record['position'], record['salary'], record['department'], record['phone'],
+                    record['address'], record['date_hired']
+                ) for record in records])
+                cursor.executemany(account_query, [(
+                    record['username'], record['password_hash'], record['salt'],
+                    record['account_role'], record['Employee_ID'], now
+                ) for record in records])
+                connection.commit()
+
+        except Error as e:
+            print(f"[DB ERROR] Failed to add employee batch: {e}")
+            return (False, 0, f"Database error: {str(e)}")
+
+        self._notify_change('employee_batch_added', employees=[{
+            'Employee_ID': record['Employee_ID'], 'FullName': record['full_name'], 'Email': record['email'],
+            'Role': record['role'], 'Position': record['position'], 'Salary': record['salary'],
+            'Department': record['department'], 'is_archived': 0
+        } for record in records])
+        print(f"[DB] Added {len(records)} employees with accounts")
+        return (True, len(records), f"Added {len(records)} employees")
 
-            query = "SELECT * FROM employees ORDER BY Employee_ID DESC"
-            self.cursor.execute(query)
-            employees = self.cursor.fetchall()
+    def get_all_employees(self):
+        """Retrieve all employees from the database (as read-only Records; see fetch_records())"""
+        try:
+            query = f"SELECT * FROM employees ORDER BY {id_order('Employee_ID')}"
+            employees = self.fetch_records(query)
 
             print(f"[DB] Retrieved {len(employees)} employees")
             return employees if employees else []
@@ -316,15 +610,209 @@ class DatabaseConnection:
             print(f"[DB ERROR] Failed to retrieve employees: {e}")
             return []
 
-    def get_employee_by_id(self, employee_id):
-        """Retrieve a specific employee by ID"""
+    def get_employees_page(self, after_id=None, limit=EMPLOYEE_PAGE_SIZE, archived=False,
+                           role=None, department=None, search=None):
+        """
+        Retrieve one page of employees, newest Employee_ID first
+
+        Pages are keyset based: pass the cursor returned with the previous page
+        as after_id to continue. Placeholder rows (blank or '0' name/email) are
+        never returned.
+
+        Args:
+            after_id (str): Cursor from the previous page, None for the first page
+            limit (int): Page size
+            archived (bool): True for archived employees, False for active ones
+            role (str): Optional role to match (case-insensitive)
+            department (str): Optional department to match
+            search (str): Optional text to look for (word prefixes via FULLTEXT when
+                          available, otherwise a substring of name or email)
+
+        Returns:
+            tuple: (employees: list, next_cursor: str or None when this is the last page)
+        """
+        try:
+            conditions = [
+                "TRIM(FullName) NOT IN ('', '0')",
+                "TRIM(Email) NOT IN ('', '0')"
+            ]
+            params = []
+
+            if archived:
+                conditions.append("is_archived <> 0")
+            else:
+                conditions.append("(is_archived = 0 OR is_archived IS NULL)")
+
+            if role:
+                conditions.append("Role = %s")
+                params.append(role)
+
+            if department:
+                conditions.append("Department = %s")
+                params.append(department)
+
+            if search and search.strip():
+                fulltext = self.employee_search.fulltext_condition(search)
+                if fulltext:
+                    conditions.append(fulltext[0])
+                    params.extend(fulltext[1])
+                else:
+                    pattern = f"%{search.strip()}%"
+                    conditions.append("(FullName LIKE %s OR Email LIKE %s)")
+                    params.extend([pattern, pattern])
+
+            if after_id is not None:
+                condition, condition_params = older_than('Employee_ID', after_id)
+                conditions.append(condition)
+                params.extend(condition_params)
+
+            # One extra row tells us whether another page exists
+            query = f"""
+                SELECT * FROM employees
+                WHERE {' AND '.join(conditions)}
+                ORDER BY {id_order('Employee_ID')}
+                LIMIT %s
+            """
+            params.append(int(limit) + 1)
+
+            with self.checkout() as (connection, cursor):
+                cursor.execute(query, tuple(params))
+                employees = cursor.fetchall()
+
+            next_cursor = None
+            if len(employees) > limit:
+                employees = employees[:limit]
+                next_cursor = employees[-1]['Employee_ID']
+
+            print(f"[DB] Retrieved page of {len(employees)} employees")
+            return (employees, next_cursor)
+
+        except Error as e:
+            print(f"[DB ERROR] Failed to retrieve employee page: {e}")
+            return ([], None)
+
+    def get_employee_ids(self):
+        """
+        Retrieve every Employee_ID, for validating bulk imports
+
+        Returns:
+            set: Employee IDs
+        """
         try:
-            if not self.is_connected():
-                self.connect()
+            with self.checkout() as (connection, cursor):
+                cursor.execute("SELECT Employee_ID FROM employees")
+                return {row['Employee_ID'] for row in cursor.fetchall()}
+
+        except Error as e:
+            print(f"[DB ERROR] Failed to retrieve employee IDs: {e}")
+            return set()
+
+    def get_active_employees(self, employee_filter=None):
+        """
+        Retrieve active (non-archived) employees for payroll processing
+
+        Args:
+            employee_filter (dict): Optional filters - 'department', 'role' and/or
+                                    'employee_ids' (list of Employee_ID values)
+
+        Returns:
+            list: Employee records with Employee_ID, FullName, Salary, Department and Role
+        """
+        try:
+            employee_filter = employee_filter or {}
+            conditions = [
+                "COALESCE(is_archived, 0) = 0",
+                "FullName NOT IN ('', '0')"
+            ]
+            params = []
+
+            if employee_filter.get('department'):
+                conditions.append("Department = %s")
+                params.append(employee_filter['department'])
+
+            if employee_filter.get('role'):
+                conditions.append("Role = %s")
+                params.append(employee_filter['role'])
+
+            employee_ids = employee_filter.get('employee_ids')
+            if employee_ids is not None:
+                if not employee_ids:
+                    return []
+                conditions.append(f"Employee_ID IN ({', '.join(['%s'] * len(employee_ids))})")
+                params.extend(employee_ids)
+
+            query = f"""
+                SELECT Employee_ID, FullName, Salary, Department, Role
+                FROM employees
+                WHERE {' AND '.join(conditions)}
+                ORDER BY {id_order('Employee_ID', newest_first=False)}
+            """
+            with self.checkout() as (connection, cursor):
+                cursor.execute(query, params)
+                employees = cursor.fetchall()
+
+            print(f"[DB] Retrieved {len(employees)} active employees")
+            return employees if employees else []
+
+        except Error as e:
+            print(f"[DB ERROR] Failed to retrieve active employees: {e}")
+            return []
+
+    def count_active_employees(self):
+        """
+        Count active employees (not archived, with a real name)
+
+        Returns:
+            int: Number of active employees
+        """
+        try:
+            query = """
+                SELECT COUNT(*) AS total
+                FROM employees
+                WHERE COALESCE(is_archived, 0) = 0
+                  AND FullName NOT IN ('', '0')
+            """
+            with self.checkout() as (connection, cursor):
+                cursor.execute(query)
+                row = cursor.fetchone()
+
+            return int(row['total'])
+
+        except Error as e:
+            print(f"[DB ERROR] Failed to count active employees: {e}")
+            return 0
+
+    def get_employee_by_id(self, employee_id):
+        """
+        Retrieve a specific employee by ID
 
+        Served from the employee cache when possible; writes through this
+        connection invalidate the cached entry.
+
+        Args:
+            employee_id (str): Employee ID
+
+        Returns:
+            dict: Employee record, or None if not found
+        """
+        return self.employee_cache.get_or_load(employee_id, lambda: self._load_employee(employee_id))
+
+    def get_employee_cache_stats(self):
+        """
+        Hit and miss counters of the employee cache
+
+        Returns:
+            dict: hits, misses, evictions, size, max_size, hit_rate
+        """
+        return self.employee_cache.stats()
+
+    def _load_employee(self, employee_id):
+        """Read one employee row from the database (cache miss path)"""
+        try:
             query = "SELECT * FROM employees WHERE Employee_ID = %s"
-            self.cursor.execute(query, (employee_id,))
-            employee = self.cursor.fetchone()
+            with self.checkout() as (connection, cursor):
+                cursor.execute(query, (employee_id,))
+                employee = cursor.fetchone()
 
             if employee:
                 print(f"[DB] Retrieved employee with ID: {employee_id}")
@@ -338,14 +826,23 @@ class DatabaseConnection:
             return None
 
     def update_employee(self, employee_id, employee_data):
-        """Update employee information"""
-        try:
-            if not self.is_connected():
-                self.connect()
+        """
+        Update employee information
+
+        Nothing is read before writing: the matched-row count of the UPDATE
+        tells whether the employee exists, and is_archived is changed with
+        a conditional UPDATE whose row count tells whether it flipped. The
+        employee_updated event carries the changed columns and that flag
+        (archived_changed) instead of the previous row.
 
-            if not self.get_employee_by_id(employee_id):
-                return (False, f"Employee with ID {employee_id} not found")
+        Args:
+            employee_id (str): Employee ID
+            employee_data (dict): Fields to change (full_name, email, ..., is_archived)
 
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        try:
             update_fields = []
             values = []
 
@@ -358,57 +855,88 @@ class DatabaseConnection:
                 'department': 'Department',
                 'phone': 'Phone',
                 'address': 'Address',
-                'date_hired': 'data_hired',
-                'is_archived': 'is_archived'
+                'date_hired': 'data_hired'
             }
 
             for key, db_column in field_mapping.items():
                 if key in employee_data:
                     update_fields.append(f"{db_column} = %s")
-                    if key == 'is_archived':
-                        values.append(1 if employee_data[key] else 0)
-                    else:
-                        values.append(employee_data[key])
+                    values.append(employee_data[key])
 
-            if not update_fields:
-                return (False, "No fields to update")
+            archived = None
+            if 'is_archived' in employee_data:
+                archived = 1 if employee_data['is_archived'] else 0
 
-            values.append(employee_id)
+            if not update_fields and archived is None:
+                return (False, "No fields to update")
 
-            query = f"UPDATE employees SET {', '.join(update_fields)} WHERE Employee_ID = %s"
-            self.cursor.execute(query, values)
-            self.connection.commit()
+            changes = {field.split(' = ')[0]: value for field, value in zip(update_fields, values)}
+            archived_changed = False
+
+            with self.checkout() as (connection, cursor):
+                found = True
+                if update_fields:
+                    query = f"UPDATE employees SET {', '.join(update_fields)} WHERE Employee_ID = %s"
+                    cursor.execute(query, values + [employee_id])
+                    # The matched-row count is the existence check (CLIENT_FLAGS)
+                    found = cursor.rowcount > 0
+
+                if archived is not None and found:
+                    cursor.execute(
+                        "UPDATE employees SET is_archived = %s WHERE Employee_ID = %s AND COALESCE(is_archived, 0) <> %s",
+                        (archived, employee_id, archived)
+                    )
+                    archived_changed = cursor.rowcount > 0
+                    changes['is_archived'] = archived
+                    if not update_fields and not archived_changed:
+                        # Nothing matched: already in that state, or no such employee (rare path)
+                        cursor.execute("SELECT 1 AS found FROM employees WHERE Employee_ID = %s", (employee_id,))
+                        found = cursor.fetchone() is not None
+
+                if not found:
+                    connection.rollback()
+                    return (False, f"Employee with ID {employee_id} not found")
+                connection.commit()
+            self.employee_cache.invalidate(employee_id)
+
+            if update_fields or archived_changed:
+                self._notify_change('employee_updated', employee_id=employee_id, changes=changes,
+                                    archived_changed=archived_changed)
 
             print(f"[DB] Employee {employee_id} updated successfully")
             return (True, f"Employee {employee_id} updated successfully")
 
         except Error as e:
             print(f"[DB ERROR] Failed to update employee: {e}")
-            if self.connection:
-                self.connection.rollback()
             return (False, f"Database error: {str(e)}")
 
     def delete_employee(self, employee_id):
-        """Delete an employee from the database (permanent deletion)"""
-        try:
-            if not self.is_connected():
-                self.connect()
-
-            employee = self.get_employee_by_id(employee_id)
-            if not employee:
-                return (False, f"Employee with ID {employee_id} not found")
+        """
+        Delete an employee from the database (permanent deletion)
 
+        A single DELETE; its row count is the existence check. The
+        employee_deleted event carries the cached name when there is one,
+        for display only.
+        """
+        try:
+            cached = self.employee_cache.peek(employee_id)
             query = "DELETE FROM employees WHERE Employee_ID = %s"
-            self.cursor.execute(query, (employee_id,))
-            self.connection.commit()
+            with self.checkout() as (connection, cursor):
+                cursor.execute(query, (employee_id,))
+                if cursor.rowcount == 0:
+                    connection.rollback()
+                    return (False, f"Employee with ID {employee_id} not found")
+                connection.commit()
+            self.employee_cache.invalidate(employee_id)
+
+            self._notify_change('employee_deleted', employee_id=employee_id,
+                                name=(cached or {}).get('FullName'))
 
             print(f"[DB] Employee {employee_id} deleted successfully")
             return (True, f"Employee {employee_id} deleted successfully")
 
         except Error as e:
             print(f"[DB ERROR] Failed to delete employee: {e}")
-            if self.connection:
-                self.connection.rollback()
             return (False, f"Database error: {str(e)}")
 
     def archive_employee(self, employee_id):
@@ -419,63 +947,60 @@ class DatabaseConnection:
         """Restore an archived employee"""
         return self.update_employee(employee_id, {'is_archived': False})
 
-    def verify_login(self, username, password):
+    def verify_login(self, username, password, source=None):
         """
         Verify user credentials using SECURE bcrypt password verification.
         ✅ Uses hashed passwords stored in database
 
+        Attempts are rate limited per username and source. Failed attempts,
+        lockouts and last_login are tracked by the login guard: an account
+        locks for LOCKOUT_DURATION after MAX_FAILED_ATTEMPTS failures in a
+        row, and unlocks by itself once locked_until has passed.
+
         Args:
             username (str): Username or email
             password (str): Plain text password (will be hashed and compared)
+            source (str): Where the attempt comes from (defaults to this machine)
 
         Returns:
             tuple: (success: bool, user_info: dict or None)
         """
         try:
-            if not self.is_connected():
-                self.connect()
+            if not self.login_guard.allow_attempt(username, source):
+                print(f"[DB] ❌ Login refused - too many attempts: {username}")
+                return (False, None)
 
             # ✅ Using bcrypt password verification
             print(f"[DB] ✅ Verifying password using bcrypt for: {username}")
 
-            check_column_query = """
-                SELECT COUNT(*) as count 
-                FROM INFORMATION_SCHEMA.COLUMNS 
-                WHERE TABLE_SCHEMA = %s 
-                AND TABLE_NAME = 'accounts' 
-                AND COLUMN_NAME = 'employee_id'
-            """
-            self.cursor.execute(check_column_query, (self.database,))
-            column_result = self.cursor.fetchone()
-
-            if column_result['count'] == 0:
+            if not self.schema.has_column('accounts', 'employee_id'):
                 # Fallback for old schema
                 query = """
                     SELECT id, username, role, password_hash, salt
                     FROM accounts
                     WHERE username = %s
                 """
-                self.cursor.execute(query, (username,))
-                result = self.cursor.fetchone()
-
-                if result:
-                    # Verify password using bcrypt
-                    if PasswordManager.verify_password(password, result['password_hash'], result.get('salt')):
-                        user_info = {
-                            'username': result['username'],
-                            'role': result['role'],
-                            'employee_id': 'N/A',
-                            'name': result['username'],
-                            'email': '',
-                            'position': 'N/A',
-                            'department': 'N/A',
-                            'salary': 0,
-                            'phone': '',
-                            'address': '',
-                            'hire_date': 'N/A'
-                        }
-                        print(f"[DB] ✅ Login successful for user: {username}")
-                        return (True, user_info)
+                with self.checkout() as (connection, cursor):
+                    cursor.execute(query, (username,))
+                    result = cursor.fetchone()
+
+                # Verify password using bcrypt
+                if result and self.passwords.verify(password, result['password_hash'], result.get('salt')):
+                    user_info = {
+                        'username': result['username'],
+                        'role': result['role'],
+                        'employee_id': 'N/A',
+                        'name': result['username'],
+                        'email': '',
+                        'position': 'N/A',
+                        'department': 'N/A',
+                        'salary': 0,
+                        'phone': '',
+                        'address': '',
+                        'hire_date': 'N/A'
+                    }
+                    print(f"[DB] ✅ Login successful for user: {username}")
+                    return (True, user_info)
             else:
                 query = """
                     SELECT 
@@ -488,6 +1013,7 @@ class DatabaseConnection:
                         a.last_login,
                         a.failed_login_attempts,
                         a.is_locked,
+                        a.locked_until,
                         e.FullName,
                         e.Email,
                         e.Position,
@@ -501,30 +1027,29 @@ class DatabaseConnection:
                     LEFT JOIN employees e ON a.employee_id = e.Employee_ID
                     WHERE a.username = %s
                 """
-                self.cursor.execute(query, (username,))
-                result = self.cursor.fetchone()
+                # The connection goes back before the (slow) password check
+                with self.checkout() as (connection, cursor):
+                    cursor.execute(query, (username,))
+                    result = cursor.fetchone()
 
                 if result:
                     # Check if account is locked
-                    if result.get('is_locked'):
-                        print(f"[DB] ❌ Login failed - account is locked: {username}")
+                    failed_attempts, locked, locked_until = self.login_guard.account_state(result)
+                    if locked:
+                        until = f" until {locked_until:%Y-%m-%d %H:%M}" if locked_until else ""
+                        print(f"[DB] ❌ Login failed - account is locked{until}: {username}")
                         return (False, None)
 
                     # Verify password using bcrypt
-                    if PasswordManager.verify_password(password, result['password_hash'], result.get('salt')):
+                    if self.passwords.verify(password, result['password_hash'], result.get('salt')):
                         # Check if employee account is archived
                         if result['role'] == 'employee' and result.get('is_archived'):
                             print(f"[DB] ❌ Login failed - employee account is archived: {username}")
                             return (False, None)
 
-                        # Update last login and reset failed attempts
-                        update_login_query = """
-                            UPDATE accounts 
-                            SET last_login = %s, failed_login_attempts = 0, is_locked = 0
-                            WHERE id = %s
-                        """
-                        self.cursor.execute(update_login_query, (datetime.now(), result['id']))
-                        self.connection.commit()
+                        # Last login and the reset counters are written with the next batch
+                        self.login_guard.record_success(result['id'], failed_attempts)
+                        self._rehash_if_needed(result['id'], password, result['password_hash'])
 
                         user_info = {
                             'username': result['username'],
@@ -543,48 +1068,123 @@ class DatabaseConnection:
                         print(f"[DB] ✅ Login successful for user: {username} (Role: {result['role']})")
                         return (True, user_info)
                     else:
-                        # Increment failed login attempts
-                        failed_attempts = result.get('failed_login_attempts', 0) + 1
-                        is_locked = 1 if failed_attempts >= 5 else 0  # Lock after 5 failed attempts
-
-                        update_failed_query = """
-                            UPDATE accounts 
-                            SET failed_login_attempts = %s, is_locked = %s
-                            WHERE id = %s
-                        """
-                        self.cursor.execute(update_failed_query, (failed_attempts, is_locked, result['id']))
-                        self.connection.commit()
-
-                        if is_locked:
+                        # Increment failed login attempts (the lock itself is written at once)
+                        failed_attempts, locked = self.login_guard.record_failure(result['id'], failed_attempts)
+                        max_attempts = self.login_guard.max_failed_attempts
+
+                        if locked:
                             print(f"[DB] ❌ Login failed - account locked after multiple failed attempts: {username}")
                         else:
-                            print(f"[DB] ❌ Login failed for user: {username} (Attempt {failed_attempts}/5)")
+                            print(f"[DB] ❌ Login failed for user: {username} (Attempt {failed_attempts}/{max_attempts})")
                         return (False, None)
 
             print(f"[DB] ❌ Login failed - user not found: {username}")
             return (False, None)
 
+        except RuntimeError as e:
+            print(f"[DB ERROR] Login verification unavailable: {e}")
+            return (False, None)
         except Error as e:
             print(f"[DB ERROR] Login verification error: {e}")
             import traceback
             traceback.print_exc()
             return (False, None)
 
-    def search_employees(self, search_term):
-        """Search employees by name, email, or department"""
+    def _rehash_if_needed(self, account_id, password, password_hash):
+        """
+        Replace a hash made with an outdated cost factor, in the background
+
+        Only called after a successful login, the one time the plain password
+        is available. The update is skipped if the hash changed meanwhile.
+        """
+        if not self.passwords.needs_rehash(password_hash):
+            return
         try:
-            if not self.is_connected():
-                self.connect()
+            future = self.passwords.hash_async(password)
+        except RuntimeError as e:
+            print(f"[DB WARNING] Skipped password rehash for account {account_id}: {e}")
+            return
+        future.add_done_callback(lambda done: self._store_rehash(account_id, password_hash, done))
+
+    def _store_rehash(self, account_id, old_hash, future):
+        """Save a rehashed password (runs when the background hash finishes)"""
+        try:
+            new_hash, salt = future.result()
+            with self.checkout() as (connection, cursor):
+                cursor.execute("""
+                    UPDATE accounts SET password_hash = %s, salt = %s
+                    WHERE id = %s AND password_hash = %s
+                """, (new_hash, salt, account_id, old_hash))
+                connection.commit()
+            print(f"[DB] Rehashed password for account {account_id} at cost {self.passwords.cost}")
+        except (Error, ValueError, RuntimeError) as e:
+            print(f"[DB WARNING] Password rehash failed for account {account_id}: {e}")
+
+    def verify_login_by_email(self, email, password):
+        """
+        Verify login using the employee email instead of the username
 
-            search_pattern = f"%{search_term}%"
+        Args:
+            email (str): Employee email
+            password (str): Password as stored in accounts.password
+
+        Returns:
+            tuple: (success: bool, user_info: dict or None)
+        """
+        try:
             query = """
-                SELECT * FROM employees
-                WHERE FullName LIKE %s OR Email LIKE %s OR Department LIKE %s
-                ORDER BY Employee_ID DESC
+                SELECT a.username, a.role, a.employee_id,
+                       e.FullName, e.Email, e.Position, e.Department, e.Salary,
+                       e.Phone, e.Address, e.data_hired, e.is_archived
+                FROM accounts a
+                LEFT JOIN employees e ON a.employee_id = e.Employee_ID
+                WHERE e.Email = %s AND a.password = %s
             """
+            with self.checkout() as (connection, cursor):
+                cursor.execute(query, (email.lower(), password))
+                result = cursor.fetchone()
+
+            if not result:
+                return (False, None)
+
+            # Check if employee is archived
+            if result['role'] == 'employee' and result.get('is_archived'):
+                return (False, None)
+
+            user_info = {
+                'username': result['username'],
+                'role': result['role'],
+                'employee_id': result['employee_id'] or 'N/A',
+                'name': result.get('FullName', result['username']),
+                'email': result.get('Email', ''),
+                'position': result.get('Position', 'N/A'),
+                'department': result.get('Department', 'N/A'),
+                'salary': float(result.get('Salary', 0)) if result.get('Salary') else 0,
+                'phone': result.get('Phone', ''),
+                'address': result.get('Address', ''),
+                'hire_date': str(result.get('data_hired', '')) if result.get('data_hired') else 'N/A'
+            }
+            return (True, user_info)
 
-            self.cursor.execute(query, (search_pattern, search_pattern, search_pattern))
-            employees = self.cursor.fetchall()
+        except Error as e:
+            print(f"[DB ERROR] Email login verification error: {e}")
+            return (False, None)
+
+    def search_employees(self, search_term):
+        """
+        Search employees by name, email, or department
+
+        Every word must match as a word prefix (or, failing that, a close
+        misspelling); results are ranked best match first.
+
+        Args:
+            search_term (str): Search text
+
+        Returns:
+            list: Employee dicts
+        """
+        try:
+            employees = self.employee_search.search(search_term)
 
             print(f"[DB] Found {len(employees)} employees matching '{search_term}'")
             return employees if employees else []
@@ -597,11 +1197,6 @@ class DatabaseConnection:
     def add_payroll(self, payroll_data):
         """Add a new payroll record"""
         try:
-            if not self.is_connected():
-                self.connect()
-
-            self.ensure_released_date_column()
-
             insert_query = """
                 INSERT INTO payroll 
                 (employee_id, month, year, base_salary, bonus, deductions, 
@@ -609,70 +1204,242 @@ class DatabaseConnection:
                 VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
             """
 
-            self.cursor.execute(insert_query, (
-                payroll_data['employee_id'],
-                payroll_data['month'],
-                payroll_data['year'],
-                payroll_data['base_salary'],
-                payroll_data['bonus'],
-                payroll_data['deductions'],
-                payroll_data['net_salary'],
-                payroll_data['present_days'],
-                payroll_data.get('status', 'Pending'),
-                payroll_data['notes'],
-                payroll_data['processed_date'],
-                payroll_data.get('released_date')
-            ))
-            self.connection.commit()
-
-            payroll_id = self.cursor.lastrowid
+            with self.checkout() as (connection, cursor):
+                cursor.execute(insert_query, (
+                    payroll_data['employee_id'],
+                    payroll_data['month'],
+                    payroll_data['year'],
+                    payroll_data['base_salary'],
+                    payroll_data['bonus'],
+                    payroll_data['deductions'],
+                    payroll_data['net_salary'],
+                    payroll_data['present_days'],
+                    payroll_data.get('status', 'Pending'),
+                    payroll_data['notes'],
+                    payroll_data['processed_date'],
+                    payroll_data.get('released_date')
+                ))
+                connection.commit()
+
+                payroll_id = cursor.lastrowid
+
+            self._notify_change('payroll_added', payroll_id=payroll_id, record=payroll_data)
             print(f"[DB] Payroll record added with ID: {payroll_id}")
             return (True, payroll_id, "Payroll record added successfully")
 
         except Error as e:
             print(f"[DB ERROR] Failed to add payroll: {e}")
-            if self.connection:
-                self.connection.rollback()
             return (False, None, f"Database error: {str(e)}")
 
-    def ensure_released_date_column(self):
-        """Ensure the released_date column exists in payroll table"""
+    def add_payroll_batch(self, payroll_records, chunk_size=500, progress_callback=None):
+        """
+        Insert many payroll records using multi-row inserts, one transaction per chunk
+
+        Args:
+            payroll_records (list): Calculated payroll dicts (same keys as add_payroll)
+            chunk_size (int): Rows per INSERT/transaction
+            progress_callback (callable): Called as progress_callback(inserted, total) after each chunk
+
+        Returns:
+            tuple: (success: bool, inserted: int, message: str)
+        """
+        insert_query = """
+            INSERT INTO payroll 
+            (employee_id, month, year, base_salary, bonus, deductions, 
+             net_salary, present_days, status, notes, processed_date, released_date)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        """
+        total = len(payroll_records)
+        inserted = 0
+
         try:
-            check_query = """
-                SELECT COUNT(*) as count 
-                FROM INFORMATION_SCHEMA.COLUMNS 
-                WHERE TABLE_SCHEMA = %s 
-                AND TABLE_NAME = 'payroll' 
-                AND COLUMN_NAME = 'released_date'
-            """
-            self.cursor.execute(check_query, (self.database,))
-            result = self.cursor.fetchone()
+            for start in range(0, total, chunk_size):
+                chunk = payroll_records[start:start + chunk_size]
+                rows = [(
+                    record['employee_id'],
+                    record['month'],
+                    record['year'],
+                    record['base_salary'],
+                    record['bonus'],
+                    record['deductions'],
+                    record['net_salary'],
+                    record['present_days'],
+                    record.get('status', 'Pending'),
+                    record['notes'],
+                    record['processed_date'],
+                    record.get('released_date')
+                ) for record in chunk]
+
+                with self.checkout() as (connection, cursor):
+                    # executemany folds INSERT ... VALUES into a single multi-row statement
+                    cursor.executemany(insert_query, rows)
+                    connection.commit()
+
+                self._notify_change('payroll_batch_added', records=chunk)
+
+                inserted += len(chunk)
+                if progress_callback:
+                    progress_callback(inserted, total)
+
+            print(f"[DB] Inserted {inserted} payroll records")
+            return (True, inserted, f"{inserted} payroll records added successfully")
 
-            if result['count'] == 0:
-                alter_query = "ALTER TABLE payroll ADD COLUMN released_date DATETIME NULL"
-                self.cursor.execute(alter_query)
-                self.connection.commit()
-                print("[DB] Added released_date column to payroll table")
         except Error as e:
-            print(f"[DB WARNING] Could not verify/add released_date column: {e}")
+            print(f"[DB ERROR] Failed to add payroll batch after {inserted} records: {e}")
+            return (False, inserted, f"Database error after {inserted} of {total} records: {str(e)}")
+
+    def get_payroll_summary(self, month=None, year=None, department=None, status=None):
+        """
+        Payroll totals computed by one aggregate query
+
+        Args:
+            month (int): Optional month number (1-12)
+            year (int): Optional year
+            department (str): Optional employee department
+            status (str): Optional payroll status
+
+        Returns:
+            dict: total_records, total_amount (Decimal), pending_count, released_count
+        """
+        conditions = []
+        params = []
+
+        if month:
+            # Older records store the month name instead of its number
+            conditions.append("p.month IN (%s, %s)")
+            params.extend([str(month), calendar.month_name[int(month)]])
+
+        if year:
+            conditions.append("p.year = %s")
+            params.append(year)
+
+        if status:
+            conditions.append("p.status = %s")
+            params.append(status)
+
+        join = ""
+        if department:
+            join = "JOIN employees e ON p.employee_id = e.Employee_ID"
+            conditions.append("e.Department = %s")
+            params.append(department)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        query = f"""
+            SELECT 
+                COUNT(*) AS total_records,
+                COALESCE(SUM(p.net_salary), 0) AS total_amount,
+                COALESCE(SUM(p.status = 'Pending'), 0) AS pending_count,
+                COALESCE(SUM(p.status = 'Released'), 0) AS released_count
+            FROM payroll p
+            {join}
+            {where}
+        """
 
-    def get_all_payroll(self):
-        """Retrieve all payroll records with employee information"""
         try:
-            if not self.is_connected():
-                self.connect()
+            with self.checkout() as (connection, cursor):
+                cursor.execute(query, params)
+                row = cursor.fetchone()
+
+            return {
+                'total_records': int(row['total_records']),
+                'total_amount': Decimal(row['total_amount']).quantize(Decimal('0.01')),
+                'pending_count': int(row['pending_count']),
+                'released_count': int(row['released_count'])
+            }
+
+        except Error as e:
+            print(f"[DB ERROR] Failed to summarize payroll: {e}")
+            return {
+                'total_records': 0,
+                'total_amount': Decimal('0.00'),
+                'pending_count': 0,
+                'released_count': 0
+            }
+
+    def check_payroll_summary(self):
+        """
+        Compare get_payroll_summary() against totals computed row by row in Python
+
+        The Python side is the summary as it used to be built: every payroll
+        row read back, counted, summed and counted again per status, with
+        the sum kept exact in Decimal. Both are compared for the whole table,
+        for each status and for each pay period.
+
+        Returns:
+            list: One dict per differing filter with 'filter', 'expected' (Python)
+                  and 'actual' (SQL) summaries
+        """
+        month_numbers = {name: number for number, name in enumerate(calendar.month_name) if name}
+
+        def empty():
+            return {'total_records': 0, 'total_amount': Decimal('0.00'), 'pending_count': 0, 'released_count': 0}
+
+        expected = {}
+        try:
+            for row in self.iter_all_payroll():
+                month = str(row['month'])
+                month = int(month) if month.isdigit() else month_numbers.get(month)
+                status = row.get('status')
+                filters = [()]
+                if status:
+                    filters.append((('status', status),))
+                if month and row['year']:
+                    filters.append((('month', month), ('year', int(row['year']))))
+                for key in filters:
+                    summary = expected.setdefault(key, empty())
+                    summary['total_records'] += 1
+                    summary['total_amount'] += Decimal(row.get('net_salary') or 0)
+                    summary['pending_count'] += status == 'Pending'
+                    summary['released_count'] += status == 'Released'
+
+        except Error as e:
+            print(f"[DB ERROR] Failed to check payroll summary: {e}")
+            return [{'error': str(e)}]
+
+        expected.setdefault((), empty())
+        problems = []
+        for key in sorted(expected, key=lambda key: (len(key), str(key))):
+            python_summary = expected[key]
+            python_summary['total_amount'] = python_summary['total_amount'].quantize(Decimal('0.01'))
+            sql_summary = self.get_payroll_summary(**dict(key))
+            if sql_summary != python_summary:
+                problems.append({'filter': dict(key), 'expected': python_summary, 'actual': sql_summary})
+
+        print(f"[DB] Payroll summary check: {len(problems)} differences in {len(expected)} summaries")
+        return problems
+
+    def get_processed_employee_ids(self, month, year):
+        """
+        Get the employees that already have a payroll record for a period
+
+        Args:
+            month (int): Month number (1-12)
+            year (int): Year
 
+        Returns:
+            set: Employee IDs with payroll for the period
+        """
+        try:
+            # Older records store the month name instead of its number
             query = """
-                SELECT 
-                    p.*,
-                    e.FullName as employee_name,
-                    e.Position as position
-                FROM payroll p
-                LEFT JOIN employees e ON p.employee_id = e.Employee_ID
-                ORDER BY p.processed_date DESC
+                SELECT DISTINCT employee_id
+                FROM payroll
+                WHERE year = %s AND month IN (%s, %s)
             """
-            self.cursor.execute(query)
-            payroll_records = self.cursor.fetchall()
+            with self.checkout() as (connection, cursor):
+                cursor.execute(query, (year, str(month), calendar.month_name[int(month)]))
+                rows = cursor.fetchall()
+
+            return {row['employee_id'] for row in rows}
+
+        except Error as e:
+            print(f"[DB ERROR] Failed to retrieve processed employees: {e}")
+            return set()
+
+    def get_all_payroll(self):
+        """Retrieve all payroll records with employee information (as read-only Records; see fetch_records())"""
+        try:
+            payroll_records = self.fetch_records(ALL_PAYROLL_QUERY)
 
             print(f"[DB] Retrieved {len(payroll_records)} payroll records")
             return payroll_records if payroll_records else []
@@ -681,12 +1448,21 @@ class DatabaseConnection:
             print(f"[DB ERROR] Failed to retrieve payroll: {e}")
             return []
 
+    def iter_all_payroll(self, batch_size=RECORD_BATCH_SIZE):
+        """
+        Stream all payroll records with employee information, without loading them all
+
+        Yields:
+            Record: Payroll record, newest first
+
+        Raises:
+            Error: If the query fails
+        """
+        return self.iter_records(ALL_PAYROLL_QUERY, batch_size=batch_size)
+
     def get_employee_payroll(self, employee_id):
         """Retrieve payroll records for a specific employee"""
         try:
-            if not self.is_connected():
-                self.connect()
-
             query = """
                 SELECT 
                     p.*,
@@ -697,8 +1473,9 @@ class DatabaseConnection:
                 WHERE p.employee_id = %s
                 ORDER BY p.year DESC, p.month DESC
             """
-            self.cursor.execute(query, (employee_id,))
-            payroll_records = self.cursor.fetchall()
+            with self.checkout() as (connection, cursor):
+                cursor.execute(query, (employee_id,))
+                payroll_records = cursor.fetchall()
 
             print(f"[DB] Retrieved {len(payroll_records)} payroll records for employee {employee_id}")
             return payroll_records if payroll_records else []
@@ -710,32 +1487,537 @@ class DatabaseConnection:
     def delete_payroll(self, payroll_id):
         """Delete a payroll record"""
         try:
-            if not self.is_connected():
-                self.connect()
+            with self.checkout() as (connection, cursor):
+                cursor.execute(
+                    "SELECT id, employee_id, month, year, net_salary, status FROM payroll WHERE id = %s",
+                    (payroll_id,)
+                )
+                previous = cursor.fetchone()
+
+                query = "DELETE FROM payroll WHERE id = %s"
+                cursor.execute(query, (payroll_id,))
+                connection.commit()
 
-            query = "DELETE FROM payroll WHERE id = %s"
-            self.cursor.execute(query, (payroll_id,))
-            self.connection.commit()
+            if previous:
+                self._notify_change('payroll_deleted', payroll_id=payroll_id, previous=previous)
 
             print(f"[DB] Payroll record {payroll_id} deleted successfully")
             return (True, "Payroll record deleted successfully")
 
         except Error as e:
             print(f"[DB ERROR] Failed to delete payroll: {e}")
-            if self.connection:
-                self.connection.rollback()
             return (False, f"Database error: {str(e)}")
 
+    def update_payroll_status(self, payroll_id, status, released_date=None):
+        """
+        Change the status of a payroll record
+
+        Args:
+            payroll_id (int): Payroll record ID
+            status (str): New status (Pending, Released, Canceled)
+            released_date (str or datetime): Release timestamp, stored only when releasing
+
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        try:
+            with self.checkout() as (connection, cursor):
+                if released_date and status == 'Released':
+                    query = "UPDATE payroll SET status = %s, released_date = %s WHERE id = %s"
+                    cursor.execute(query, (status, released_date, payroll_id))
+                else:
+                    query = "UPDATE payroll SET status = %s WHERE id = %s"
+                    cursor.execute(query, (status, payroll_id))
+                connection.commit()
+
+            self._notify_change('payroll_status_changed', payroll_id=payroll_id, status=status,
+                                released_date=released_date)
+
+            print(f"[DB] Payroll record {payroll_id} status changed to {status}")
+            return (True, f"Payroll status changed to: {status}")
+
+        except Error as e:
+            print(f"[DB ERROR] Failed to update payroll status: {e}")
+            return (False, f"Database error: {str(e)}")
+
+    # Attendance methods
+    def get_attendance_records(self, employee_id=None):
+        """
+        Retrieve attendance records with employee name and position, newest first
+
+        Args:
+            employee_id (str): Optional employee to restrict to
+
+        Returns:
+            list: Attendance records (read-only Records; see fetch_records())
+        """
+        try:
+            query = """
+                SELECT a.*, e.FullName AS employee_name, e.Position AS position,
+                       e.Department AS department
+                FROM attendance a
+                LEFT JOIN employees e ON a.employee_id = e.Employee_ID
+            """
+            params = ()
+            if employee_id:
+                query += " WHERE a.employee_id = %s"
+                params = (employee_id,)
+            query += " ORDER BY a.date DESC, a.clock_in DESC"
+
+            records = self.fetch_records(query, params)
+
+            print(f"[DB] Retrieved {len(records)} attendance records")
+            return records
+
+        except Error as e:
+            print(f"[DB ERROR] Failed to retrieve attendance: {e}")
+            return []
+
+    def add_attendance(self, attendance_data):
+        """
+        Add an attendance record, replacing any record for the same employee and date
+
+        Args:
+            attendance_data (dict): employee_id, date, clock_in, clock_out, status
+
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        try:
+            query = """
+                INSERT INTO attendance (employee_id, date, clock_in, clock_out, status)
+                VALUES (%s, %s, %s, %s, %s)
+                ON DUPLICATE KEY UPDATE
+                    clock_in = VALUES(clock_in),
+                    clock_out = VALUES(clock_out),
+                    status = VALUES(status)
+            """
+            with self.checkout() as (connection, cursor):
+                cursor.execute(query, (
+                    attendance_data['employee_id'],
+                    attendance_data['date'],
+                    attendance_data.get('clock_in'),
+                    attendance_data.get('clock_out'),
+                    attendance_data.get('status', 'Present')
+                ))
+                self._refresh_attendance_month(cursor, attendance_data['employee_id'], attendance_data['date'])
+                connection.commit()
+
+            self._notify_change('attendance_saved', employee_id=attendance_data['employee_id'],
+                                record=attendance_data)
+
+            print(f"[DB] Attendance saved for {attendance_data['employee_id']} on {attendance_data['date']}")
+            return (True, "Attendance record added successfully!")
+
+        except Error as e:
+            print(f"[DB ERROR] Failed to add attendance: {e}")
+            return (False, f"Database error: {str(e)}")
+
+    def delete_attendance(self, attendance_id):
+        """
+        Delete an attendance record
+
+        Args:
+            attendance_id (int): Attendance record ID
+
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        try:
+            with self.checkout() as (connection, cursor):
+                cursor.execute(
+                    "SELECT id, employee_id, date, status FROM attendance WHERE id = %s",
+                    (attendance_id,)
+                )
+                previous = cursor.fetchone()
+
+                cursor.execute("DELETE FROM attendance WHERE id = %s", (attendance_id,))
+                if previous:
+                    self._refresh_attendance_month(cursor, previous['employee_id'], previous['date'])
+                connection.commit()
+
+            if previous:
+                self._notify_change('attendance_deleted', employee_id=previous['employee_id'],
+                                    previous=previous)
+
+            print(f"[DB] Attendance record {attendance_id} deleted successfully")
+            return (True, "Attendance record deleted successfully!")
+
+        except Error as e:
+            print(f"[DB ERROR] Failed to delete attendance: {e}")
+            return (False, f"Database error: {str(e)}")
+
+    def _refresh_attendance_month(self, cursor, employee_id, day):
+        """
+        Recompute one employee's attendance_monthly row for the month containing day
+
+        Runs on the caller's cursor so the rollup commits together with the
+        attendance change. Only that employee's records for the month are read.
+        """
+        if isinstance(day, str):
+            day = datetime.strptime(day[:10], '%Y-%m-%d').date()
+        self._refresh_attendance_months(cursor, {(day.year, day.month): {employee_id}})
+
+    def _refresh_attendance_months(self, cursor, employees_by_month):
+        """
+        Recompute attendance_monthly rows for several employees and months
+
+        Args:
+            cursor: Cursor of the transaction that changed the attendance rows
+            employees_by_month (dict): {(year, month): set of employee IDs}
+        """
+        if not self.schema.has_table('attendance_monthly'):
+            return
+
+        for (year, month), employee_ids in employees_by_month.items():
+            employee_ids = list(employee_ids)
+            first_day, last_day = month_date_range(month, year)
+            placeholders = ', '.join(['%s'] * len(employee_ids))
+
+            cursor.execute(
+                f"DELETE FROM attendance_monthly WHERE year = %s AND month = %s "
+                f"AND employee_id IN ({placeholders})",
+                (year, month, *employee_ids)
+            )
+            select = ATTENDANCE_MONTHLY_SELECT.format(
+                where=f"WHERE employee_id IN ({placeholders}) AND date BETWEEN %s AND %s"
+            )
+            cursor.execute(ATTENDANCE_MONTHLY_INSERT.format(select=select), (*employee_ids, first_day, last_day))
+
+    def rebuild_attendance_monthly(self):
+        """
+        Rebuild the whole attendance_monthly rollup from the attendance table
+
+        Returns:
+            tuple: (success: bool, rows: int, message: str)
+        """
+        try:
+            with self.checkout() as (connection, cursor):
+                cursor.execute("DELETE FROM attendance_monthly")
+                cursor.execute(ATTENDANCE_MONTHLY_INSERT.format(select=ATTENDANCE_MONTHLY_SELECT.format(where='')))
+                rows = cursor.rowcount
+                connection.commit()
+
+            print(f"[DB] Rebuilt attendance_monthly with {rows} rows")
+            return (True, rows, f"Rebuilt {rows} monthly attendance rows")
+
+        except Error as e:
+            print(f"[DB ERROR] Failed to rebuild attendance_monthly: {e}")
+            return (False, 0, f"Database error: {str(e)}")
+
+    def check_attendance_monthly(self):
+        """
+        Compare the attendance_monthly rollup against the attendance table
+
+        Returns:
+            list: One dict per differing (employee_id, year, month) with 'expected'
+                  and 'actual' counts (None when the row is missing on that side)
+        """
+        columns = ('present_days', 'late_days', 'half_days', 'absent_days', 'worked_minutes')
+        try:
+            with self.checkout() as (connection, cursor):
+                cursor.execute(ATTENDANCE_MONTHLY_SELECT.format(where=''))
+                expected_rows = cursor.fetchall()
+                cursor.execute(f"SELECT employee_id, year, month, {', '.join(columns)} FROM attendance_monthly")
+                actual_rows = cursor.fetchall()
+
+        except Error as e:
+            print(f"[DB ERROR] Failed to check attendance_monthly: {e}")
+            return [{'error': str(e)}]
+
+        def keyed(rows):
+            return {
+                (row['employee_id'], int(row['year']), int(row['month'])): tuple(int(row[c]) for c in columns)
+                for row in rows
+            }
+
+        expected, actual = keyed(expected_rows), keyed(actual_rows)
+        problems = []
+        for key in sorted(set(expected) | set(actual)):
+            if expected.get(key) != actual.get(key):
+                problems.append({
+                    'employee_id': key[0], 'year': key[1], 'month': key[2],
+                    'expected': dict(zip(columns, expected[key])) if key in expected else None,
+                    'actual': dict(zip(columns, actual[key])) if key in actual else None
+                })
+
+        print(f"[DB] attendance_monthly check: {len(problems)} differences in {len(expected)} months")
+        return problems
+
+    def get_attendance_monthly(self, month, year, employee_ids=None):
+        """
+        Rolled-up attendance for every employee in a month, one row each
+
+        Args:
+            month (int): Month number (1-12)
+            year (int): Year
+            employee_ids (list): Optional employees to restrict to
+
+        Returns:
+            dict: {employee_id: {'present', 'late', 'half_day', 'absent', 'worked_minutes', 'days'}}
+        """
+        try:
+            query = """
+                SELECT employee_id, present_days, late_days, half_days, absent_days, worked_minutes
+                FROM attendance_monthly
+                WHERE year = %s AND month = %s
+            """
+            params = [int(year), int(month)]
+            if employee_ids:
+                placeholders = ', '.join(['%s'] * len(employee_ids))
+                query += f" AND employee_id IN ({placeholders})"
+                params.extend(employee_ids)
+
+            with self.checkout() as (connection, cursor):
+                cursor.execute(query, tuple(params))
+                rows = cursor.fetchall()
+
+            return {
+                row['employee_id']: {
+                    'present': row['present_days'],
+                    'late': row['late_days'],
+                    'half_day': row['half_days'],
+                    'absent': row['absent_days'],
+                    'worked_minutes': row['worked_minutes'],
+                    'days': row['present_days'] + row['late_days'] + row['half_days']
+                }
+                for row in rows
+            }
+
+        except Error as e:
+            print(f"[DB ERROR] Failed to retrieve monthly attendance: {e}")
+            return {}
+
+    def upsert_attendance_batch(self, records):
+        """
+        Insert or replace many attendance records in one transaction
+
+        Args:
+            records (list): Tuples of (employee_id, date, clock_in, clock_out, status),
+                            date as a datetime.date
+
+        Returns:
+            tuple: (success: bool, count: int, message: str)
+        """
+        if not records:
+            return (True, 0, "No attendance records to import")
+
+        try:
+            query = """
+                INSERT INTO attendance (employee_id, date, clock_in, clock_out, status)
+                VALUES (%s, %s, %s, %s, %s)
+                ON DUPLICATE KEY UPDATE
+                    clock_in = VALUES(clock_in),
+                    clock_out = VALUES(clock_out),
+                    status = VALUES(status)
+            """
+            employees_by_month = {}
+            for record in records:
+                employees_by_month.setdefault((record[1].year, record[1].month), set()).add(record[0])
+
+            with self.checkout() as (connection, cursor):
+                cursor.executemany(query, records)
+                self._refresh_attendance_months(cursor, employees_by_month)
+                connection.commit()
+
+            self._notify_change('attendance_imported', count=len(records))
+            return (True, len(records), f"Imported {len(records)} attendance records")
+
+        except Error as e:
+            print(f"[DB ERROR] Failed to import attendance batch: {e}")
+            return (False, 0, f"Database error: {str(e)}")
+
+    def get_attendance_breakdown(self, month, year, employee_ids=None):
+        """
+        Worked-day counts by status for every employee in a month
+
+        Read from the attendance_monthly rollup when it exists; otherwise one
+        range query over attendance.date (so idx_date applies) grouped by
+        employee, instead of a COUNT per employee.
+
+        Args:
+            month (int): Month number (1-12)
+            year (int): Year
+            employee_ids (list): Optional employees to restrict to
+
+        Returns:
+            dict: {employee_id: {'present': int, 'late': int, 'half_day': int, 'days': int}}
+        """
+        if self.schema.has_table('attendance_monthly'):
+            # Maintained rollup: one row per employee instead of the daily records
+            return self.get_attendance_monthly(month, year, employee_ids)
+
+        try:
+            first_day, last_day = month_date_range(month, year)
+            query = """
+                SELECT employee_id,
+                       SUM(status = 'Present') AS present,
+                       SUM(status = 'Late') AS late,
+                       SUM(status = 'Half Day') AS half_day
+                FROM attendance
+                WHERE date BETWEEN %s AND %s
+                  AND status IN ('Present', 'Late', 'Half Day')
+            """
+            params = [first_day, last_day]
+            if employee_ids:
+                placeholders = ', '.join(['%s'] * len(employee_ids))
+                query += f" AND employee_id IN ({placeholders})"
+                params.extend(employee_ids)
+            query += " GROUP BY employee_id"
+
+            with self.checkout() as (connection, cursor):
+                cursor.execute(query, tuple(params))
+                rows = cursor.fetchall()
+
+            breakdown = {}
+            for row in rows:
+                present, late, half_day = int(row['present']), int(row['late']), int(row['half_day'])
+                breakdown[row['employee_id']] = {
+                    'present': present,
+                    'late': late,
+                    'half_day': half_day,
+                    'days': present + late + half_day
+                }
+            return breakdown
+
+        except Error as e:
+            print(f"[DB ERROR] Failed to retrieve attendance breakdown: {e}")
+            return {}
+
+    def get_attendance_counts(self, month, year):
+        """
+        Count worked days (Present, Late, Half Day) for every employee in a month
+
+        Args:
+            month (int): Month number (1-12)
+            year (int): Year
+
+        Returns:
+            dict: {employee_id: days}
+        """
+        breakdown = self.get_attendance_breakdown(month, year)
+        return {employee_id: counts['days'] for employee_id, counts in breakdown.items()}
+
+    def get_attendance_count(self, employee_id, month=None, year=None):
+        """
+        Count worked days (Present, Late, Half Day) for one employee
+
+        Use get_attendance_counts() when counting for many employees.
+
+        Args:
+            employee_id (str): Employee ID
+            month (int): Optional month number (1-12), used together with year
+            year (int): Optional year
+
+        Returns:
+            int: Number of worked days
+        """
+        if month and year:
+            counts = self.get_attendance_breakdown(month, year, [employee_id])
+            return counts.get(employee_id, {}).get('days', 0)
+
+        try:
+            query = """
+                SELECT COUNT(*) as days
+                FROM attendance
+                WHERE employee_id = %s
+                  AND status IN ('Present', 'Late', 'Half Day')
+            """
+            with self.checkout() as (connection, cursor):
+                cursor.execute(query, (employee_id,))
+                result = cursor.fetchone()
+
+            return result['days'] if result else 0
+
+        except Error as e:
+            print(f"[DB ERROR] Failed to count attendance: {e}")
+            return 0
+
+
+def normalize_employee_data(employee_data):
+    """
+    Clean and validate new-employee input the way add_employee() expects it
+
+    Args:
+        employee_data (dict): Employee information as entered or imported
+
+    Returns:
+        tuple: (employee: dict or None, error: str or None)
+    """
+    try:
+        employee = {
+            'username': (employee_data.get('username') or '').strip(),
+            'password': (employee_data.get('password') or '').strip(),
+            'full_name': (employee_data.get('full_name') or '').strip(),
+            'email': (employee_data.get('email') or '').strip().lower(),
+            'role': (employee_data.get('role') or 'Employee').strip(),
+            'position': (employee_data.get('position') or '').strip(),
+            'salary': float(employee_data.get('salary') or 0),
+            'department': (employee_data.get('department') or '').strip(),
+            'phone': (employee_data.get('phone') or '').strip(),
+            'address': (employee_data.get('address') or '').strip(),
+            'date_hired': employee_data.get('date_hired') or datetime.now().strftime('%Y-%m-%d'),
+        }
+    except (TypeError, ValueError) as e:
+        return (None, f"Invalid data format: {str(e)}")
+
+    if not employee['username']:
+        return (None, "Username is required")
+
+    if not employee['password']:
+        return (None, "Password is required")
+
+    if len(employee['password']) < 6:
+        return (None, "Password must be at least 6 characters long")
+
+    if not all([employee['full_name'], employee['email'], employee['position'], employee['department']]):
+        return (None, "Missing required fields")
+
+    if "@" not in employee['email'] or "." not in employee['email']:
+        return (None, "Invalid email format")
+
+    employee['account_role'] = 'admin' if employee['role'].lower() == 'admin' else 'employee'
+    return (employee, None)
+
+
+def month_date_range(month, year):
+    """
+    First and last day of a month
+
+    Args:
+        month (int): Month number (1-12)
+        year (int): Year
+
+    Returns:
+        tuple: (first_day: date, last_day: date)
+    """
+    month, year = int(month), int(year)
+    return (date(year, month, 1), date(year, month, calendar.monthrange(year, month)[1]))
+
 
 # Singleton instance for global access
 _db_instance = None
 
+# Pool size for the shared instance; set PAYEASE_DB_POOL_SIZE=0 to use a single connection
+DEFAULT_POOL_SIZE = int(os.environ.get('PAYEASE_DB_POOL_SIZE', '5'))
 
-def get_db_connection():
-    """Get or create a database connection instance"""
+
+def get_db_connection(pool_size=None):
+    """
+    Get or create a database connection instance
+
+    Args:
+        pool_size (int): Pool size used when the instance is first created
+                         (defaults to DEFAULT_POOL_SIZE)
+    """
     global _db_instance
     if _db_instance is None:
-        _db_instance = DatabaseConnection()
+        size = DEFAULT_POOL_SIZE if pool_size is None else pool_size
+        _db_instance = DatabaseConnection(pool_size=size or None)
+
+        # Record data changes in the dashboard activity feed
+        from Model.activity_log import ActivityLog
+        _db_instance.add_change_listener(ActivityLog(_db_instance).on_change)
     return _db_instance
 
 
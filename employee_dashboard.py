@@ -8,6 +8,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont, QColor
 from Model.database import get_db_connection
+from Model.session_cache import start_session, end_session
 
 
 class EmployeeDashboard(QMainWindow):
@@ -24,7 +25,9 @@ class EmployeeDashboard(QMainWindow):
         if not self.db.is_connected():
             self.db.connect()
 
-        # Load fresh employee data from database
+        # Profile and payslips come from the session cache after the first load
+        employee_id = self.user_info.get('employee_id')
+        self.session = start_session(employee_id, self.db) if employee_id and employee_id != 'N/A' else None
         self.load_employee_data()
 
         self.setStyleSheet("""
@@ -37,9 +40,8 @@ class EmployeeDashboard(QMainWindow):
 
     def load_employee_data(self):
         """Load current employee data from database"""
-        employee_id = self.user_info.get('employee_id')
-        if employee_id and employee_id != 'N/A':
-            employee = self.db.get_employee_by_id(employee_id)
+        if self.session:
+            employee = self.session.profile()
             if employee:
                 # Update user_info with fresh data
                 self.user_info.update({
@@ -406,12 +408,8 @@ class EmployeeDashboard(QMainWindow):
         title.setStyleSheet("color: #000000; font-size: 16px; font-weight: bold; background: transparent;")
         layout.addWidget(title)
 
-        # Get payroll records from database
-        employee_id = self.user_info.get('employee_id')
-        payroll_records = []
-
-        if employee_id and employee_id != 'N/A':
-            payroll_records = self.db.get_employee_payroll(employee_id)
+        # Get payroll records (cached for the session)
+        payroll_records = self.session.payslips() if self.session else []
 
         if payroll_records:
             for record in payroll_records:
@@ -582,6 +580,8 @@ Notes: {record.get('notes', 'No additional notes')}
         )
 
         if reply == QMessageBox.StandardButton.Yes:
+            end_session()
+
             # Import and show login window
             from View.windows.login_window import LoginWindow
             self.login_window = LoginWindow()
@@ -1,13 +1,18 @@
 import sys
+import time
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QPushButton, QFrame, QTableWidget, QTableWidgetItem,
+    QLabel, QPushButton, QFrame, QTableView, QStyledItemDelegate,
     QLineEdit, QComboBox, QMessageBox, QHeaderView, QDialog,
     QScrollArea, QCheckBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont, QColor
-from Model.database import get_db_connection
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QAbstractTableModel, QModelIndex, QSortFilterProxyModel,
+    QEvent, QRect, QTimer
+)
+from PyQt6.QtGui import QFont, QColor, QPainter
+from Model.database import get_db_connection, EMPLOYEE_PAGE_SIZE
+from Model.employee_search import PrefixIndex
 
 """employee_management.py - Improved version"""
 
@@ -366,6 +371,432 @@ class AddEmployeeDialog(QDialog):
         }
 
 
+def format_employee_id(emp_id, row):
+    """Display form of an Employee_ID (numeric ids become E001, E002, ...)"""
+    if emp_id and str(emp_id) != '0':
+        if isinstance(emp_id, int) or (isinstance(emp_id, str) and emp_id.isdigit()):
+            return f"E{int(emp_id):03d}"
+        return str(emp_id)
+    return f"E{row + 1:03d}"
+
+
+def employee_id_sort_key(display_id):
+    """
+    Sort key putting IDs in number order, as id_order() does in SQL
+
+    A plain string sort puts E1000 before E999; prefixing the length makes
+    a longer (larger) ID sort after every shorter one.
+    """
+    return f"{len(display_id):04d}{display_id}"
+
+
+def clean_text(value):
+    """Blank out the '0' placeholders found in legacy rows"""
+    return str(value) if value and str(value) != '0' else ''
+
+
+def employee_key(employee):
+    """Employee_ID of a record as a string (rows from older code may use 'id')"""
+    return str(employee.get('Employee_ID') or employee.get('id') or '')
+
+
+class EmployeeTableModel(QAbstractTableModel):
+    """
+    Employees for the management table.
+
+    Only the rows the view asks for are rendered, so the cost of showing the
+    table no longer grows with the number of employees. Display strings are
+    built once per row when a page arrives. When the view scrolls to the end
+    it calls fetchMore(), which asks fetch_page for the next page.
+
+    Name and email words of the loaded rows are kept in a PrefixIndex for
+    type-ahead search. It is built the first time a search needs it, then
+    updated with every page and every single-row change.
+    """
+
+    HEADERS = ["ID", "FULL NAME", "EMAIL", "ROLE", "POSITION", "DEPARTMENT", "ACTIONS"]
+    ACTIONS_COLUMN = 6
+    ROLE_COLUMN = 3
+
+    ROLE_COLORS = {'ADMIN': QColor('#DC2626'), 'MANAGER': QColor('#2563EB')}
+    DEFAULT_ROLE_COLOR = QColor('#059669')
+    EMPTY_COLOR = QColor('#6B7280')
+
+    def __init__(self, fetch_page=None, parent=None):
+        """
+        Initialize model
+
+        Args:
+            fetch_page (callable): Returns (employees, has_more) for the next page
+            parent (QObject): Qt parent
+        """
+        super().__init__(parent)
+        self._fetch_page = fetch_page
+        self._employees = []
+        self._display = []
+        self._keys = []
+        self._rows = {}  # employee key -> row
+        self._has_more = False
+        self.empty_message = ""
+        self._index = PrefixIndex()
+        self._index_built = False
+        self.index_version = 0  # Bumped whenever the rows behind the index change
+
+        self._bold_font = QFont("Arial", 12, QFont.Weight.Bold)
+        self._empty_font = QFont("Arial", 13)
+        self._empty_font.setItalic(True)
+
+    def reset(self, employees, has_more=False, empty_message=""):
+        """Replace every row"""
+        self.beginResetModel()
+        self._employees = []
+        self._display = []
+        self._keys = []
+        self._rows = {}
+        self._has_more = has_more
+        self.empty_message = empty_message
+        self._extend(employees)
+        self._index_built = False
+        self.index_version += 1
+        self.endResetModel()
+
+    def append(self, employees, has_more=False):
+        """Add a page of rows at the end"""
+        self._has_more = has_more
+        if not employees:
+            return
+        if not self._employees:
+            self.reset(employees, has_more, self.empty_message)
+            return
+        first = len(self._employees)
+        self.beginInsertRows(QModelIndex(), first, first + len(employees) - 1)
+        self._extend(employees)
+        if self._index_built:
+            self._index.extend(self._document(employee) for employee in employees)
+        self.index_version += 1
+        self.endInsertRows()
+
+    def insert_employee(self, employee, row=0):
+        """Add one row (row 0 = top, where the newest employee belongs)"""
+        if not self._employees:
+            self.reset([employee], self._has_more, self.empty_message)
+            return
+        row = max(0, min(row, len(self._employees)))
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._employees.insert(row, employee)
+        self._display.insert(row, self._display_row(employee, row))
+        self._keys.insert(row, employee_key(employee))
+        self._renumber(row)
+        if self._index_built:
+            self._index.add(*self._document(employee))
+        self.index_version += 1
+        self.endInsertRows()
+
+    def update_employee(self, employee):
+        """
+        Replace the row holding this employee
+
+        Returns:
+            bool: False if the employee is not loaded
+        """
+        row = self._rows.get(employee_key(employee))
+        if row is None:
+            return False
+        self._employees[row] = employee
+        self._display[row] = self._display_row(employee, row)
+        if self._index_built:
+            self._index.add(*self._document(employee))
+        self.index_version += 1
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+        return True
+
+    def remove_employee(self, employee_id):
+        """
+        Remove the row holding this employee
+
+        Returns:
+            bool: False if the employee is not loaded
+        """
+        key = str(employee_id)
+        row = self._rows.get(key)
+        if row is None:
+            return False
+        if len(self._employees) == 1:
+            self.reset([], self._has_more, self.empty_message)
+            return True
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._employees[row]
+        del self._display[row]
+        del self._keys[row]
+        del self._rows[key]
+        self._renumber(row)
+        if self._index_built:
+            self._index.remove(key)
+        self.index_version += 1
+        self.endRemoveRows()
+        return True
+
+    def find_row(self, employee_id):
+        """Source row of a loaded employee, or None"""
+        return self._rows.get(str(employee_id))
+
+    def match(self, text):
+        """
+        Keys of loaded employees whose name/email words start with every word of text
+
+        Returns:
+            set: Employee keys, or None when text has no words (everything matches)
+        """
+        if not self._index_built:
+            self._index.reset(self._document(employee) for employee in self._employees)
+            self._index_built = True
+        return self._index.match(text)
+
+    def key(self, row):
+        """Employee key of a source row"""
+        return self._keys[row] if 0 <= row < len(self._keys) else None
+
+    def _extend(self, employees):
+        """Store rows with their display strings"""
+        for employee in employees:
+            row = len(self._employees)
+            key = employee_key(employee)
+            self._employees.append(employee)
+            self._display.append(self._display_row(employee, row))
+            self._keys.append(key)
+            self._rows[key] = row
+
+    def _renumber(self, first):
+        """Refresh the key -> row map from first onwards after an insert or removal"""
+        for row in range(first, len(self._keys)):
+            self._rows[self._keys[row]] = row
+
+    @staticmethod
+    def _display_row(employee, row):
+        """Display strings for one employee"""
+        role = employee.get('Role') or employee.get('role', '') or ''
+        return (
+            format_employee_id(employee.get('Employee_ID') or employee.get('id', ''), row),
+            clean_text(employee.get('FullName') or employee.get('full_name', '')),
+            clean_text(employee.get('Email') or employee.get('email', '')),
+            clean_text(role).upper(),
+            clean_text(employee.get('Position') or employee.get('position', '')),
+            clean_text(employee.get('Department') or employee.get('department', '')),
+            ''
+        )
+
+    @staticmethod
+    def _document(employee):
+        """(key, name, email) for the search index"""
+        return (employee_key(employee),
+                clean_text(employee.get('FullName') or employee.get('full_name', '')),
+                clean_text(employee.get('Email') or employee.get('email', '')))
+
+    def employee(self, row):
+        """Employee record for a source row, or None for the empty-state row"""
+        if 0 <= row < len(self._employees):
+            return self._employees[row]
+        return None
+
+    def is_empty(self):
+        """True when the model only holds the empty-state message"""
+        return not self._employees
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        if not self._employees:
+            return 1 if self.empty_message else 0
+        return len(self._employees)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        if not self._employees:
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+
+        if not self._employees:
+            if column != 0:
+                return None
+            if role == Qt.ItemDataRole.DisplayRole:
+                return self.empty_message
+            if role == Qt.ItemDataRole.TextAlignmentRole:
+                return Qt.AlignmentFlag.AlignCenter
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return self.EMPTY_COLOR
+            if role == Qt.ItemDataRole.FontRole:
+                return self._empty_font
+            return None
+
+        if role == Qt.ItemDataRole.UserRole and column == 0:
+            return employee_id_sort_key(self._display[row][0])
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.UserRole):
+            return self._display[row][column]
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter
+        if role == Qt.ItemDataRole.FontRole and column in (0, 1):
+            return self._bold_font
+        if role == Qt.ItemDataRole.ForegroundRole and column == self.ROLE_COLUMN:
+            return self.ROLE_COLORS.get(self._display[row][column], self.DEFAULT_ROLE_COLOR)
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._has_more and self._fetch_page is not None
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        self._has_more = False  # Guard against re-entry while the page loads
+        employees, has_more = self._fetch_page()
+        self.append(employees, has_more)
+
+
+class EmployeeFilterProxyModel(QSortFilterProxyModel):
+    """
+    Sorts the loaded rows and narrows them to a name/email search at once
+
+    The search is answered by the source model's prefix index, so each row
+    only costs a set lookup instead of lower-casing its name and email. The
+    narrowing only bridges the pause before the server search answers: the
+    server also matches departments and substrings, so its page is shown
+    unfiltered (see clear_search()).
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._search = ""
+        self._matches = None
+        self._matches_version = None
+        self.setSortRole(Qt.ItemDataRole.UserRole)
+        self.setSortCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+
+    def set_search_text(self, text):
+        """Show only loaded rows where every word of text starts a name or email word"""
+        self._search = text.strip()
+        self._matches_version = None
+        self.invalidateFilter()
+
+    def clear_search(self):
+        """Stop narrowing, once the rows come from a server search for the same text"""
+        if self._search:
+            self._search = ""
+            self._matches_version = None
+            self.invalidateFilter()
+
+    def _current_matches(self):
+        """Matching employee keys, recomputed only after the search or the rows changed"""
+        source = self.sourceModel()
+        if self._matches_version != source.index_version:
+            self._matches = source.match(self._search)
+            self._matches_version = source.index_version
+        return self._matches
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        source = self.sourceModel()
+        if not self._search or source.is_empty():
+            return True
+        matches = self._current_matches()
+        return matches is None or source.key(source_row) in matches
+
+    def lessThan(self, left, right):
+        if left.column() == EmployeeTableModel.ACTIONS_COLUMN:
+            return False
+        return super().lessThan(left, right)
+
+
+class ActionButtonsDelegate(QStyledItemDelegate):
+    """
+    Paints the Records / Edit / Archive (or Restore) buttons in the actions
+    column and turns clicks on them into signals. Nothing is created per row,
+    unlike one QWidget with three QPushButtons for every employee.
+    """
+
+    records_clicked = pyqtSignal(object)
+    edit_clicked = pyqtSignal(object)
+    archive_clicked = pyqtSignal(object)
+    restore_clicked = pyqtSignal(object)
+
+    BUTTON_HEIGHT = 42
+    SPACING = 10
+
+    # (label, width, colour, signal name)
+    ACTIVE_BUTTONS = [
+        ("📋 Records", 100, '#10B981', 'records_clicked'),
+        ("✏️ Edit", 80, '#0047FF', 'edit_clicked'),
+        ("📁 Archive", 100, '#F59E0B', 'archive_clicked'),
+    ]
+    ARCHIVED_BUTTONS = [
+        ("↩️ Restore", 110, '#10B981', 'restore_clicked'),
+    ]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._font = QFont("Arial", 10, QFont.Weight.Bold)
+
+    def _employee(self, index):
+        """Employee behind a (proxy) index"""
+        model = index.model()
+        if isinstance(model, QSortFilterProxyModel):
+            index = model.mapToSource(index)
+            model = model.sourceModel()
+        return model.employee(index.row())
+
+    def _buttons(self, employee, rect):
+        """Button specs with their rectangles, centred in the cell"""
+        is_archived = employee.get('is_archived', False) or employee.get('archived', False)
+        specs = self.ARCHIVED_BUTTONS if is_archived else self.ACTIVE_BUTTONS
+        total_width = sum(width for _, width, _, _ in specs) + self.SPACING * (len(specs) - 1)
+        x = rect.x() + max(0, (rect.width() - total_width) // 2)
+        y = rect.y() + max(0, (rect.height() - self.BUTTON_HEIGHT) // 2)
+
+        buttons = []
+        for label, width, colour, signal in specs:
+            buttons.append((QRect(x, y, width, self.BUTTON_HEIGHT), label, colour, signal))
+            x += width + self.SPACING
+        return buttons
+
+    def paint(self, painter, option, index):
+        employee = self._employee(index)
+        if employee is None:
+            super().paint(painter, option, index)
+            return
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(self._font)
+        for button_rect, label, colour, _ in self._buttons(employee, option.rect):
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(colour))
+            painter.drawRoundedRect(button_rect, 8, 8)
+            painter.setPen(QColor('white'))
+            painter.drawText(button_rect, Qt.AlignmentFlag.AlignCenter, label)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() != QEvent.Type.MouseButtonRelease:
+            return False
+        employee = self._employee(index)
+        if employee is None:
+            return False
+        for button_rect, _, _, signal in self._buttons(employee, option.rect):
+            if button_rect.contains(event.position().toPoint()):
+                getattr(self, signal).emit(employee)
+                return True
+        return False
+
+
 class EmployeeManagementWindow(QMainWindow):
     """Main window for employee management"""
 
@@ -384,10 +815,8 @@ class EmployeeManagementWindow(QMainWindow):
         if not self.db.is_connected():
             self.db.connect()
 
-        # Load employees from database
-        self.employees = self.db.get_all_employees()
-        if not self.employees:
-            self.employees = []
+        # Employees are fetched a page at a time as the table scrolls
+        self.next_cursor = None
 
         # Filter to show only active (non-archived) employees by default
         self.show_archived = False
@@ -494,6 +923,12 @@ class EmployeeManagementWindow(QMainWindow):
         """)
         self.search_input.textChanged.connect(self.search_employees)
 
+        # Debounce server-side search so a query is not sent on every keystroke
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(300)
+        self.search_timer.timeout.connect(self.load_employees)
+
         self.role_filter = QComboBox()
         self.role_filter.addItems(["All Roles", "Admin", "Manager", "Employee"])
         self.role_filter.setStyleSheet("""
@@ -533,16 +968,24 @@ class EmployeeManagementWindow(QMainWindow):
         table_layout = QVBoxLayout(table_frame)
         table_layout.setContentsMargins(0, 0, 0, 0)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(7)
-        self.table.setHorizontalHeaderLabels([
-            "ID", "FULL NAME", "EMAIL", "ROLE",
-            "POSITION", "DEPARTMENT", "ACTIONS"
-        ])
+        # Model/view table: only visible rows are painted, pages load on demand
+        self.table_model = EmployeeTableModel(fetch_page=self.fetch_next_page, parent=self)
+        self.proxy_model = EmployeeFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.table_model)
+
+        self.table = QTableView()
+        self.table.setModel(self.proxy_model)
+
+        self.actions_delegate = ActionButtonsDelegate(self.table)
+        self.actions_delegate.records_clicked.connect(self.view_attendance)
+        self.actions_delegate.edit_clicked.connect(self.edit_employee)
+        self.actions_delegate.archive_clicked.connect(self.archive_employee)
+        self.actions_delegate.restore_clicked.connect(self.restore_employee)
+        self.table.setItemDelegateForColumn(EmployeeTableModel.ACTIONS_COLUMN, self.actions_delegate)
 
         # IMPROVED TABLE STYLING
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 border: none;
                 background: white;
                 gridline-color: #E5E7EB;
@@ -550,12 +993,12 @@ class EmployeeManagementWindow(QMainWindow):
                 font-size: 13px;
                 color: #1F2937;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 15px 10px;
                 border-bottom: 1px solid #E5E7EB;
                 color: #1F2937;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background: #E3F2FD;
                 color: #1F2937;
             }
@@ -621,14 +1064,18 @@ class EmployeeManagementWindow(QMainWindow):
         header.setSectionResizeMode(6, QHeaderView.ResizeMode.Fixed)  # Actions
 
         self.table.verticalHeader().setVisible(False)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         self.table.setAlternatingRowColors(False)
         self.table.setShowGrid(True)  # Show grid for better readability
 
         # Set consistent row height - INCREASED to show buttons properly
         self.table.verticalHeader().setDefaultSectionSize(70)  # Increased from 60 to 70
 
+        # Sort loaded rows by clicking a header; starts in database order (newest ID first)
+        header.setSortIndicator(0, Qt.SortOrder.DescendingOrder)
+        self.table.setSortingEnabled(True)
+
         table_layout.addWidget(self.table)
         content_layout.addWidget(table_frame)
 
@@ -674,254 +1121,73 @@ class EmployeeManagementWindow(QMainWindow):
             """)
         self.load_employees()
 
-    def load_employees(self, role_filter=None):
-        """Load employees into table"""
-        # Reload from database to get fresh data
-        self.employees = self.db.get_all_employees()
-        if not self.employees:
-            self.employees = []
-
-        # Filter by archived status
-        filtered_employees = []
-        for e in self.employees:
-            is_archived = e.get('is_archived', False) or e.get('archived', False)
-
-            # Skip invalid entries
-            full_name = e.get('FullName') or e.get('full_name', '')
-            email = e.get('Email') or e.get('email', '')
-            if str(full_name) == '0' and str(email) == '0':
-                continue
-
-            # Check if most fields are empty/zero
-            non_empty = sum([
-                bool(str(e.get('username', '')).strip() and str(e.get('username', '')) != '0'),
-                bool(str(full_name).strip() and str(full_name) != '0'),
-                bool(str(email).strip() and str(email) != '0'),
-            ])
-            if non_empty < 2:
-                continue
-
-            if self.show_archived:
-                if is_archived:
-                    filtered_employees.append(e)
-            else:
-                if not is_archived:
-                    filtered_employees.append(e)
-
-        if role_filter and role_filter != "All Roles":
-            filtered_employees = [e for e in filtered_employees if
-                                  (e.get('Role') or e.get('role', '')).lower() == role_filter.lower()]
-
-        self.display_employees(filtered_employees)
-
-    def display_employees(self, employees):
-        """Display employees in table"""
-        self.table.setRowCount(0)
-
-        for employee in employees:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-
-            # Get employee data
-            emp_id = employee.get('Employee_ID') or employee.get('id', '')
-            full_name = employee.get('FullName') or employee.get('full_name', '') or ''
-            email = employee.get('Email') or employee.get('email', '') or ''
-            role = employee.get('Role') or employee.get('role', '') or ''
-            position = employee.get('Position') or employee.get('position', '') or ''
-            department = employee.get('Department') or employee.get('department', '') or ''
-            is_archived = employee.get('is_archived', False) or employee.get('archived', False)
-
-            # Format the ID
-            if emp_id and str(emp_id) != '0':
-                if isinstance(emp_id, int) or (isinstance(emp_id, str) and emp_id.isdigit()):
-                    formatted_id = f"E{int(emp_id):03d}"
-                else:
-                    formatted_id = str(emp_id)
-            else:
-                formatted_id = f"E{row + 1:03d}"
+    def load_employees(self):
+        """Load the first page of employees matching the current view and filters"""
+        employees, self.next_cursor = self.db.get_employees_page(
+            after_id=None, limit=EMPLOYEE_PAGE_SIZE, **self.page_filters()
+        )
+        self.display_employees(employees)
 
-            # Create table items with proper alignment and styling - ALL CENTERED
-            id_item = QTableWidgetItem(formatted_id)
-            id_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter)
-            id_item.setFont(QFont("Arial", 12, QFont.Weight.Bold))
+    def page_filters(self):
+        """Server-side filters for the current view (archived toggle, role combo, search box)"""
+        role = self.role_filter.currentText() if hasattr(self, 'role_filter') else "All Roles"
+        search = self.search_input.text() if hasattr(self, 'search_input') else ""
+        return {
+            'archived': self.show_archived,
+            'role': role if role and role != "All Roles" else None,
+            'search': search.strip() or None
+        }
 
-            name_item = QTableWidgetItem(str(full_name) if full_name and str(full_name) != '0' else '')
-            name_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter)
-            name_item.setFont(QFont("Arial", 12, QFont.Weight.Bold))
+    def fetch_next_page(self):
+        """
+        Fetch the page after the last loaded employee (called by the table model)
 
-            email_item = QTableWidgetItem(str(email) if email and str(email) != '0' else '')
-            email_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter)
+        Returns:
+            tuple: (employees: list, has_more: bool)
+        """
+        if self.next_cursor is None:
+            return ([], False)
 
-            role_text = str(role).upper() if role and str(role) != '0' else ''
-            role_item = QTableWidgetItem(role_text)
-            role_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter)
+        employees, self.next_cursor = self.db.get_employees_page(
+            after_id=self.next_cursor, limit=EMPLOYEE_PAGE_SIZE, **self.page_filters()
+        )
+        return (employees, self.next_cursor is not None)
 
-            # Color code roles
-            if role_text == 'ADMIN':
-                role_item.setForeground(QColor('#DC2626'))
-            elif role_text == 'MANAGER':
-                role_item.setForeground(QColor('#2563EB'))
-            else:
-                role_item.setForeground(QColor('#059669'))
-
-            position_item = QTableWidgetItem(str(position) if position and str(position) != '0' else '')
-            position_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter)
-
-            dept_item = QTableWidgetItem(str(department) if department and str(department) != '0' else '')
-            dept_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter)
-
-            # Set items in table (7 columns total)
-            self.table.setItem(row, 0, id_item)
-            self.table.setItem(row, 1, name_item)
-            self.table.setItem(row, 2, email_item)
-            self.table.setItem(row, 3, role_item)
-            self.table.setItem(row, 4, position_item)
-            self.table.setItem(row, 5, dept_item)
-
-            # IMPROVED ACTION BUTTONS WITH MODERN DESIGN
-            action_widget = QWidget()
-            action_widget.setStyleSheet("background: transparent; border: none;")
-            action_layout = QHBoxLayout(action_widget)
-            action_layout.setContentsMargins(5, 8, 5, 8)  # Adjusted margins to fit in row
-            action_layout.setSpacing(10)  # Good spacing between buttons
-            action_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-            if is_archived:
-                # Restore button for archived employees
-                restore_btn = QPushButton("↩️ Restore")
-                restore_btn.setFixedSize(110, 42)  # Good size that fits in 70px row
-                restore_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-                restore_btn.setStyleSheet("""
-                    QPushButton {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                                   stop:0 #10B981, stop:1 #059669);
-                        color: white;
-                        border: none;
-                        border-radius: 8px;
-                        font-size: 13px;
-                        font-weight: 700;
-                        padding: 10px 14px;
-                        text-align: center;
-                    }
-                    QPushButton:hover {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                                   stop:0 #059669, stop:1 #047857);
-                        transform: translateY(-1px);
-                    }
-                    QPushButton:pressed {
-                        background: #047857;
-                        transform: translateY(0px);
-                    }
-                """)
-                restore_btn.setToolTip("Restore Employee")
-                restore_btn.clicked.connect(lambda checked, e=employee: self.restore_employee(e))
-                action_layout.addWidget(restore_btn)
-            else:
-                # Records button (green) - navigates to attendance
-                records_btn = QPushButton("📋 Records")
-                records_btn.setFixedSize(100, 42)  # Good size that fits in 70px row
-                records_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-                records_btn.setStyleSheet("""
-                    QPushButton {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                                   stop:0 #10B981, stop:1 #059669);
-                        color: white;
-                        border: none;
-                        border-radius: 8px;
-                        font-size: 13px;
-                        font-weight: 700;
-                        padding: 10px 12px;
-                        text-align: center;
-                    }
-                    QPushButton:hover {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                                   stop:0 #059669, stop:1 #047857);
-                        transform: translateY(-1px);
-                    }
-                    QPushButton:pressed {
-                        background: #047857;
-                        transform: translateY(0px);
-                    }
-                """)
-                records_btn.setToolTip("View Attendance Records")
-                records_btn.clicked.connect(lambda checked, e=employee: self.view_attendance(e))
-
-                # Edit button
-                edit_btn = QPushButton("✏️ Edit")
-                edit_btn.setFixedSize(80, 42)  # Good size that fits in 70px row
-                edit_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-                edit_btn.setStyleSheet("""
-                    QPushButton {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                                   stop:0 #0047FF, stop:1 #0039CC);
-                        color: white;
-                        border: none;
-                        border-radius: 8px;
-                        font-size: 13px;
-                        font-weight: 700;
-                        padding: 10px 12px;
-                        text-align: center;
-                    }
-                    QPushButton:hover {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                                   stop:0 #0039CC, stop:1 #002E99);
-                        transform: translateY(-1px);
-                    }
-                    QPushButton:pressed {
-                        background: #002E99;
-                        transform: translateY(0px);
-                    }
-                """)
-                edit_btn.setToolTip("Edit Employee")
-                edit_btn.clicked.connect(lambda checked, e=employee: self.edit_employee(e))
-
-                # Archive button
-                archive_btn = QPushButton("📁 Archive")
-                archive_btn.setFixedSize(100, 42)  # Good size that fits in 70px row
-                archive_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-                archive_btn.setStyleSheet("""
-                    QPushButton {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                                   stop:0 #F59E0B, stop:1 #D97706);
-                        color: white;
-                        border: none;
-                        border-radius: 8px;
-                        font-size: 13px;
-                        font-weight: 700;
-                        padding: 10px 12px;
-                        text-align: center;
-                    }
-                    QPushButton:hover {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                                   stop:0 #D97706, stop:1 #B45309);
-                        transform: translateY(-1px);
-                    }
-                    QPushButton:pressed {
-                        background: #B45309;
-                        transform: translateY(0px);
-                    }
-                """)
-                archive_btn.setToolTip("Archive Employee")
-                archive_btn.clicked.connect(lambda checked, e=employee: self.archive_employee(e))
-
-                action_layout.addWidget(records_btn)
-                action_layout.addWidget(edit_btn)
-                action_layout.addWidget(archive_btn)
-
-            self.table.setCellWidget(row, 6, action_widget)
-
-        if self.table.rowCount() == 0:
-            self.table.setRowCount(1)
-            message = "No archived employees found" if self.show_archived else "No active employees found"
-            no_data_item = QTableWidgetItem(message)
-            no_data_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            no_data_item.setFlags(Qt.ItemFlag.NoItemFlags)
-            no_data_item.setForeground(QColor('#6B7280'))
-            font = QFont("Arial", 13)
-            font.setItalic(True)
-            no_data_item.setFont(font)
-            self.table.setSpan(0, 0, 1, 7)
-            self.table.setItem(0, 0, no_data_item)
+    def display_employees(self, employees):
+        """Display employees in table"""
+        message = "No archived employees found" if self.show_archived else "No active employees found"
+        self.table_model.reset(employees, has_more=self.next_cursor is not None, empty_message=message)
+        # The server already applied the search box; filtering again by the local rule would hide its matches
+        self.proxy_model.clear_search()
+        self.update_empty_span()
+
+    def update_empty_span(self):
+        """The empty-state message spans the whole row"""
+        self.table.clearSpans()
+        if self.table_model.is_empty():
+            self.table.setSpan(0, 0, 1, len(EmployeeTableModel.HEADERS))
+
+    def belongs_in_view(self, employee):
+        """Check if an employee record matches the archived toggle and role filter"""
+        if bool(employee.get('is_archived')) != self.show_archived:
+            return False
+        role = self.page_filters()['role']
+        return not role or (employee.get('Role') or '').lower() == role.lower()
+
+    def refresh_employee(self, employee_id):
+        """
+        Bring one employee's row up to date after an add, edit, archive or restore
+
+        Only that row (and the search index entry for it) changes; the rest of
+        the loaded table stays as it is.
+        """
+        employee = self.db.get_employee_by_id(employee_id)
+        if employee and self.belongs_in_view(employee):
+            if not self.table_model.update_employee(employee):
+                self.table_model.insert_employee(employee)
+        else:
+            self.table_model.remove_employee(employee_id)
+        self.update_empty_span()
 
     def add_employee(self):
         """Open dialog to add new employee"""
@@ -954,8 +1220,7 @@ class EmployeeManagementWindow(QMainWindow):
             success, employee_id, db_message = self.db.add_employee(employee_data)
 
             if success:
-                # Reload and emit signal
-                self.load_employees()
+                self.refresh_employee(employee_id)
                 self.employee_updated.emit()
                 QMessageBox.information(self, "Success", f"Employee added successfully!\n\n{db_message}")
             else:
@@ -997,8 +1262,7 @@ class EmployeeManagementWindow(QMainWindow):
             success, db_message = self.db.update_employee(emp_id, update_data)
 
             if success:
-                # Reload and emit signal
-                self.load_employees()
+                self.refresh_employee(emp_id)
                 self.employee_updated.emit()
                 QMessageBox.information(self, "Success", "Employee updated successfully!")
             else:
@@ -1024,7 +1288,7 @@ class EmployeeManagementWindow(QMainWindow):
             success, message = self.db.update_employee(emp_id, update_data)
 
             if success:
-                self.load_employees()
+                self.refresh_employee(emp_id)
                 self.employee_updated.emit()
                 QMessageBox.information(self, "Success", f"{emp_name} has been archived successfully!")
             else:
@@ -1050,37 +1314,18 @@ class EmployeeManagementWindow(QMainWindow):
             success, message = self.db.update_employee(emp_id, update_data)
 
             if success:
-                self.load_employees()
+                self.refresh_employee(emp_id)
                 self.employee_updated.emit()
                 QMessageBox.information(self, "Success", f"{emp_name} has been restored successfully!")
             else:
                 QMessageBox.critical(self, "Error", f"Failed to restore employee:\n{message}")
 
     def search_employees(self, search_term):
-        """Search employees"""
-        if search_term.strip():
-            filtered = []
-            for e in self.employees:
-                # Check archived status
-                is_archived = e.get('is_archived', False) or e.get('archived', False)
-                if self.show_archived != is_archived:
-                    continue
-
-                full_name = e.get('FullName') or e.get('full_name', '')
-                email = e.get('Email') or e.get('email', '')
-
-                # Skip invalid entries
-                if str(full_name) == '0' and str(email) == '0':
-                    continue
-
-                search_lower = search_term.lower()
-                if (search_lower in str(full_name).lower() or
-                        search_lower in str(email).lower()):
-                    filtered.append(e)
-
-            self.display_employees(filtered)
-        else:
-            self.load_employees()
+        """Search employees by name or email"""
+        # Narrow the loaded rows at once, then reload from the server when typing pauses;
+        # display_employees() drops the local narrowing when the server page arrives
+        self.proxy_model.set_search_text(search_term)
+        self.search_timer.start()
 
     def view_attendance(self, employee):
         """Navigate to attendance management for this employee"""
@@ -1103,10 +1348,55 @@ class EmployeeManagementWindow(QMainWindow):
 
     def filter_by_role(self, role):
         """Filter employees by role"""
-        self.load_employees(role if role != "All Roles" else None)
+        self.load_employees()
+
+
+def benchmark_first_paint(row_count=50000):
+    """
+    Time from handing row_count employees to the table until it has painted
+
+    Uses synthetic rows, so no database is needed. Run with:
+        python employee_management_controller.py --benchmark [row_count]
+
+    Returns:
+        float: Milliseconds to first paint
+    """
+    app = QApplication.instance() or QApplication(sys.argv)
+    roles = ['Admin', 'Manager', 'Employee']
+    employees = [
+        {
+            'Employee_ID': f"E{i:06d}", 'FullName': f"Employee {i}", 'Email': f"employee{i}@payease.com",
+            'Role': roles[i % 3], 'Position': 'Staff', 'Department': 'Engineering', 'is_archived': 0
+        }
+        for i in range(row_count, 0, -1)
+    ]
+
+    start = time.perf_counter()
+    model = EmployeeTableModel()
+    model.reset(employees)
+    proxy = EmployeeFilterProxyModel()
+    proxy.setSourceModel(model)
+    view = QTableView()
+    view.setModel(proxy)
+    view.setItemDelegateForColumn(EmployeeTableModel.ACTIONS_COLUMN, ActionButtonsDelegate(view))
+    view.verticalHeader().setDefaultSectionSize(70)
+    view.resize(1400, 800)
+    view.show()
+    app.processEvents()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    print(f"[BENCH] {row_count} employees: first paint after {elapsed_ms:.1f} ms")
+    view.close()
+    return elapsed_ms
 
 
 def main():
+    if '--benchmark' in sys.argv:
+        position = sys.argv.index('--benchmark')
+        row_count = int(sys.argv[position + 1]) if len(sys.argv) > position + 1 else 50000
+        benchmark_first_paint(row_count)
+        return
+
     app = QApplication(sys.argv)
     window = EmployeeManagementWindow()
     window.show()
@@ -0,0 +1,314 @@
+"""
+Employee Onboarding Module for PayEase
+Adds a whole roster (CSV/TSV) of new employees and their accounts in one run
+
+The file is validated up front: every row goes through the same rules as
+add_employee(), duplicates are found with one set-based lookup against the
+database plus a pass over the file itself, and the IDs for all accepted rows
+are reserved as one block. Passwords are hashed in a process pool, then
+employees and accounts are inserted together in chunked transactions.
+
+Usage:
+    python -m Model.employee_onboarding roster.csv [--chunk-size 500] [--workers 4]
+"""
+
+import argparse
+import csv
+import sys
+import time
+from datetime import datetime
+
+from mysql.connector import Error
+
+from Controller.utils.password_executor import PasswordExecutor, get_password_executor
+from Model.database import get_db_connection, normalize_employee_data
+
+
+DEFAULT_CHUNK_SIZE = 500
+MAX_REJECT_SAMPLES = 100  # Rejected rows kept for the report; the rest are only counted
+
+DATE_FORMATS = ('%Y-%m-%d', '%m/%d/%Y', '%d-%m-%Y')
+
+# Accepted header names for each field (lower-case)
+COLUMN_ALIASES = {
+    'username': ('username', 'user', 'login'),
+    'password': ('password', 'initial_password'),
+    'full_name': ('full_name', 'full name', 'fullname', 'name'),
+    'email': ('email', 'e-mail'),
+    'role': ('role',),
+    'position': ('position', 'job_title', 'title'),
+    'salary': ('salary', 'base_salary'),
+    'department': ('department', 'dept'),
+    'phone': ('phone', 'contact', 'phone_number'),
+    'address': ('address',),
+    'date_hired': ('date_hired', 'date hired', 'hire_date', 'hired'),
+}
+REQUIRED_COLUMNS = {'username', 'password', 'full_name', 'email', 'position', 'department'}
+
+
+def read_rows(source, delimiter=None):
+    """
+    Yield (line_number, row dict) from a CSV or TSV roster
+
+    Args:
+        source (str or file): Path or open text file
+        delimiter (str): Field delimiter; guessed from the file when None
+
+    Yields:
+        tuple: (line_number, {field: value}) with fields mapped through COLUMN_ALIASES
+    """
+    handle = open(source, newline='', encoding='utf-8-sig') if isinstance(source, str) else source
+    try:
+        if delimiter is None:
+            if isinstance(source, str) and source.lower().endswith(('.tsv', '.tab')):
+                delimiter = '\t'
+            else:
+                sample = handle.readline()
+                delimiter = '\t' if sample.count('\t') > sample.count(',') else ','
+                handle.seek(0)
+
+        reader = csv.reader(handle, delimiter=delimiter)
+        header = [name.strip().lower() for name in next(reader, [])]
+        positions = {}
+        for field, aliases in COLUMN_ALIASES.items():
+            for alias in aliases:
+                if alias in header:
+                    positions[field] = header.index(alias)
+                    break
+
+        missing = REQUIRED_COLUMNS - set(positions)
+        if missing:
+            raise ValueError(f"Missing required column(s): {', '.join(sorted(missing))}")
+
+        for line_number, values in enumerate(reader, start=2):
+            if not any(value.strip() for value in values):
+                continue
+            yield line_number, {
+                field: values[index].strip() if index < len(values) else ''
+                for field, index in positions.items()
+            }
+    finally:
+        if handle is not source:
+            handle.close()
+
+
+def _reject(report, line_number, error, row):
+    """Count a rejected row and keep a sample of it (without the password)"""
+    report['rejected'] += 1
+    if len(report['rejected_samples']) < MAX_REJECT_SAMPLES:
+        row = {field: value for field, value in row.items() if field != 'password'}
+        report['rejected_samples'].append({'line': line_number, 'error': error, 'row': row})
+
+
+def _parse_date(value):
+    """Normalize a hire date to YYYY-MM-DD"""
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).strftime('%Y-%m-%d')
+        except ValueError:
+            continue
+    raise ValueError(f"Invalid date hired: {value!r}")
+
+
+def validate_roster(rows, db, report):
+    """
+    Validate every row and drop duplicates, inside the file and against the database
+
+    Args:
+        rows (iterable): (line_number, row dict) from read_rows()
+        db (DatabaseConnection): Database holding existing accounts and employees
+        report (dict): Onboarding report; 'read', 'rejected' and 'rejected_samples' are updated
+
+    Returns:
+        list: (line_number, employee dict) for rows that can be inserted
+    """
+    candidates = []
+    seen_usernames = set()
+    seen_emails = set()
+
+    for line_number, row in rows:
+        report['read'] += 1
+        if row.get('date_hired'):
+            try:
+                row = dict(row, date_hired=_parse_date(row['date_hired']))
+            except ValueError as e:
+                _reject(report, line_number, str(e), row)
+                continue
+
+        employee, error = normalize_employee_data(row)
+        if error:
+            _reject(report, line_number, error, row)
+            continue
+
+        username_key = employee['username'].lower()
+        if username_key in seen_usernames:
+            _reject(report, line_number, f"Username '{employee['username']}' appears more than once in the file", row)
+            continue
+        if employee['email'] in seen_emails:
+            _reject(report, line_number, f"Email '{employee['email']}' appears more than once in the file", row)
+            continue
+
+        seen_usernames.add(username_key)
+        seen_emails.add(employee['email'])
+        candidates.append((line_number, employee))
+
+    taken_usernames, taken_emails = db.find_taken_credentials(seen_usernames, seen_emails)
+
+    accepted = []
+    for line_number, employee in candidates:
+        if employee['username'].lower() in taken_usernames:
+            _reject(report, line_number, f"Username '{employee['username']}' is already taken", employee)
+        elif employee['email'] in taken_emails:
+            _reject(report, line_number, f"Email '{employee['email']}' is already registered", employee)
+        else:
+            accepted.append((line_number, employee))
+    return accepted
+
+
+def hash_passwords(passwords, workers=None):
+    """
+    Hash passwords across CPU cores
+
+    bcrypt is deliberately slow, so a roster of thousands of accounts is
+    CPU-bound; the password executor spreads the work over every core.
+
+    Args:
+        passwords (list): Plain text passwords
+        workers (int): Worker processes (None = the shared executor)
+
+    Returns:
+        list: (password_hash, salt) per password, (None, error) when rejected
+    """
+    if workers is None:
+        return get_password_executor().hash_many(passwords)
+
+    executor = PasswordExecutor(workers=workers)
+    try:
+        return executor.hash_many(passwords)
+    finally:
+        executor.shutdown()
+
+
+class EmployeeOnboarder:
+    """Onboards a roster of new employees with their login accounts"""
+
+    def __init__(self, db=None):
+        """
+        Initialize onboarder
+
+        Args:
+            db (DatabaseConnection): Database to add employees to
+        """
+        self.db = db or get_db_connection()
+
+    def onboard_file(self, source, chunk_size=DEFAULT_CHUNK_SIZE, delimiter=None, workers=None,
+                     progress_callback=None):
+        """
+        Validate a roster, then add every valid employee and account
+
+        Each chunk is one transaction holding both the employee rows and their
+        accounts. If a chunk fails it is rolled back and the run stops; chunks
+        committed before it stay committed and are listed in the report.
+
+        Args:
+            source (str or file): Path or open text file (CSV or TSV)
+            chunk_size (int): Employees per transaction
+            delimiter (str): Field delimiter; guessed when None
+            workers (int): Password hashing processes (None = one per core)
+            progress_callback (callable): Called as (added, total) after each chunk
+
+        Returns:
+            dict: success, message, read, added, rejected, rejected_samples,
+                  added_ids, rolled_back_ids, not_attempted, elapsed_seconds
+        """
+        report = {
+            'success': True, 'message': '', 'read': 0, 'added': 0, 'rejected': 0,
+            'rejected_samples': [], 'added_ids': [], 'rolled_back_ids': [], 'not_attempted': 0,
+            'elapsed_seconds': 0.0
+        }
+        start = time.perf_counter()
+
+        try:
+            accepted = validate_roster(read_rows(source, delimiter), self.db, report)
+            print(f"[ONBOARD] {len(accepted)} of {report['read']} rows passed validation")
+
+            hashes = hash_passwords([employee['password'] for _, employee in accepted], workers)
+            ready = []
+            for (line_number, employee), (password_hash, salt) in zip(accepted, hashes):
+                if password_hash is None:
+                    _reject(report, line_number, f"Password rejected: {salt}", employee)
+                    continue
+                employee['password_hash'] = password_hash
+                employee['salt'] = salt
+                del employee['password']
+                ready.append(employee)
+            print(f"[ONBOARD] Hashed {len(ready)} passwords")
+
+            for employee, employee_id in zip(ready, self.db.allocate_employee_ids(len(ready))):
+                employee['Employee_ID'] = employee_id
+
+            for offset in range(0, len(ready), chunk_size):
+                chunk = ready[offset:offset + chunk_size]
+                success, count, message = self.db.insert_employees_batch(chunk)
+                if not success:
+                    report['success'] = False
+                    report['rolled_back_ids'] = [employee['Employee_ID'] for employee in chunk]
+                    report['not_attempted'] = len(ready) - offset - len(chunk)
+                    report['message'] = (f"Stopped after {report['added']} employees; chunk "
+                                         f"{chunk[0]['Employee_ID']}-{chunk[-1]['Employee_ID']} "
+                                         f"rolled back: {message}")
+                    break
+
+                report['added'] += count
+                report['added_ids'].extend(employee['Employee_ID'] for employee in chunk)
+                print(f"[ONBOARD] {report['added']} of {len(ready)} employees added")
+                if progress_callback:
+                    progress_callback(report['added'], len(ready))
+
+        except (OSError, ValueError, csv.Error) as e:
+            report['success'] = False
+            report['message'] = f"Could not read roster: {e}"
+        except RuntimeError as e:
+            # Password workers busy or gone; nothing has been written yet
+            report['success'] = False
+            report['message'] = f"Could not hash passwords: {e}"
+        except Error as e:
+            report['success'] = False
+            report['message'] = f"Database error before any employee was added: {e}"
+
+        report['elapsed_seconds'] = time.perf_counter() - start
+        if report['success']:
+            report['message'] = (f"Added {report['added']} of {report['read']} employees "
+                                 f"({report['rejected']} rejected)")
+        print(f"[ONBOARD] {report['message']} in {report['elapsed_seconds']:.1f}s")
+        return report
+
+
+def main(argv=None):
+    """Command line entry point; returns the process exit code"""
+    parser = argparse.ArgumentParser(description="Onboard a roster of new employees")
+    parser.add_argument('path', help="CSV or TSV roster with username, password, full_name, email, "
+                                     "position, department and optional role, salary, phone, address, date_hired")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--workers', type=int, default=None, help="Password hashing processes")
+    parser.add_argument('--delimiter', default=None, help="Field delimiter (guessed when omitted)")
+    args = parser.parse_args(argv)
+
+    db = get_db_connection(pool_size=0)
+    if not db.is_connected() and not db.connect():
+        print("[ONBOARD] Could not connect to the database")
+        return 2
+
+    delimiter = '\t' if args.delimiter in ('\\t', 'tab') else args.delimiter
+    report = EmployeeOnboarder(db).onboard_file(args.path, args.chunk_size, delimiter, args.workers)
+    for sample in report['rejected_samples'][:20]:
+        print(f"[ONBOARD] Line {sample['line']}: {sample['error']}")
+    if report['rolled_back_ids']:
+        print(f"[ONBOARD] Rolled back: {', '.join(report['rolled_back_ids'])}")
+        print(f"[ONBOARD] Not attempted: {report['not_attempted']} employees; fix the error and re-run "
+              f"the file (already added rows will be rejected as duplicates)")
+    return 0 if report['success'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,574 @@
+"""
+Employee Search Module for PayEase
+Ranked prefix and fuzzy employee search that never scans the table with LIKE
+
+Two back ends answer the same questions:
+
+* MySQL FULLTEXT (migration 8): every word of the query becomes a required
+  prefix term in a BOOLEAN MODE match, ranked by relevance.
+* An in-process trigram index, used when the FULLTEXT index is missing, when
+  a word is shorter than the server indexes, and for typo-tolerant matching
+  when FULLTEXT finds nothing. It is built on first use and kept current
+  from the database change events.
+
+PrefixIndex, a sorted word array, serves type-ahead filtering of rows
+already loaded in a window.
+
+Usage:
+    python -m Model.employee_search benchmark [--sizes 100000 1000000] [--mysql]
+"""
+
+import argparse
+import bisect
+import heapq
+import random
+import re
+import sys
+import threading
+import time
+
+from mysql.connector import Error
+
+from Model.id_allocator import id_order
+from Model.migrations import EMPLOYEE_FULLTEXT_INDEX, EMPLOYEE_FULLTEXT_COLUMNS
+
+
+DEFAULT_LIMIT = 200
+MIN_FULLTEXT_TERM = 3     # innodb_ft_min_token_size default; shorter words are not indexed
+FUZZY_THRESHOLD = 0.4     # Minimum trigram similarity for a fuzzy match
+MAX_PREFIX_TOKENS = 5000  # Distinct words expanded for one very short prefix
+VOCABULARY_RESORT = 1000  # Pending word changes above which the vocabulary is re-sorted
+SEARCH_COLUMNS = frozenset(column.strip() for column in EMPLOYEE_FULLTEXT_COLUMNS.split(','))
+
+# Scores for how a query word matched an indexed word
+EXACT_SCORE = 1.0
+PREFIX_SCORE = 0.9
+FUZZY_WEIGHT = 0.8
+
+_TOKEN_PATTERN = re.compile(r'[^\W_]+')
+
+
+def tokenize(text):
+    """Lower-case words in text; e-mail addresses split at '@' and '.' like FULLTEXT does"""
+    return _TOKEN_PATTERN.findall(str(text or '').lower())
+
+
+def trigrams(token):
+    """Padded trigrams of a word ('ann' -> '  a', ' an', 'ann', 'nn ')"""
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """Word index over documents with exact, prefix and trigram (fuzzy) lookups"""
+
+    def __init__(self):
+        self._documents = {}   # doc id -> set of words
+        self._postings = {}    # word -> set of doc ids
+        self._grams = {}       # trigram -> set of words
+        self._words = []       # sorted vocabulary for prefix lookups
+        self._added_words = set()    # not yet merged into _words
+        self._removed_words = set()  # not yet dropped from _words
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._documents)
+
+    def add(self, doc_id, *texts):
+        """Index (or re-index) a document from one or more text fields"""
+        words = set()
+        for text in texts:
+            words.update(tokenize(text))
+
+        with self._lock:
+            self.remove(doc_id)
+            self._documents[doc_id] = words
+            for word in words:
+                postings = self._postings.get(word)
+                if postings is None:
+                    postings = self._postings[word] = set()
+                    for gram in trigrams(word):
+                        self._grams.setdefault(gram, set()).add(word)
+                    if word in self._removed_words:
+                        self._removed_words.discard(word)
+                    else:
+                        self._added_words.add(word)
+                postings.add(doc_id)
+
+    def remove(self, doc_id):
+        """Drop a document; unknown ids are ignored"""
+        with self._lock:
+            for word in self._documents.pop(doc_id, ()):
+                postings = self._postings[word]
+                postings.discard(doc_id)
+                if not postings:
+                    del self._postings[word]
+                    for gram in trigrams(word):
+                        self._grams[gram].discard(word)
+                    if word in self._added_words:
+                        self._added_words.discard(word)
+                    else:
+                        self._removed_words.add(word)
+
+    def clear(self):
+        with self._lock:
+            self._documents.clear()
+            self._postings.clear()
+            self._grams.clear()
+            self._words = []
+            self._added_words.clear()
+            self._removed_words.clear()
+
+    def _vocabulary(self):
+        """
+        Sorted vocabulary with pending word changes applied
+
+        A few changes (one employee edited) are merged in place with bisect;
+        a bulk load is sorted once.
+        """
+        if self._added_words or self._removed_words:
+            if len(self._added_words) + len(self._removed_words) > VOCABULARY_RESORT:
+                self._words = sorted(self._postings)
+            else:
+                for word in self._removed_words:
+                    del self._words[bisect.bisect_left(self._words, word)]
+                for word in self._added_words:
+                    bisect.insort(self._words, word)
+            self._added_words.clear()
+            self._removed_words.clear()
+        return self._words
+
+    def _prefix_words(self, term, max_words=MAX_PREFIX_TOKENS):
+        """Indexed words starting with term, in order"""
+        words = self._vocabulary()
+        position = bisect.bisect_left(words, term)
+        end = len(words) if max_words is None else min(len(words), position + max_words)
+        while position < end and words[position].startswith(term):
+            yield words[position]
+            position += 1
+
+    def _matching_words(self, term, fuzzy):
+        """
+        {indexed word: score} for one query word
+
+        Near misses are only looked up when no indexed word equals or starts
+        with the query word, i.e. when it is probably misspelt.
+        """
+        matches = {word: EXACT_SCORE if word == term else PREFIX_SCORE for word in self._prefix_words(term)}
+
+        if fuzzy and not matches and len(term) >= 3:
+            term_grams = trigrams(term)
+            shared = {}
+            for gram in term_grams:
+                for word in self._grams.get(gram, ()):
+                    shared[word] = shared.get(word, 0) + 1
+            for word, count in shared.items():
+                # Jaccard similarity; a word of n letters has n + 1 padded trigrams
+                similarity = count / (len(term_grams) + len(word) + 1 - count)
+                if similarity >= FUZZY_THRESHOLD:
+                    matches[word] = similarity * FUZZY_WEIGHT
+        return matches
+
+    def search(self, query, limit=DEFAULT_LIMIT, fuzzy=True):
+        """
+        Documents containing every query word (as a word, prefix or near miss)
+
+        Args:
+            query (str): Search text
+            limit (int): Maximum results
+            fuzzy (bool): Also match misspelt words
+
+        Returns:
+            list: (doc_id, score) best first
+        """
+        terms = tokenize(query)
+        if not terms:
+            return []
+
+        with self._lock:
+            scores = None
+            for term in dict.fromkeys(terms):
+                term_scores = {}
+                # Lowest scores first so a document keeps its best match for this word
+                for word, score in sorted(self._matching_words(term, fuzzy).items(), key=lambda item: item[1]):
+                    term_scores.update(dict.fromkeys(self._postings[word], score))
+
+                if scores is None:
+                    scores = term_scores
+                else:
+                    scores = {doc_id: scores[doc_id] + term_scores[doc_id]
+                              for doc_id in scores.keys() & term_scores.keys()}
+                if not scores:
+                    return []
+
+        if limit:
+            return heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+
+
+class PrefixIndex:
+    """
+    Sorted (word, doc id) array for type-ahead filtering
+
+    A query word selects one contiguous slice of the array via bisect, so
+    matching costs two binary searches plus a set of the ids in the slice,
+    however many words share the prefix. Single documents are inserted and
+    removed in place, keeping the array sorted.
+    """
+
+    def __init__(self):
+        self._words = []      # sorted, one entry per (word, doc) pair
+        self._ids = []        # doc id of each _words entry
+        self._documents = {}  # doc id -> set of words
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._documents)
+
+    def reset(self, documents=()):
+        """
+        Replace the contents with (doc_id, text, ...) tuples, sorting once
+
+        Args:
+            documents (iterable): Tuples of a doc id followed by its text fields
+        """
+        pairs = []
+        words_by_doc = {}
+        for doc_id, *texts in documents:
+            words = set()
+            for text in texts:
+                words.update(tokenize(text))
+            words_by_doc[doc_id] = words
+            pairs.extend((word, doc_id) for word in words)
+        pairs.sort(key=lambda pair: pair[0])
+
+        with self._lock:
+            self._words = [word for word, _ in pairs]
+            self._ids = [doc_id for _, doc_id in pairs]
+            self._documents = words_by_doc
+
+    def extend(self, documents):
+        """
+        Add (doc_id, text, ...) tuples for documents not indexed yet
+
+        The new entries are sorted on their own and merged in one pass, which
+        is cheaper than inserting a page of documents one word at a time.
+        """
+        pairs = []
+        with self._lock:
+            for doc_id, *texts in documents:
+                self.remove(doc_id)
+                words = set()
+                for text in texts:
+                    words.update(tokenize(text))
+                self._documents[doc_id] = words
+                pairs.extend((word, doc_id) for word in words)
+            if not pairs:
+                return
+
+            # Two sorted runs: timsort merges them in linear time
+            merged = list(zip(self._words, self._ids)) + sorted(pairs, key=lambda pair: pair[0])
+            merged.sort(key=lambda pair: pair[0])
+            self._words = [word for word, _ in merged]
+            self._ids = [doc_id for _, doc_id in merged]
+
+    def add(self, doc_id, *texts):
+        """Index (or re-index) one document"""
+        words = set()
+        for text in texts:
+            words.update(tokenize(text))
+
+        with self._lock:
+            self.remove(doc_id)
+            self._documents[doc_id] = words
+            for word in words:
+                position = bisect.bisect_right(self._words, word)
+                self._words.insert(position, word)
+                self._ids.insert(position, doc_id)
+
+    def remove(self, doc_id):
+        """Drop one document; unknown ids are ignored"""
+        with self._lock:
+            for word in self._documents.pop(doc_id, ()):
+                start = bisect.bisect_left(self._words, word)
+                end = bisect.bisect_right(self._words, word, start)
+                position = self._ids.index(doc_id, start, end)
+                del self._words[position]
+                del self._ids[position]
+
+    def _slice(self, term):
+        """Ids of every (word, doc) entry whose word starts with term"""
+        start = bisect.bisect_left(self._words, term)
+        end = bisect.bisect_left(self._words, term + '\U0010ffff', start)
+        return self._ids[start:end]
+
+    def match(self, query):
+        """
+        Ids of documents where every query word starts one of their words
+
+        Returns:
+            set: Matching doc ids, or None when the query has no words
+        """
+        terms = tokenize(query)
+        if not terms:
+            return None
+
+        with self._lock:
+            matched = None
+            # Longest (usually most selective) word first
+            for term in sorted(set(terms), key=len, reverse=True):
+                docs = self._slice(term)
+                matched = set(docs) if matched is None else matched.intersection(docs)
+                if not matched:
+                    break
+        return matched
+
+
+class EmployeeSearch:
+    """Employee search over FULLTEXT when available, the trigram index otherwise"""
+
+    def __init__(self, db):
+        """
+        Initialize search
+
+        Args:
+            db (DatabaseConnection): Database holding the employees table
+        """
+        self.db = db
+        self._fulltext = None  # Unknown until first checked
+        self._index = None     # Built on first fallback search
+        self._index_lock = threading.Lock()
+        db.add_change_listener(self.on_change)
+
+    def has_fulltext(self):
+        """Check (once) whether the employees FULLTEXT index exists"""
+        if self._fulltext is None:
+            try:
+                with self.db.checkout() as (connection, cursor):
+                    cursor.execute("""
+                        SELECT 1 FROM INFORMATION_SCHEMA.STATISTICS
+                        WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'employees' AND INDEX_NAME = %s
+                        LIMIT 1
+                    """, (self.db.database, EMPLOYEE_FULLTEXT_INDEX))
+                    self._fulltext = cursor.fetchone() is not None
+            except Error as e:
+                print(f"[SEARCH] Could not check for the FULLTEXT index: {e}")
+                return False
+            print(f"[SEARCH] Employee search backend: {'FULLTEXT' if self._fulltext else 'in-process trigram index'}")
+        return self._fulltext
+
+    def fulltext_condition(self, text):
+        """
+        SQL condition matching every word of text as a prefix, for use in WHERE
+
+        Returns:
+            tuple: (sql, params), or None when FULLTEXT cannot answer this query
+        """
+        terms = tokenize(text)
+        if not terms or min(len(term) for term in terms) < MIN_FULLTEXT_TERM or not self.has_fulltext():
+            return None
+        against = ' '.join(f"+{term}*" for term in terms)
+        return (f"MATCH({EMPLOYEE_FULLTEXT_COLUMNS}) AGAINST (%s IN BOOLEAN MODE)", [against])
+
+    def search(self, text, limit=DEFAULT_LIMIT, fuzzy=True):
+        """
+        Employees matching every word of text, most relevant first
+
+        Args:
+            text (str): Search text (name, email or department words or prefixes)
+            limit (int): Maximum results
+            fuzzy (bool): Fall back to typo-tolerant matching when nothing matches exactly
+
+        Returns:
+            list: Employee row dicts
+        """
+        condition = self.fulltext_condition(text)
+        if condition:
+            sql, params = condition
+            query = f"""
+                SELECT * FROM employees
+                WHERE {sql}
+                ORDER BY {sql} DESC, {id_order('Employee_ID')}
+                LIMIT %s
+            """
+            with self.db.checkout() as (connection, cursor):
+                cursor.execute(query, tuple(params + params + [int(limit)]))
+                employees = cursor.fetchall()
+            if employees or not fuzzy:
+                return employees
+
+        ranked = self._get_index().search(text, limit, fuzzy)
+        return self._fetch_ranked([doc_id for doc_id, _ in ranked])
+
+    def _get_index(self):
+        """Trigram index over every employee, loaded on first use"""
+        if self._index is None:
+            with self._index_lock:
+                if self._index is None:
+                    start = time.perf_counter()
+                    index = TrigramIndex()
+                    with self.db.checkout() as (connection, cursor):
+                        cursor.execute("SELECT Employee_ID, FullName, Email, Department FROM employees")
+                        for row in cursor.fetchall():
+                            index.add(row['Employee_ID'], row['FullName'], row['Email'], row['Department'])
+                    self._index = index
+                    print(f"[SEARCH] Indexed {len(index)} employees in {time.perf_counter() - start:.2f}s")
+        return self._index
+
+    def _fetch_ranked(self, employee_ids):
+        """Full rows for employee_ids, in the given order"""
+        if not employee_ids:
+            return []
+        rows = {}
+        with self.db.checkout() as (connection, cursor):
+            for start in range(0, len(employee_ids), 1000):
+                chunk = employee_ids[start:start + 1000]
+                cursor.execute(
+                    f"SELECT * FROM employees WHERE Employee_ID IN ({', '.join(['%s'] * len(chunk))})", chunk)
+                rows.update((row['Employee_ID'], row) for row in cursor.fetchall())
+        return [rows[employee_id] for employee_id in employee_ids if employee_id in rows]
+
+    def on_change(self, event, details):
+        """Change listener: keep the trigram index current once it has been built"""
+        index = self._index
+        if index is None:
+            return
+
+        if event == 'employee_added':
+            employee = details.get('employee') or {}
+            index.add(details.get('employee_id'), employee.get('FullName'), employee.get('Email'),
+                      employee.get('Department'))
+
+        elif event == 'employee_batch_added':
+            for employee in details.get('employees') or []:
+                index.add(employee['Employee_ID'], employee.get('FullName'), employee.get('Email'),
+                          employee.get('Department'))
+
+        elif event == 'employee_updated':
+            changes = details.get('changes') or {}
+            if not SEARCH_COLUMNS.intersection(changes):
+                return
+            # Other searchable columns may be unchanged; read the committed row
+            employee = self.db.get_employee_by_id(details.get('employee_id'))
+            if employee:
+                index.add(employee['Employee_ID'], employee.get('FullName'), employee.get('Email'),
+                          employee.get('Department'))
+
+        elif event == 'employee_deleted':
+            index.remove(details.get('employee_id'))
+
+
+# Sample data for benchmarks
+_FIRST_NAMES = ['maria', 'jose', 'juan', 'ana', 'mark', 'john', 'michael', 'angel', 'christian', 'joshua',
+                'daniel', 'grace', 'joy', 'kristine', 'paolo', 'carlo', 'miguel', 'andrea', 'patricia', 'ramon',
+                'elena', 'rafael', 'sofia', 'gabriel', 'isabel', 'antonio', 'teresa', 'manuel', 'lucia', 'pedro']
+_LAST_NAMES = ['santos', 'reyes', 'cruz', 'bautista', 'ocampo', 'garcia', 'mendoza', 'torres', 'tomas',
+               'andrada', 'castillo', 'flores', 'villanueva', 'ramos', 'castro', 'rivera', 'aquino', 'navarro',
+               'salazar', 'mercado', 'abueva', 'dela', 'fernandez', 'gonzales', 'lopez', 'morales', 'pascual']
+_DEPARTMENTS = ['Finance', 'Human Resources', 'IT', 'Operations', 'Sales', 'Marketing', 'Logistics']
+
+
+def _sample_roster(size, seed=42):
+    """Yield (id, name, email, department) with surnames varied enough to be realistic"""
+    rng = random.Random(seed)
+    for number in range(size):
+        first = rng.choice(_FIRST_NAMES)
+        last = rng.choice(_LAST_NAMES) + rng.choice(['', 'n', 'o', 'a', 'es', 'ez', 'ino', 'illa']) + \
+            (str(rng.randrange(100)) if rng.random() < 0.3 else '')
+        yield (f"E{number:03d}", f"{first.title()} {last.title()}", f"{first}.{last}{number}@payease.ph",
+               rng.choice(_DEPARTMENTS))
+
+
+def _time_queries(search, queries, repeat=3):
+    """Average milliseconds per query"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for query in queries:
+            search(query)
+    return (time.perf_counter() - start) * 1000 / (repeat * len(queries))
+
+
+def benchmark_index(sizes=(100_000, 1_000_000)):
+    """Build the trigram index at each size and time exact, prefix and fuzzy queries"""
+    queries = {
+        'exact': ['maria santos', 'reyes', 'finance', 'grace cruz'],
+        'prefix': ['mar', 'jo sa', 'villan', 'human res'],
+        'fuzzy': ['mendosa', 'gonzalez', 'cristian', 'fernandes'],
+    }
+    for size in sizes:
+        index = TrigramIndex()
+        start = time.perf_counter()
+        for employee_id, name, email, department in _sample_roster(size):
+            index.add(employee_id, name, email, department)
+        index._vocabulary()  # Sorted once here rather than inside the first timed query
+        build = time.perf_counter() - start
+        print(f"[SEARCH] {size:,} employees: index built in {build:.1f}s "
+              f"({len(index._postings):,} distinct words)")
+        for kind, terms in queries.items():
+            milliseconds = _time_queries(lambda query: index.search(query, DEFAULT_LIMIT, kind == 'fuzzy'), terms)
+            print(f"[SEARCH]   {kind:<6} {milliseconds:8.2f} ms/query")
+
+
+def benchmark_type_ahead(sizes=(10_000, 100_000)):
+    """Time PrefixIndex keystrokes and single-row updates on name/email rosters"""
+    keystrokes = ['m', 'ma', 'mar', 'mari', 'maria', 'maria s', 'maria sa', 'maria santos']
+    for size in sizes:
+        roster = [(employee_id, name, email) for employee_id, name, email, _ in _sample_roster(size)]
+        index = PrefixIndex()
+        start = time.perf_counter()
+        index.reset(roster)
+        build = time.perf_counter() - start
+        print(f"[SEARCH] Type-ahead over {size:,} employees: index built in {build * 1000:.0f} ms")
+        for keystroke in keystrokes:
+            milliseconds = _time_queries(index.match, [keystroke], repeat=20)
+            print(f"[SEARCH]   {keystroke!r:<16} {milliseconds:8.3f} ms")
+        start = time.perf_counter()
+        index.add(roster[0][0], 'Renamed Employee', 'renamed@payease.ph')
+        print(f"[SEARCH]   one-row update {(time.perf_counter() - start) * 1000:8.3f} ms")
+
+
+def benchmark_mysql(db):
+    """Compare the old LIKE scan with the current search on the live employees table"""
+    queries = ['maria', 'santos', 'finance', 'gra cru']
+
+    def like(term):
+        pattern = f"%{term}%"
+        with db.checkout() as (connection, cursor):
+            cursor.execute("SELECT * FROM employees WHERE FullName LIKE %s OR Email LIKE %s OR Department LIKE %s "
+                           f"ORDER BY {id_order('Employee_ID')}", (pattern, pattern, pattern))
+            cursor.fetchall()
+
+    with db.checkout() as (connection, cursor):
+        cursor.execute("SELECT COUNT(*) AS total FROM employees")
+        total = cursor.fetchone()['total']
+
+    search = EmployeeSearch(db)
+    print(f"[SEARCH] Live table: {total:,} employees, FULLTEXT {'on' if search.has_fulltext() else 'off'}")
+    print(f"[SEARCH]   LIKE   {_time_queries(like, queries):8.2f} ms/query")
+    print(f"[SEARCH]   search {_time_queries(search.search, queries):8.2f} ms/query")
+
+
+def main(argv=None):
+    """Command line entry point; returns the process exit code"""
+    parser = argparse.ArgumentParser(description="Employee search benchmarks")
+    parser.add_argument('command', choices=['benchmark'])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100_000, 1_000_000],
+                        help="Synthetic roster sizes for the in-process index")
+    parser.add_argument('--mysql', action='store_true', help="Also time LIKE vs search on the live database")
+    args = parser.parse_args(argv)
+
+    benchmark_index(args.sizes)
+    benchmark_type_ahead()
+
+    if args.mysql:
+        from Model.database import get_db_connection
+        db = get_db_connection(pool_size=0)
+        if not db.is_connected() and not db.connect():
+            print("[SEARCH] Could not connect to the database")
+            return 2
+        benchmark_mysql(db)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""
+Entity Cache Module for PayEase
+Bounded read-through cache for single-row lookups such as get_employee_by_id()
+
+Entries are evicted least recently used first once max_size is reached and
+expire after ttl seconds, so writes from other clients show up within the
+TTL. Writes made through this process invalidate their entries directly.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class EntityCache:
+    """LRU cache with a TTL and hit/miss counters"""
+
+    def __init__(self, max_size=1024, ttl=60):
+        """
+        Initialize cache
+
+        Args:
+            max_size (int): Entries kept before the least recently used is evicted
+            ttl (float): Seconds an entry stays valid
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (expires_at, value), oldest use first
+        self._lock = threading.Lock()
+        self._generation = 0  # Bumped by every invalidation
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_load(self, key, load):
+        """
+        Cached value for key, calling load() on a miss
+
+        A copy of the cached dict is returned so callers cannot change the
+        cached entry. None results are returned but not cached.
+
+        Args:
+            key: Cache key
+            load (callable): Returns the value (a dict or None)
+
+        Returns:
+            dict or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return dict(entry[1])
+                del self._entries[key]
+            self.misses += 1
+            generation = self._generation
+
+        value = load()
+        if value is None:
+            return None
+
+        with self._lock:
+            # A load that raced with an invalidation may hold the old row; serve it once, don't keep it
+            if generation == self._generation:
+                self._entries[key] = (time.monotonic() + self.ttl, dict(value))
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return value
+
+    def peek(self, key):
+        """
+        Cached value for key without loading it (not counted as a hit or miss)
+
+        Returns:
+            dict or None: Copy of the cached value, None when missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                return None
+            return dict(entry[1])
+
+    def invalidate(self, key):
+        """Drop one entry"""
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Drop every entry (counters are kept)"""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self):
+        """
+        Cache counters
+
+        Returns:
+            dict: hits, misses, evictions, size, max_size, hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
@@ -0,0 +1,232 @@
+"""
+ID Allocator Module for PayEase
+Hands out formatted IDs (E000, E001, ... E1000) from counter rows in id_sequences
+
+Each allocation is a single UPDATE of one counter row, so it never scans the
+table the IDs end up in. The row lock taken by the UPDATE makes concurrent
+allocations queue behind each other, and LAST_INSERT_ID() returns the new
+value to the session that changed it, so no two callers get the same number.
+Bulk importers can reserve a whole block in the same single statement.
+
+Usage:
+    python -m Model.id_allocator stress [--threads 8] [--rounds 200] [--block-size 1]
+"""
+
+import argparse
+import sys
+import threading
+import time
+from datetime import datetime
+
+from mysql.connector import Error
+
+
+EMPLOYEE_SEQUENCE = 'employee'
+STRESS_SEQUENCE = 'stress_test'
+
+
+def format_id(prefix, number, min_digits=3):
+    """
+    Format a sequence number as an ID, zero padded to at least min_digits
+
+    Numbers that need more digits simply get longer (E999 -> E1000).
+    """
+    return f"{prefix}{number:0{min_digits}d}"
+
+
+def id_order(column, newest_first=True):
+    """
+    ORDER BY terms sorting IDs from format_id() by number
+
+    A string sort puts E999 after E1000. Zero padding is a minimum, so a
+    longer ID is always a larger number: sort by length, then the string.
+
+    Args:
+        column (str): ID column, e.g. 'Employee_ID'
+        newest_first (bool): Highest number first
+
+    Returns:
+        str: SQL for ORDER BY
+    """
+    direction = 'DESC' if newest_first else 'ASC'
+    return f"CHAR_LENGTH({column}) {direction}, {column} {direction}"
+
+
+def older_than(column, id_value):
+    """
+    WHERE condition for IDs numbered below id_value, matching id_order()
+
+    Used as the keyset condition when paging newest first.
+
+    Returns:
+        tuple: (SQL condition, params list)
+    """
+    condition = (f"(CHAR_LENGTH({column}) < CHAR_LENGTH(%s) "
+                 f"OR (CHAR_LENGTH({column}) = CHAR_LENGTH(%s) AND {column} < %s))")
+    return (condition, [id_value, id_value, id_value])
+
+
+class IdSequence:
+    """Allocates IDs from one counter row in id_sequences"""
+
+    def __init__(self, db, name=EMPLOYEE_SEQUENCE):
+        """
+        Initialize sequence
+
+        Args:
+            db (DatabaseConnection): Database holding id_sequences
+            name (str): Counter row to allocate from
+        """
+        self.db = db
+        self.name = name
+
+    def allocate(self, count=1):
+        """
+        Reserve count consecutive IDs
+
+        Args:
+            count (int): Number of IDs needed
+
+        Returns:
+            list: IDs in ascending order
+
+        Raises:
+            Error: If the counter row is missing or cannot be updated
+        """
+        if count <= 0:
+            return []
+
+        with self.db.checkout() as (connection, cursor):
+            cursor.execute(
+                "UPDATE id_sequences SET next_value = LAST_INSERT_ID(next_value + %s), updated_at = %s "
+                "WHERE name = %s",
+                (int(count), datetime.now(), self.name)
+            )
+            if cursor.rowcount != 1:
+                connection.rollback()
+                raise Error(msg=f"ID sequence '{self.name}' does not exist")
+
+            cursor.execute(
+                "SELECT prefix, min_digits, LAST_INSERT_ID() AS end_value FROM id_sequences WHERE name = %s",
+                (self.name,)
+            )
+            row = cursor.fetchone()
+            connection.commit()
+
+        end_value = int(row['end_value'])
+        return [format_id(row['prefix'], number, row['min_digits'])
+                for number in range(end_value - count, end_value)]
+
+    def next_id(self):
+        """Reserve a single ID"""
+        return self.allocate(1)[0]
+
+    def create(self, prefix, min_digits=3, start=0):
+        """
+        Add the counter row if it does not exist yet
+
+        Returns:
+            bool: True if the row was created
+        """
+        with self.db.checkout() as (connection, cursor):
+            cursor.execute(
+                "INSERT IGNORE INTO id_sequences (name, prefix, min_digits, next_value, updated_at) "
+                "VALUES (%s, %s, %s, %s, %s)",
+                (self.name, prefix, min_digits, start, datetime.now())
+            )
+            created = cursor.rowcount == 1
+            connection.commit()
+        return created
+
+    def drop(self):
+        """Remove the counter row"""
+        with self.db.checkout() as (connection, cursor):
+            cursor.execute("DELETE FROM id_sequences WHERE name = %s", (self.name,))
+            connection.commit()
+
+
+def stress_test(db, threads=8, rounds=200, block_size=1):
+    """
+    Allocate from many connections at once and check no ID is handed out twice
+
+    Runs against a scratch sequence, so real employee IDs are not consumed.
+
+    Args:
+        db (DatabaseConnection): Pooled connection with at least `threads` connections
+        threads (int): Concurrent allocating threads
+        rounds (int): Allocations per thread
+        block_size (int): IDs per allocation
+
+    Returns:
+        tuple: (success: bool, message: str)
+    """
+    sequence = IdSequence(db, STRESS_SEQUENCE)
+    sequence.drop()
+    sequence.create('S', min_digits=3)
+
+    results = [[] for _ in range(threads)]
+    errors = []
+    barrier = threading.Barrier(threads)
+
+    def worker(index):
+        barrier.wait()
+        try:
+            for _ in range(rounds):
+                results[index].extend(sequence.allocate(block_size))
+        except Error as e:
+            errors.append(str(e))
+
+    workers = [threading.Thread(target=worker, args=(index,)) for index in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    try:
+        sequence.drop()
+    except Error as e:
+        print(f"[IDS WARNING] Could not remove the {STRESS_SEQUENCE} sequence: {e}")
+
+    allocated = [value for chunk in results for value in chunk]
+    expected = threads * rounds * block_size
+    unique = set(allocated)
+    numbers = sorted(int(value[1:]) for value in unique)
+
+    if errors:
+        return (False, f"{len(errors)} allocation(s) failed, first error: {errors[0]}")
+    if len(allocated) != len(unique):
+        return (False, f"{len(allocated) - len(unique)} duplicate IDs among {len(allocated)} allocated")
+    if len(allocated) != expected or numbers != list(range(expected)):
+        return (False, f"Expected IDs S000-{format_id('S', expected - 1)} without gaps, got {len(unique)}")
+
+    rate = expected / elapsed if elapsed > 0 else 0.0
+    return (True, f"{expected} IDs from {threads} threads, no duplicates or gaps "
+                  f"({elapsed:.2f}s, {rate:,.0f} IDs/s)")
+
+
+def main(argv=None):
+    """Command line entry point; returns the process exit code"""
+    from Model.database import DatabaseConnection
+
+    parser = argparse.ArgumentParser(description="ID sequence maintenance")
+    parser.add_argument('command', choices=['stress'], help="stress: concurrent allocation check")
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--rounds', type=int, default=200)
+    parser.add_argument('--block-size', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    db = DatabaseConnection(pool_size=args.threads)
+    if not db.connect():
+        print("[IDS] Could not connect to the database")
+        return 2
+
+    success, message = stress_test(db, args.threads, args.rounds, args.block_size)
+    print(f"[IDS] {'PASS' if success else 'FAIL'}: {message}")
+    db.disconnect()
+    return 0 if success else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,325 @@
+"""
+Login Guard Module for PayEase
+In-process login throttling and lockout tracking for verify_login()
+
+Every login used to write to accounts: failed_login_attempts on a failure,
+last_login and the reset counters on a success. The guard keeps that state
+in memory instead and writes it back in one batch every few seconds.
+
+The batch only ever adds to failed_login_attempts (a success adds the
+negative of the failures it clears) and sets last_login; it never writes
+is_locked or locked_until. A lock set meanwhile by another client or by an
+administrator therefore survives the batch, and failures counted by
+several clients add up in the database. Locking is written at once, so
+every client sees the lock; unlocking only happens for a lock whose
+locked_until has passed, with a conditional UPDATE that cannot touch a
+newer or manual lock.
+
+Attempts are also rate limited with token buckets, one per username and
+one per source (the machine the login comes from), before any bcrypt work
+is done.
+"""
+
+import atexit
+import socket
+import threading
+import time
+from datetime import datetime, timedelta
+
+from mysql.connector import Error
+
+
+MAX_FAILED_ATTEMPTS = 5  # Failed logins in a row before the account locks
+LOCKOUT_DURATION = timedelta(minutes=15)
+FLUSH_INTERVAL = 5.0     # Seconds between batched writes
+
+# Token buckets: (burst capacity, tokens refilled per second)
+USERNAME_RATE = (10, 1 / 6)  # 10 quick attempts, then one every 6 seconds
+SOURCE_RATE = (120, 2.0)     # A shared kiosk at shift change
+
+DEFAULT_SOURCE = socket.gethostname()
+
+
+class TokenBucket:
+    """Allows bursts up to capacity, then rate attempts per second"""
+
+    __slots__ = ('capacity', 'rate', 'tokens', 'updated')
+
+    def __init__(self, capacity, rate):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self):
+        """Use one token; False when the bucket is empty"""
+        self._refill(time.monotonic())
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+    def is_full(self):
+        """True once the bucket has refilled completely (it can then be forgotten)"""
+        self._refill(time.monotonic())
+        return self.tokens >= self.capacity
+
+
+class LoginGuard:
+    """Rate limits logins and tracks failures and lockouts in memory"""
+
+    def __init__(self, db, max_failed_attempts=MAX_FAILED_ATTEMPTS, lockout_duration=LOCKOUT_DURATION,
+                 flush_interval=FLUSH_INTERVAL):
+        """
+        Initialize guard
+
+        Args:
+            db (DatabaseConnection): Database holding the accounts table
+            max_failed_attempts (int): Failures in a row that lock the account
+            lockout_duration (timedelta): How long a lock lasts (locked_until)
+            flush_interval (float): Seconds between batched writes of pending state
+        """
+        self.db = db
+        self.max_failed_attempts = max_failed_attempts
+        self.lockout_duration = lockout_duration
+        self.flush_interval = flush_interval
+
+        self._lock = threading.Lock()
+        self._user_buckets = {}
+        self._source_buckets = {}
+        # account id -> changes not yet written:
+        # {'failed': int (added to failed_login_attempts), 'last_login': datetime or None,
+        #  'locked_until': datetime or None (a lock whose immediate write failed)}
+        self._pending = {}
+        self._flusher = None
+        self._stop = threading.Event()
+
+    def allow_attempt(self, username, source=None):
+        """
+        Take a token from the username and source buckets
+
+        Returns:
+            bool: False when either bucket is empty (too many attempts)
+        """
+        key = (username or '').strip().lower()
+        source = source or DEFAULT_SOURCE
+        with self._lock:
+            user_bucket = self._user_buckets.get(key)
+            if user_bucket is None:
+                user_bucket = self._user_buckets[key] = TokenBucket(*USERNAME_RATE)
+            source_bucket = self._source_buckets.get(source)
+            if source_bucket is None:
+                source_bucket = self._source_buckets[source] = TokenBucket(*SOURCE_RATE)
+            return user_bucket.take() and source_bucket.take()
+
+    def account_state(self, account):
+        """
+        Current lockout state of an account row combined with the unwritten in-memory changes
+
+        The account is locked if either the row or this process says so. A
+        row lock whose locked_until has passed is cleared in the database
+        here, so the failures counted towards it start over.
+
+        Args:
+            account (dict): accounts row with id, failed_login_attempts, is_locked, locked_until
+
+        Returns:
+            tuple: (failed_attempts: int, locked: bool, locked_until: datetime or None)
+        """
+        now = datetime.now()
+        failed = account.get('failed_login_attempts') or 0
+        locked = bool(account.get('is_locked'))
+        locked_until = account.get('locked_until')
+
+        if locked and locked_until is not None and locked_until <= now:
+            self._clear_expired_lock(account['id'], now)
+            failed, locked, locked_until = 0, False, None
+        # is_locked without locked_until is a manual lock and never expires
+
+        with self._lock:
+            pending = self._pending.get(account['id'])
+            if pending is not None:
+                failed += pending['failed']
+                pending_until = pending['locked_until']
+                if pending_until is not None and pending_until > now:
+                    if not locked:
+                        locked_until = pending_until
+                    elif locked_until is not None:
+                        locked_until = max(locked_until, pending_until)
+                    locked = True
+        return (max(failed, 0), locked, locked_until if locked else None)
+
+    def _clear_expired_lock(self, account_id, now):
+        """Unlock an account whose lock ran out (leaves newer and manual locks alone)"""
+        with self._lock:
+            pending = self._pending.get(account_id)
+            if pending is not None:
+                pending['failed'] = 0  # Counted towards the lock that just ended
+        try:
+            with self.db.checkout() as (connection, cursor):
+                cursor.execute("""
+                    UPDATE accounts
+                    SET failed_login_attempts = 0, is_locked = 0, locked_until = NULL
+                    WHERE id = %s AND is_locked = 1 AND locked_until IS NOT NULL AND locked_until <= %s
+                """, (account_id, now))
+                connection.commit()
+        except Error as e:
+            print(f"[LOGIN GUARD] Failed to clear expired lock for account {account_id}: {e}")
+
+    def record_success(self, account_id, failed_attempts=0):
+        """
+        Queue last_login and the counter reset for the next batch
+
+        Args:
+            account_id (int): accounts.id
+            failed_attempts (int): Failures being cleared, from account_state()
+        """
+        with self._lock:
+            pending = self._pending.setdefault(account_id, {'failed': 0, 'last_login': None,
+                                                            'locked_until': None})
+            pending['failed'] -= failed_attempts
+            pending['last_login'] = datetime.now()
+        self._ensure_flusher()
+
+    def record_failure(self, account_id, failed_attempts):
+        """
+        Count a failed login; locks the account (written at once) on the last allowed failure
+
+        Args:
+            account_id (int): accounts.id
+            failed_attempts (int): Failures so far, from account_state()
+
+        Returns:
+            tuple: (failed_attempts: int, locked: bool)
+        """
+        failed = failed_attempts + 1
+        with self._lock:
+            pending = self._pending.setdefault(account_id, {'failed': 0, 'last_login': None,
+                                                            'locked_until': None})
+            pending['failed'] += 1
+            if failed >= self.max_failed_attempts:
+                pending['locked_until'] = datetime.now() + self.lockout_duration
+                change = self._pending.pop(account_id)
+            else:
+                change = None
+        if change is None:
+            self._ensure_flusher()
+            return (failed, False)
+
+        if not self._write_lock(account_id, change):
+            # Keep the lock in memory so it still applies here and is retried with the next batch
+            with self._lock:
+                newer = self._pending.get(account_id)
+                if newer is not None:
+                    change['failed'] += newer['failed']
+                    change['last_login'] = newer['last_login'] or change['last_login']
+                self._pending[account_id] = change
+            self._ensure_flusher()
+        return (failed, True)
+
+    def _write_lock(self, account_id, change):
+        """
+        Lock an account along with its unwritten changes
+
+        A manual lock (no locked_until) stays manual, and an existing lock
+        that runs longer keeps its end time.
+
+        Returns:
+            bool: True if written
+        """
+        try:
+            with self.db.checkout() as (connection, cursor):
+                cursor.execute("""
+                    UPDATE accounts
+                    SET failed_login_attempts = GREATEST(failed_login_attempts + %s, 0),
+                        locked_until = CASE
+                            WHEN is_locked = 1 AND locked_until IS NULL THEN NULL
+                            ELSE GREATEST(COALESCE(locked_until, %s), %s)
+                        END,
+                        is_locked = 1,
+                        last_login = COALESCE(%s, last_login)
+                    WHERE id = %s
+                """, (change['failed'], change['locked_until'], change['locked_until'],
+                      change['last_login'], account_id))
+                connection.commit()
+            return True
+        except Error as e:
+            print(f"[LOGIN GUARD] Failed to write lock for account {account_id}: {e}")
+            return False
+
+    def flush(self):
+        """
+        Write all pending login state in one batch
+
+        Returns:
+            int: Accounts written
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            # Forget buckets that have refilled; they behave like new ones
+            for buckets in (self._user_buckets, self._source_buckets):
+                for key in [key for key, bucket in buckets.items() if bucket.is_full()]:
+                    del buckets[key]
+        if not pending:
+            return 0
+
+        # Locks whose immediate write failed are retried one by one
+        locks = {account_id: change for account_id, change in pending.items()
+                 if change['locked_until'] is not None}
+        failed_locks = {account_id: change for account_id, change in locks.items()
+                        if not self._write_lock(account_id, change)}
+
+        rows = [(change['failed'], change['last_login'], account_id)
+                for account_id, change in pending.items() if account_id not in locks]
+        written = len(locks) - len(failed_locks)
+        unwritten = dict(failed_locks)
+        if rows:
+            try:
+                with self.db.checkout() as (connection, cursor):
+                    cursor.executemany("""
+                        UPDATE accounts
+                        SET failed_login_attempts = GREATEST(failed_login_attempts + %s, 0),
+                            last_login = COALESCE(%s, last_login)
+                        WHERE id = %s
+                    """, rows)
+                    connection.commit()
+                written += len(rows)
+            except Error as e:
+                print(f"[LOGIN GUARD] Failed to write login state for {len(rows)} accounts: {e}")
+                unwritten.update((account_id, pending[account_id]) for _, _, account_id in rows)
+
+        if unwritten:
+            with self._lock:
+                # Put the changes back, merged with anything recorded meanwhile
+                for account_id, change in unwritten.items():
+                    newer = self._pending.get(account_id)
+                    if newer is not None:
+                        change['failed'] += newer['failed']
+                        change['last_login'] = newer['last_login'] or change['last_login']
+                        change['locked_until'] = newer['locked_until'] or change['locked_until']
+                    self._pending[account_id] = change
+        return written
+
+    def _ensure_flusher(self):
+        """Start the background batch writer on first use"""
+        if self._flusher is not None:
+            return
+        with self._lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(target=self._run_flusher, name='login-guard-flush', daemon=True)
+            self._flusher.start()
+        atexit.register(self.stop)
+
+    def _run_flusher(self):
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def stop(self):
+        """Stop the background writer and write whatever is still pending"""
+        self._stop.set()
+        self.flush()
@@ -14,6 +14,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QPixmap, QFont
 from Model.database import get_db_connection
+from Controller.utils.async_query import AsyncQueryRunner
 
 
 def hash_password(password):
@@ -29,6 +30,9 @@ class LoginWindow(QMainWindow):
         self.setWindowTitle("PayEase - Login")
         self.setFixedSize(950, 720)
 
+        # Credential checks run in the background so the window stays responsive
+        self.query_runner = AsyncQueryRunner(self)
+
         # Initialize database connection
         self.db = get_db_connection()
         if not self.db.is_connected():
@@ -258,99 +262,68 @@ class LoginWindow(QMainWindow):
             self.password_input.setFocus()
             return
 
-        # Disable button during authentication
-        self.login_btn.setEnabled(False)
-        self.login_btn.setText("Signing in...")
+        # Disable the form during authentication
+        self.set_loading(True)
+
+        # Check for static admin credentials first
+        if username_or_email.lower() == 'admin' and password == 'admin123':
+            admin_info = {
+                'username': 'admin',
+                'role': 'admin',
+                'employee_id': 'ADMIN-001',
+                'name': 'System Administrator',
+                'email': 'admin@payease.com',
+                'position': 'System Admin',
+                'department': 'Administration',
+                'salary': 0,
+                'phone': '',
+                'address': '',
+                'hire_date': 'N/A'
+            }
+            self.login_success(admin_info)
+            return
 
-        try:
-            # Check for static admin credentials first
-            if username_or_email.lower() == 'admin' and password == 'admin123':
-                admin_info = {
-                    'username': 'admin',
-                    'role': 'admin',
-                    'employee_id': 'ADMIN-001',
-                    'name': 'System Administrator',
-                    'email': 'admin@payease.com',
-                    'position': 'System Admin',
-                    'department': 'Administration',
-                    'salary': 0,
-                    'phone': '',
-                    'address': '',
-                    'hire_date': 'N/A'
-                }
-                self.login_success(admin_info)
-                return
+        # Check credentials in database (bcrypt is slow, so off the GUI thread)
+        self.query_runner.submit(
+            'login', self.authenticate, username_or_email, password,
+            on_result=self.on_authenticated, on_error=self.on_login_error
+        )
 
-            # Check credentials in database
-            success, user_info = self.db.verify_login(username_or_email, password)
+    def authenticate(self, username_or_email, password):
+        """
+        Check credentials against the database (runs on a worker thread)
 
-            # If failed and input looks like email, try as email
-            if not success and "@" in username_or_email:
-                success, user_info = self.verify_by_email(username_or_email, password)
+        Returns:
+            tuple: (success: bool, user_info: dict or None)
+        """
+        success, user_info = self.db.verify_login(username_or_email, password)
 
-            if success and user_info:
-                self.login_success(user_info)
-            else:
-                self.login_failed()
-        except Exception as e:
-            print(f"[LOGIN ERROR] Unexpected error: {e}")
-            self.login_btn.setEnabled(True)
-            self.login_btn.setText("Sign In")
-            self.show_error(f"An unexpected error occurred: {str(e)}")
+        # If failed and input looks like email, try as email
+        if not success and "@" in username_or_email:
+            success, user_info = self.db.verify_login_by_email(username_or_email, password)
 
-    def verify_by_email(self, email, password):
-        """Verify login using email instead of username"""
-        try:
-            if not self.db.is_connected():
-                self.db.connect()
-
-            # Use plain text password (no hashing for consistency)
-            query = """
-                    SELECT a.username,
-                           a.role,
-                           a.employee_id,
-                           e.FullName,
-                           e.Email,
-                           e.Position,
-                           e.Department,
-                           e.Salary,
-                           e.Phone,
-                           e.Address,
-                           e.data_hired,
-                           e.is_archived
-                    FROM accounts a
-                             LEFT JOIN employees e ON a.employee_id = e.Employee_ID
-                    WHERE e.Email = %s \
-                      AND a.password = %s \
-                    """
-            self.db.cursor.execute(query, (email.lower(), password))
-            result = self.db.cursor.fetchone()
-
-            if result:
-                # Check if employee is archived
-                if result['role'] == 'employee' and result.get('is_archived'):
-                    return (False, None)
-
-                user_info = {
-                    'username': result['username'],
-                    'role': result['role'],
-                    'employee_id': result['employee_id'] or 'N/A',
-                    'name': result.get('FullName', result['username']),
-                    'email': result.get('Email', ''),
-                    'position': result.get('Position', 'N/A'),
-                    'department': result.get('Department', 'N/A'),
-                    'salary': float(result.get('Salary', 0)) if result.get('Salary') else 0,
-                    'phone': result.get('Phone', ''),
-                    'address': result.get('Address', ''),
-                    'hire_date': str(result.get('data_hired', '')) if result.get('data_hired') else 'N/A'
-                }
-                return (True, user_info)
-
-            return (False, None)
+        return (success, user_info)
 
-        except Exception as e:
-            print(f"[LOGIN ERROR] Email verification error: {e}")
-            return (False, None)
+    def on_authenticated(self, result):
+        """Handle the background credential check"""
+        success, user_info = result
+        if success and user_info:
+            self.login_success(user_info)
+        else:
+            self.login_failed()
+
+    def on_login_error(self, message):
+        """Handle an unexpected error from the background credential check"""
+        print(f"[LOGIN ERROR] Unexpected error: {message}")
+        self.set_loading(False)
+        self.show_error(f"An unexpected error occurred: {message}")
+
+    def set_loading(self, loading):
+        """Show or clear the signing-in state"""
+        self.login_btn.setEnabled(not loading)
+        self.login_btn.setText("Signing in..." if loading else "Sign In")
+        self.email_input.setEnabled(not loading)
+        self.password_input.setEnabled(not loading)
 
     def login_success(self, user_info):
         """Handle successful login"""
@@ -372,8 +345,7 @@ class LoginWindow(QMainWindow):
             QMessageBox.critical(None, "Error", f"Failed to load dashboard: {str(e)}")
             # Reopen login window
             self.show()
-            self.login_btn.setEnabled(True)
-            self.login_btn.setText("Sign In")
+            self.set_loading(False)
         except Exception as e:
             import traceback
             error_details = traceback.format_exc()
@@ -381,13 +353,11 @@ class LoginWindow(QMainWindow):
             QMessageBox.critical(None, "Error", f"Unexpected error: {str(e)}\n\nCheck console for details.")
             # Reopen login window
             self.show()
-            self.login_btn.setEnabled(True)
-            self.login_btn.setText("Sign In")
+            self.set_loading(False)
 
     def login_failed(self):
         """Handle failed login"""
-        self.login_btn.setEnabled(True)
-        self.login_btn.setText("Sign In")
+        self.set_loading(False)
         self.show_error("Invalid email/username or password.\nPlease try again.")
         self.password_input.clear()
         self.password_input.setFocus()
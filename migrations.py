@@ -0,0 +1,354 @@
+"""
+Schema Migrations Module for PayEase
+Applies versioned schema changes once per process and caches the column layout
+"""
+
+import threading
+from datetime import datetime
+
+from mysql.connector import Error
+
+
+SCHEMA_VERSION_TABLE = 'schema_version'
+MIGRATION_LOCK_NAME = 'payease_schema_migration'
+
+# Per-process state shared by every DatabaseConnection pointing at the same database
+_schema_lock = threading.Lock()
+_migrated_databases = set()
+_column_layouts = {}
+_index_layouts = {}
+
+
+def _add_column(migrator, cursor, table, column, definition):
+    """Add a column unless it is already present"""
+    if migrator.has_column(table, column):
+        print(f"[DB] {column} column already exists in {table} table")
+        return
+    cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+    print(f"[DB] Added {column} column to {table} table")
+
+
+def migrate_accounts_employee_id(migrator, cursor):
+    """Link accounts to employee records"""
+    if migrator.has_column('accounts', 'employee_id'):
+        print("[DB] employee_id column already exists in accounts table")
+        return
+    cursor.execute("""
+        ALTER TABLE accounts
+        ADD COLUMN employee_id VARCHAR(50) NULL,
+        ADD INDEX idx_employee_id (employee_id)
+    """)
+    print("[DB] Added employee_id column to accounts table")
+
+
+def migrate_employees_is_archived(migrator, cursor):
+    """Soft delete flag for employees"""
+    _add_column(migrator, cursor, 'employees', 'is_archived', "TINYINT(1) DEFAULT 0")
+
+
+def migrate_payroll_released_date(migrator, cursor):
+    """Release timestamp for payroll records"""
+    _add_column(migrator, cursor, 'payroll', 'released_date', "DATETIME NULL")
+
+
+def migrate_attendance_table(migrator, cursor):
+    """Daily attendance records"""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS attendance (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            employee_id VARCHAR(50) NOT NULL,
+            date DATE NOT NULL,
+            clock_in TIME,
+            clock_out TIME,
+            status VARCHAR(20) DEFAULT 'Present',
+            notes TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            INDEX idx_employee_id (employee_id),
+            INDEX idx_date (date),
+            UNIQUE KEY unique_attendance (employee_id, date)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+    """)
+
+
+def migrate_activity_log_table(migrator, cursor):
+    """Append-only feed of data changes for the dashboard"""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS activity_log (
+            id BIGINT AUTO_INCREMENT PRIMARY KEY,
+            event_type VARCHAR(50) NOT NULL,
+            icon VARCHAR(16) NOT NULL,
+            title VARCHAR(100) NOT NULL,
+            detail VARCHAR(255) DEFAULT NULL,
+            employee_id VARCHAR(50) DEFAULT NULL,
+            created_at DATETIME NOT NULL
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+    """)
+
+
+# Aggregates attendance into one row per employee and month. The WHERE clause is
+# filled in by callers: '' for a full rebuild, or one employee's month.
+ATTENDANCE_MONTHLY_SELECT = """
+    SELECT employee_id,
+           YEAR(date) AS year,
+           MONTH(date) AS month,
+           SUM(status = 'Present') AS present_days,
+           SUM(status = 'Late') AS late_days,
+           SUM(status = 'Half Day') AS half_days,
+           SUM(status = 'Absent') AS absent_days,
+           COALESCE(SUM(CASE WHEN clock_out > clock_in
+                             THEN TIME_TO_SEC(TIMEDIFF(clock_out, clock_in)) DIV 60
+                             ELSE 0 END), 0) AS worked_minutes
+    FROM attendance
+    {where}
+    GROUP BY employee_id, YEAR(date), MONTH(date)
+"""
+
+ATTENDANCE_MONTHLY_INSERT = """
+    INSERT INTO attendance_monthly
+        (employee_id, year, month, present_days, late_days, half_days,
+         absent_days, worked_minutes, updated_at)
+    SELECT s.*, NOW() FROM ({select}) s
+"""
+
+
+def migrate_attendance_monthly_table(migrator, cursor):
+    """Per employee and month attendance rollup, filled from existing records"""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS attendance_monthly (
+            employee_id VARCHAR(50) NOT NULL,
+            year SMALLINT NOT NULL,
+            month TINYINT NOT NULL,
+            present_days INT NOT NULL DEFAULT 0,
+            late_days INT NOT NULL DEFAULT 0,
+            half_days INT NOT NULL DEFAULT 0,
+            absent_days INT NOT NULL DEFAULT 0,
+            worked_minutes INT NOT NULL DEFAULT 0,
+            updated_at DATETIME NOT NULL,
+            PRIMARY KEY (year, month, employee_id),
+            INDEX idx_employee_id (employee_id)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+    """)
+    cursor.execute("DELETE FROM attendance_monthly")
+    cursor.execute(ATTENDANCE_MONTHLY_INSERT.format(select=ATTENDANCE_MONTHLY_SELECT.format(where='')))
+
+
+def migrate_id_sequences_table(migrator, cursor):
+    """Counter rows for ID allocation, seeded past the highest existing employee ID"""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS id_sequences (
+            name VARCHAR(50) PRIMARY KEY,
+            prefix VARCHAR(10) NOT NULL DEFAULT '',
+            min_digits TINYINT UNSIGNED NOT NULL DEFAULT 3,
+            next_value BIGINT UNSIGNED NOT NULL DEFAULT 0,
+            updated_at DATETIME NOT NULL
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+    """)
+    # One last scan of employees; allocations read the counter row from here on
+    cursor.execute("""
+        INSERT IGNORE INTO id_sequences (name, prefix, min_digits, next_value, updated_at)
+        SELECT 'employee', 'E', 3, COALESCE(MAX(CAST(SUBSTRING(Employee_ID, 2) AS UNSIGNED)) + 1, 0), NOW()
+        FROM employees
+        WHERE Employee_ID REGEXP '^E[0-9]+$'
+    """)
+
+
+EMPLOYEE_FULLTEXT_INDEX = 'ft_employee_search'
+EMPLOYEE_FULLTEXT_COLUMNS = 'FullName, Email, Department'
+
+
+def migrate_employees_fulltext_index(migrator, cursor):
+    """FULLTEXT index for employee search (optional: search falls back to an in-process index)"""
+    cursor.execute("""
+        SELECT 1 FROM INFORMATION_SCHEMA.STATISTICS
+        WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'employees' AND INDEX_NAME = %s
+        LIMIT 1
+    """, (migrator.db.database, EMPLOYEE_FULLTEXT_INDEX))
+    if cursor.fetchone():
+        print(f"[DB] {EMPLOYEE_FULLTEXT_INDEX} index already exists on employees table")
+        return
+    try:
+        cursor.execute(f"ALTER TABLE employees ADD FULLTEXT INDEX {EMPLOYEE_FULLTEXT_INDEX} "
+                       f"({EMPLOYEE_FULLTEXT_COLUMNS})")
+        print(f"[DB] Added {EMPLOYEE_FULLTEXT_INDEX} FULLTEXT index to employees table")
+    except Error as e:
+        print(f"[DB WARNING] FULLTEXT index unavailable, employee search will use the in-process index: {e}")
+
+
+def migrate_accounts_lockout_columns(migrator, cursor):
+    """Login bookkeeping columns, including locked_until for timed lockouts"""
+    _add_column(migrator, cursor, 'accounts', 'last_login', "DATETIME NULL")
+    _add_column(migrator, cursor, 'accounts', 'failed_login_attempts', "INT DEFAULT 0")
+    _add_column(migrator, cursor, 'accounts', 'is_locked', "TINYINT(1) DEFAULT 0")
+    _add_column(migrator, cursor, 'accounts', 'locked_until', "DATETIME NULL")
+
+
+# Unique keys that let add_employee() rely on duplicate-key errors instead of lookups
+UNIQUE_USERNAME_INDEX = ('accounts', 'uq_accounts_username', 'username')
+UNIQUE_EMAIL_INDEX = ('employees', 'uq_employees_email', 'Email')
+
+
+def migrate_unique_credentials(migrator, cursor):
+    """Unique usernames and emails (optional: add_employee() checks with lookups while missing)"""
+    for table, index, column in (UNIQUE_USERNAME_INDEX, UNIQUE_EMAIL_INDEX):
+        if migrator.has_index(table, index):
+            print(f"[DB] {index} index already exists on {table} table")
+            continue
+        try:
+            cursor.execute(f"ALTER TABLE {table} ADD UNIQUE INDEX {index} ({column})")
+            print(f"[DB] Added {index} unique index to {table} table")
+        except Error as e:
+            # Existing duplicates have to be cleaned up by hand before the key can be added
+            print(f"[DB WARNING] Could not add {index}, duplicates are checked with lookups instead: {e}")
+
+
+# Ordered list of (version, description, migration). Append new entries; never renumber.
+MIGRATIONS = [
+    (1, "Add accounts.employee_id", migrate_accounts_employee_id),
+    (2, "Add employees.is_archived", migrate_employees_is_archived),
+    (3, "Add payroll.released_date", migrate_payroll_released_date),
+    (4, "Create attendance table", migrate_attendance_table),
+    (5, "Create activity_log table", migrate_activity_log_table),
+    (6, "Create attendance_monthly rollup", migrate_attendance_monthly_table),
+    (7, "Create id_sequences counters", migrate_id_sequences_table),
+    (8, "Add employees FULLTEXT search index", migrate_employees_fulltext_index),
+    (9, "Add accounts lockout columns", migrate_accounts_lockout_columns),
+    (10, "Add unique keys for usernames and emails", migrate_unique_credentials),
+]
+
+
+class SchemaMigrator:
+    """Runs pending migrations and answers column-layout questions from memory"""
+
+    def __init__(self, db):
+        """
+        Initialize migrator
+
+        Args:
+            db (DatabaseConnection): Connection used to run migrations
+        """
+        self.db = db
+
+    @property
+    def key(self):
+        """Identifies the database this migrator manages"""
+        return (self.db.host, self.db.database)
+
+    def is_migrated(self):
+        """Check if migrations already ran for this database in this process"""
+        return self.key in _migrated_databases
+
+    def ensure_schema(self):
+        """
+        Apply pending migrations once per process.
+
+        Returns:
+            bool: True if the schema is up to date
+        """
+        if self.is_migrated():
+            return True
+
+        with _schema_lock:
+            if self.is_migrated():
+                return True
+            try:
+                self.migrate()
+                _migrated_databases.add(self.key)
+                return True
+            except Error as e:
+                print(f"[DB WARNING] Could not apply schema migrations: {e}")
+                return False
+
+    def migrate(self):
+        """
+        Apply every migration newer than the recorded schema version
+
+        Raises:
+            Error: If the migration lock is not acquired within 30 seconds, or a migration fails
+        """
+        with self.db.checkout() as (connection, cursor):
+            # Serialize migrations across clients starting at the same time
+            cursor.execute("SELECT GET_LOCK(%s, 30) AS acquired", (MIGRATION_LOCK_NAME,))
+            if cursor.fetchone()['acquired'] != 1:
+                # 0 = another client held it for 30s, NULL = lock error; connect() fails and retries next time
+                raise Error(msg=f"Could not acquire the {MIGRATION_LOCK_NAME} lock; another client is migrating")
+            try:
+                cursor.execute(f"""
+                    CREATE TABLE IF NOT EXISTS {SCHEMA_VERSION_TABLE} (
+                        version INT PRIMARY KEY,
+                        description VARCHAR(255) NOT NULL,
+                        applied_at DATETIME NOT NULL
+                    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+                """)
+                cursor.execute(f"SELECT COALESCE(MAX(version), 0) AS version FROM {SCHEMA_VERSION_TABLE}")
+                current_version = cursor.fetchone()['version']
+
+                self._load_layout(cursor)
+
+                for version, description, migration in MIGRATIONS:
+                    if version <= current_version:
+                        continue
+                    migration(self, cursor)
+                    cursor.execute(
+                        f"INSERT IGNORE INTO {SCHEMA_VERSION_TABLE} (version, description, applied_at) "
+                        f"VALUES (%s, %s, %s)",
+                        (version, description, datetime.now())
+                    )
+                    connection.commit()
+                    self._load_layout(cursor)
+                    print(f"[DB] Applied schema migration {version}: {description}")
+
+                print(f"[DB] Schema is at version {max(current_version, self.latest_version())}")
+            finally:
+                cursor.execute("SELECT RELEASE_LOCK(%s) AS released", (MIGRATION_LOCK_NAME,))
+                cursor.fetchone()
+
+    @staticmethod
+    def latest_version():
+        """Version the code expects the schema to be at"""
+        return MIGRATIONS[-1][0] if MIGRATIONS else 0
+
+    def _load_layout(self, cursor):
+        """Read the column and index layout of every table in the database into the process cache"""
+        cursor.execute("""
+            SELECT TABLE_NAME, COLUMN_NAME
+            FROM INFORMATION_SCHEMA.COLUMNS
+            WHERE TABLE_SCHEMA = %s
+        """, (self.db.database,))
+
+        layout = {}
+        for row in cursor.fetchall():
+            layout.setdefault(row['TABLE_NAME'].lower(), set()).add(row['COLUMN_NAME'].lower())
+
+        cursor.execute("""
+            SELECT DISTINCT TABLE_NAME, INDEX_NAME
+            FROM INFORMATION_SCHEMA.STATISTICS
+            WHERE TABLE_SCHEMA = %s
+        """, (self.db.database,))
+
+        indexes = {}
+        for row in cursor.fetchall():
+            indexes.setdefault(row['TABLE_NAME'].lower(), set()).add(row['INDEX_NAME'].lower())
+        _column_layouts[self.key] = layout
+        _index_layouts[self.key] = indexes
+
+    def _layout(self):
+        """Cached layout, loading it once if migrations have not populated it"""
+        layout = _column_layouts.get(self.key)
+        if layout is None:
+            with self.db.checkout() as (connection, cursor):
+                self._load_layout(cursor)
+            layout = _column_layouts[self.key]
+        return layout
+
+    def has_table(self, table):
+        """Check if a table exists (answered from the in-process cache)"""
+        return table.lower() in self._layout()
+
+    def has_column(self, table, column):
+        """Check if a column exists (answered from the in-process cache)"""
+        return column.lower() in self._layout().get(table.lower(), set())
+
+    def has_index(self, table, index):
+        """Check if an index exists (answered from the in-process cache)"""
+        self._layout()
+        return index.lower() in _index_layouts.get(self.key, {}).get(table.lower(), set())
@@ -0,0 +1,191 @@
+"""
+Money Utilities - Pure Business Logic (NO UI CODE)
+
+Amounts are carried as integer centavos for bulk arithmetic and converted
+to Decimal at the edges (database, UI), matching the DECIMAL(10,2) columns
+exactly. Floats never take part in totals.
+
+Usage:
+    python -m Controller.utils.money benchmark [--amounts 1000000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; plain lists of ints are used instead
+    np = None
+
+
+CENTAVOS_PER_PESO = 100
+CENT = Decimal('0.01')
+
+
+def to_decimal(value):
+    """
+    Convert a value to a Decimal rounded to centavos.
+
+    Args:
+        value: Decimal, int, float, str or None (treated as 0)
+
+    Returns:
+        Decimal: Amount with two decimal places
+
+    Raises:
+        ValueError: If the value is not a valid amount
+    """
+    if value is None or value == '':
+        return Decimal('0.00')
+    try:
+        if isinstance(value, float):
+            # str() gives the shortest repr, so 0.1 becomes Decimal('0.1') not 0.1000000000000000055...
+            value = str(value)
+        return Decimal(value).quantize(CENT, rounding=ROUND_HALF_UP)
+    except (InvalidOperation, TypeError) as e:
+        raise ValueError(f"Invalid amount: {value!r}") from e
+
+
+def to_centavos(value):
+    """
+    Convert an amount to integer centavos.
+
+    Args:
+        value: Decimal, int, float, str or None
+
+    Returns:
+        int: Amount in centavos
+    """
+    return int(to_decimal(value) * CENTAVOS_PER_PESO)
+
+
+def from_centavos(centavos):
+    """
+    Convert integer centavos to a Decimal amount.
+
+    Args:
+        centavos (int): Amount in centavos
+
+    Returns:
+        Decimal: Amount with two decimal places
+    """
+    return Decimal(int(centavos)).scaleb(-2)
+
+
+def divide_round_half_up(numerator, denominator):
+    """
+    Integer division rounded half away from zero (same rule as ROUND_HALF_UP).
+
+    Args:
+        numerator (int): Dividend
+        denominator (int): Positive divisor
+
+    Returns:
+        int: Rounded quotient
+    """
+    quotient = (2 * abs(numerator) + denominator) // (2 * denominator)
+    return quotient if numerator >= 0 else -quotient
+
+
+def centavos_array(values):
+    """
+    Convert a sequence of amounts to an int64 centavos array.
+
+    Args:
+        values (sequence): Amounts (Decimal, int, float, str or None)
+
+    Returns:
+        numpy.ndarray or list: Centavos (list when NumPy is not installed)
+    """
+    centavos = [to_centavos(value) for value in values]
+    if np is None:
+        return centavos
+    return np.array(centavos, dtype=np.int64)
+
+
+def sum_centavos(centavos):
+    """
+    Exact total of a centavos array or list.
+
+    Args:
+        centavos (sequence): Amounts in centavos
+
+    Returns:
+        Decimal: Total amount
+    """
+    if np is not None and isinstance(centavos, np.ndarray):
+        # Python int conversion keeps the total exact for any register size
+        return from_centavos(int(centavos.sum(dtype=np.int64)))
+    return from_centavos(sum(int(c) for c in centavos))
+
+
+def sum_money(values):
+    """
+    Exact total of amounts, equal to SQL SUM() over a DECIMAL(10,2) column.
+
+    Args:
+        values (iterable): Amounts (Decimal, int, float, str or None)
+
+    Returns:
+        Decimal: Total amount
+    """
+    return from_centavos(sum(to_centavos(value) for value in values))
+
+
+def _sample_amounts(count, seed=2025):
+    """Net salaries as the DECIMAL(10,2) column returns them"""
+    rng = random.Random(seed)
+    return [from_centavos(rng.randrange(1_000_000, 15_000_000)) for _ in range(count)]
+
+
+def benchmark_totals(count=1_000_000):
+    """
+    Float loop vs exact totals over count amounts
+
+    The reference is the Decimal sum, which is what SQL SUM() returns for
+    a DECIMAL column. Drift is the float total's distance from it once
+    rounded to centavos, as the old code displayed it.
+
+    Returns:
+        list: (label, seconds, drift_centavos) tuples
+    """
+    amounts = _sample_amounts(count)
+    exact = sum(amounts, Decimal('0.00'))
+    centavos = centavos_array(amounts)
+
+    def float_loop():
+        total = 0.0
+        for amount in amounts:
+            total += float(amount)
+        return to_decimal(round(total, 2))
+
+    results = []
+    for label, total_of in (('float loop', float_loop),
+                            ('sum_money', lambda: sum_money(amounts)),
+                            ('sum_centavos', lambda: sum_centavos(centavos))):
+        start = time.perf_counter()
+        total = total_of()
+        elapsed = time.perf_counter() - start
+        results.append((label, elapsed, to_centavos(total) - to_centavos(exact)))
+    return results
+
+
+def main(argv=None):
+    """Command line entry point; returns the process exit code"""
+    parser = argparse.ArgumentParser(description="Money total benchmark")
+    parser.add_argument('command', choices=['benchmark'])
+    parser.add_argument('--amounts', type=int, default=1_000_000, help="Amounts to total")
+    args = parser.parse_args(argv)
+
+    print(f"[MONEY] Totalling {args.amounts:,} amounts"
+          f"{'' if np is not None else ' (NumPy not installed; centavos are a list)'}")
+    for label, seconds, drift in benchmark_totals(args.amounts):
+        print(f"[MONEY]   {label:<14} {seconds:7.3f}s   drift {drift:+d} centavos")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
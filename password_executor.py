@@ -0,0 +1,262 @@
+"""
+Password Work Executor - Pure Business Logic (NO UI CODE)
+
+bcrypt is deliberately slow. Hashing and verifying inline serializes bulk
+account creation on one core and ties up whichever thread handles a login.
+This module runs that work in a process pool instead:
+
+* hash_async() / verify_async() return concurrent.futures.Future objects;
+  hash() / verify() wait for them.
+* Concurrency is bounded: at most max_pending jobs are queued or running, so
+  a burst of logins cannot queue unbounded work behind the pool.
+* Hashes made with a different cost factor than the configured one are
+  reported by needs_rehash(), so callers can replace them after a successful
+  login while the plain password is at hand.
+
+Usage:
+    python -m Controller.utils.password_executor benchmark [--logins 200] [--threads 1 4 16]
+    python -m Controller.utils.password_executor tune [--target-ms 250]
+"""
+
+import argparse
+import atexit
+import os
+import re
+import sys
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from Controller.utils.password_manager import PasswordManager
+
+
+# Cost factor for new and rehashed passwords; None keeps PasswordManager's own
+DEFAULT_COST = int(os.environ['PAYEASE_BCRYPT_COST']) if os.environ.get('PAYEASE_BCRYPT_COST') else None
+# Worker processes; None = one per core, 0 = hash inline in the caller
+DEFAULT_WORKERS = (int(os.environ['PAYEASE_PASSWORD_WORKERS'])
+                   if os.environ.get('PAYEASE_PASSWORD_WORKERS') else None)
+MAX_PENDING_PER_WORKER = 8
+SUBMIT_TIMEOUT = 10  # Seconds to wait for a free slot before giving up
+
+_BCRYPT_COST = re.compile(r'^\$2[abxy]?\$(\d{2})\$')
+
+
+def hash_cost(password_hash):
+    """Cost factor of a bcrypt hash ('$2b$12$...' -> 12), or None if it is not bcrypt"""
+    match = _BCRYPT_COST.match(password_hash or '')
+    return int(match.group(1)) if match else None
+
+
+def _hash_password(password, cost=None):
+    """
+    Worker: hash a password
+
+    Returns:
+        tuple: (password_hash, salt)
+
+    Raises:
+        ValueError: If PasswordManager rejects the password
+    """
+    if cost is None:
+        return PasswordManager.hash_password(password)
+
+    import bcrypt
+    if not password:
+        raise ValueError("Password cannot be empty")
+    salt = bcrypt.gensalt(rounds=cost)
+    return (bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8'), salt.decode('utf-8'))
+
+
+def _verify_password(password, password_hash, salt=None):
+    """Worker: check a password against a stored hash"""
+    return bool(PasswordManager.verify_password(password, password_hash, salt))
+
+
+class PasswordExecutor:
+    """Runs password hashing and verification in a bounded process pool"""
+
+    def __init__(self, workers=DEFAULT_WORKERS, cost=DEFAULT_COST, max_pending=None):
+        """
+        Initialize executor
+
+        Args:
+            workers (int): Worker processes (None = one per core, 0 = run inline in the caller)
+            cost (int): bcrypt cost factor for new hashes (None = PasswordManager default)
+            max_pending (int): Jobs queued or running at once (defaults to 8 per worker)
+        """
+        self.workers = workers
+        self.cost = cost
+        if max_pending is None:
+            max_pending = (workers or os.cpu_count() or 1) * MAX_PENDING_PER_WORKER
+        self._slots = threading.BoundedSemaphore(max(1, max_pending))
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+    def _get_pool(self):
+        """Start the process pool on first use"""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ProcessPoolExecutor(max_workers=self.workers)
+                    print(f"[PASSWORD] Started password worker pool ({self.workers or os.cpu_count()} processes)")
+        return self._pool
+
+    def _submit(self, func, *args):
+        """Run func(*args) in the pool once a slot is free"""
+        if self.workers == 0:
+            future = Future()
+            try:
+                future.set_result(func(*args))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+
+        if not self._slots.acquire(timeout=SUBMIT_TIMEOUT):
+            raise RuntimeError("Password workers are busy, please try again")
+        try:
+            future = self._get_pool().submit(func, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def hash_async(self, password, cost=None):
+        """
+        Hash a password in the background
+
+        Returns:
+            Future: Resolves to (password_hash, salt); raises ValueError for rejected passwords
+        """
+        return self._submit(_hash_password, password, cost if cost is not None else self.cost)
+
+    def verify_async(self, password, password_hash, salt=None):
+        """
+        Verify a password in the background
+
+        Returns:
+            Future: Resolves to True if the password matches
+        """
+        return self._submit(_verify_password, password, password_hash, salt)
+
+    def hash(self, password, cost=None):
+        """Hash a password, waiting for the result"""
+        return self.hash_async(password, cost).result()
+
+    def verify(self, password, password_hash, salt=None):
+        """Verify a password, waiting for the result"""
+        return self.verify_async(password, password_hash, salt).result()
+
+    def hash_many(self, passwords):
+        """
+        Hash many passwords across all workers
+
+        Returns:
+            list: (password_hash, salt) per password, (None, error) for rejected ones
+        """
+        futures = [self.hash_async(password) for password in passwords]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except ValueError as e:
+                results.append((None, str(e)))
+        return results
+
+    def needs_rehash(self, password_hash):
+        """Check if a stored hash was made with a different cost than the configured one"""
+        if self.cost is None:
+            return False
+        return hash_cost(password_hash) != self.cost
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True, cancel_futures=True)
+                self._pool = None
+
+
+# Shared instance for the running application
+_executor_instance = None
+
+
+def get_password_executor():
+    """Get or create the shared password executor"""
+    global _executor_instance
+    if _executor_instance is None:
+        _executor_instance = PasswordExecutor()
+        atexit.register(_executor_instance.shutdown)
+    return _executor_instance
+
+
+def tune_cost(target_ms=250, minimum=10, maximum=16):
+    """
+    Highest bcrypt cost factor whose hash still takes at most target_ms here
+
+    Returns:
+        tuple: (cost, milliseconds per hash at that cost)
+    """
+    import bcrypt
+    best = (minimum, None)
+    for cost in range(minimum, maximum + 1):
+        start = time.perf_counter()
+        bcrypt.hashpw(b'benchmark-password', bcrypt.gensalt(rounds=cost))
+        milliseconds = (time.perf_counter() - start) * 1000
+        if milliseconds > target_ms and best[1] is not None:
+            break
+        best = (cost, milliseconds)
+    return best
+
+
+def benchmark_logins(logins=200, threads=(1, 4, 16)):
+    """
+    Logins per second when many threads verify at once, inline vs process pool
+
+    Inline verification competes for the calling process; the pool spreads
+    it over every core. Prints one line per thread count.
+    """
+    password = 'benchmark-password'
+    password_hash, salt = PasswordManager.hash_password(password)
+    print(f"[PASSWORD] {logins} logins per run, stored hash cost {hash_cost(password_hash)}")
+
+    executors = (('inline', PasswordExecutor(workers=0)), ('pool', PasswordExecutor()))
+    for label, executor in executors:
+        executor.verify(password, password_hash, salt)  # Start the workers outside the timing
+        for count in threads:
+            per_thread = max(1, logins // count)
+
+            def worker():
+                for _ in range(per_thread):
+                    executor.verify(password, password_hash, salt)
+
+            pool = [threading.Thread(target=worker) for _ in range(count)]
+            start = time.perf_counter()
+            for thread in pool:
+                thread.start()
+            for thread in pool:
+                thread.join()
+            elapsed = time.perf_counter() - start
+            print(f"[PASSWORD]   {label:<6} {count:>3} threads: {per_thread * count / elapsed:8.1f} logins/s")
+        executor.shutdown()
+
+
+def main(argv=None):
+    """Command line entry point; returns the process exit code"""
+    parser = argparse.ArgumentParser(description="Password hashing benchmarks")
+    parser.add_argument('command', choices=['benchmark', 'tune'])
+    parser.add_argument('--logins', type=int, default=200)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 4, 16])
+    parser.add_argument('--target-ms', type=float, default=250)
+    args = parser.parse_args(argv)
+
+    if args.command == 'tune':
+        cost, milliseconds = tune_cost(args.target_ms)
+        print(f"[PASSWORD] Cost {cost} takes {milliseconds:.0f} ms per hash; set PAYEASE_BCRYPT_COST={cost}")
+    else:
+        benchmark_logins(args.logins, args.threads)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,37 @@
+"""
+Payroll Summary Check for PayEase
+Compares the aggregate payroll summary with totals computed row by row
+
+Usage:
+    python -m Model.payroll_check check
+"""
+
+import argparse
+import sys
+
+from Model.database import get_db_connection
+
+
+def main(argv=None):
+    """Command line entry point; returns the process exit code"""
+    parser = argparse.ArgumentParser(description="Check the payroll summary query")
+    parser.add_argument('command', choices=['check'],
+                        help="check: compare get_payroll_summary() with the Python totals")
+    args = parser.parse_args(argv)
+
+    db = get_db_connection(pool_size=0)
+    if not db.is_connected() and not db.connect():
+        print("[PAYROLL] Could not connect to the database")
+        return 2
+
+    problems = db.check_payroll_summary()
+    for problem in problems[:50]:
+        print(f"[PAYROLL] {problem}")
+    if len(problems) > 50:
+        print(f"[PAYROLL] ... and {len(problems) - 50} more")
+    print(f"[PAYROLL] {'OK' if not problems else f'{len(problems)} differences found'}")
+    return 0 if not problems else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,8 +4,12 @@ Payroll Controller - Pure Business Logic (NO UI CODE)
 This controller handles payroll-related business logic and calculations.
 """
 
+import time
 from datetime import datetime
+from decimal import Decimal
 from Model.database import get_db_connection
+from Controller.utils.money import to_decimal, to_centavos, from_centavos, centavos_array, sum_centavos
+from Controller.utils.payroll_kernel import calculate_net_salary, calculate_net_centavos_array
 
 
 class PayrollController:
@@ -38,6 +42,82 @@ class PayrollController:
 
         return (success, payroll_id, msg)
 
+    def run_payroll_period(self, month, year, employee_filter=None, chunk_size=500,
+                           progress_callback=None):
+        """
+        Generate payroll for every active employee in a pay period.
+
+        Employees and attendance counts are loaded in bulk, payslips are
+        calculated in memory and written with multi-row inserts, one
+        transaction per chunk. Employees that already have payroll for the
+        period are skipped.
+
+        Args:
+            month (int): Month number (1-12)
+            year (int): Year
+            employee_filter (dict): Optional 'department', 'role' and/or 'employee_ids'
+            chunk_size (int): Rows per insert/transaction
+            progress_callback (callable): Called as progress_callback(done, total, rows_per_second)
+
+        Returns:
+            dict: Run summary (success, message, processed, skipped, inserted,
+                  elapsed_seconds, rows_per_second)
+        """
+        is_valid, message = self.validate_period(month, year)
+        if not is_valid:
+            return {'success': False, 'message': message, 'processed': 0, 'skipped': 0,
+                    'inserted': 0, 'elapsed_seconds': 0.0, 'rows_per_second': 0.0}
+
+        started = time.perf_counter()
+
+        # Load everything the run needs up front
+        employees = self.db.get_active_employees(employee_filter)
+        attendance_counts = self.db.get_attendance_counts(int(month), int(year))
+        already_processed = self.db.get_processed_employee_ids(int(month), int(year))
+
+        pending = [e for e in employees if e['Employee_ID'] not in already_processed]
+        skipped = len(employees) - len(pending)
+
+        # Calculate every payslip in memory
+        payroll_records = self.calculate_payroll_batch([
+            {
+                'employee_id': employee['Employee_ID'],
+                'month': month,
+                'year': year,
+                'base_salary': employee.get('Salary') or 0,
+                'bonus': 0,
+                'deductions': 0,
+                'present_days': min(attendance_counts.get(employee['Employee_ID'], 0), 31),
+                'status': 'Pending',
+                'notes': ''
+            }
+            for employee in pending
+        ])
+
+        def report_progress(done, total):
+            elapsed = time.perf_counter() - started
+            rate = done / elapsed if elapsed > 0 else 0.0
+            print(f"[PAYROLL] {done}/{total} payslips written ({rate:,.0f} rows/s)")
+            if progress_callback:
+                progress_callback(done, total, rate)
+
+        success, inserted, msg = self.db.add_payroll_batch(
+            payroll_records, chunk_size=chunk_size, progress_callback=report_progress
+        )
+
+        elapsed = time.perf_counter() - started
+        rows_per_second = inserted / elapsed if elapsed > 0 else 0.0
+
+        return {
+            'success': success,
+            'message': msg,
+            'processed': len(payroll_records),
+            'skipped': skipped,
+            'inserted': inserted,
+            'elapsed_seconds': elapsed,
+            'rows_per_second': rows_per_second
+        }
+
     def get_all_payroll(self):
         """Get all payroll records"""
         return self.db.get_all_payroll()
@@ -63,11 +143,9 @@ class PayrollController:
         if not data.get('employee_id'):
             return (False, "Employee ID is required")
 
-        if not data.get('month') or not (1 <= int(data['month']) <= 12):
-            return (False, "Invalid month")
-
-        if not data.get('year') or int(data['year']) < 2020:
-            return (False, "Invalid year")
+        is_valid, message = self.validate_period(data.get('month'), data.get('year'))
+        if not is_valid:
+            return (is_valid, message)
 
         try:
             float(data.get('base_salary', 0))
@@ -85,6 +163,25 @@ class PayrollController:
 
         return (True, "Valid")
 
+    def validate_period(self, month, year):
+        """
+        Validate a pay period.
+
+        Args:
+            month (int): Month number (1-12)
+            year (int): Year
+
+        Returns:
+            tuple: (valid: bool, message: str)
+        """
+        if not month or not (1 <= int(month) <= 12):
+            return (False, "Invalid month")
+
+        if not year or int(year) < 2020:
+            return (False, "Invalid year")
+
+        return (True, "Valid")
+
     def calculate_payroll(self, payroll_data):
         """
         Calculate payroll amounts.
@@ -95,23 +192,13 @@ class PayrollController:
         Returns:
             dict: Calculated payroll data
         """
-        base_salary = float(payroll_data.get('base_salary', 0))
-        bonus = float(payroll_data.get('bonus', 0))
-        deductions = float(payroll_data.get('deductions', 0))
+        base_salary = to_decimal(payroll_data.get('base_salary', 0))
+        bonus = to_decimal(payroll_data.get('bonus', 0))
+        deductions = to_decimal(payroll_data.get('deductions', 0))
         present_days = int(payroll_data.get('present_days', 0))
 
-        # Daily rate calculation
-        daily_rate = base_salary / 22  # 22 working days average
-        salary_based_on_attendance = daily_rate * present_days
-
-        # Total gross
-        gross_salary = salary_based_on_attendance + bonus
-
-        # Net salary
-        net_salary = gross_salary - deductions
-
-        # Ensure not negative
-        net_salary = max(0, net_salary)
+        # Daily rate x present days + bonus - deductions, never negative
+        net_salary = calculate_net_salary(base_salary, present_days, bonus, deductions)
 
         # Return processed data
         return {
@@ -129,6 +216,81 @@ class PayrollController:
             'released_date': payroll_data.get('released_date')
         }
 
+    def calculate_payroll_batch(self, payroll_rows):
+        """
+        Calculate payroll amounts for many employees in one columnar pass.
+
+        Args:
+            payroll_rows (list): Raw payroll dicts (same keys as calculate_payroll)
+
+        Returns:
+            list: Calculated payroll dicts, in input order
+        """
+        if not payroll_rows:
+            return []
+
+        base_salaries = centavos_array([row.get('base_salary', 0) for row in payroll_rows])
+        bonuses = centavos_array([row.get('bonus', 0) for row in payroll_rows])
+        deductions = centavos_array([row.get('deductions', 0) for row in payroll_rows])
+        present_days = [int(row.get('present_days', 0)) for row in payroll_rows]
+
+        net_salaries = calculate_net_centavos_array(base_salaries, present_days, bonuses, deductions)
+        processed_date = datetime.now()
+
+        return [
+            {
+                'employee_id': row['employee_id'],
+                'month': row['month'],
+                'year': row['year'],
+                'base_salary': from_centavos(base_salaries[i]),
+                'bonus': from_centavos(bonuses[i]),
+                'deductions': from_centavos(deductions[i]),
+                'net_salary': from_centavos(net_salaries[i]),
+                'present_days': present_days[i],
+                'status': row.get('status', 'Pending'),
+                'notes': row.get('notes', ''),
+                'processed_date': processed_date,
+                'released_date': row.get('released_date')
+            }
+            for i, row in enumerate(payroll_rows)
+        ]
+
+    def simulate_payroll_period(self, month, year, employee_filter=None, salary_factor=1.0,
+                                bonus=0.0, deductions=0.0):
+        """
+        What-if payroll for a period without writing anything.
+
+        Args:
+            month (int): Month number (1-12)
+            year (int): Year
+            employee_filter (dict): Optional 'department', 'role' and/or 'employee_ids'
+            salary_factor (float): Multiplier applied to every base salary (e.g. 1.05 for +5%)
+            bonus (float): Bonus given to every employee
+            deductions (float): Deductions applied to every employee
+
+        Returns:
+            dict: employee_count, total_net_salary (Decimal) and per-employee net_salaries
+        """
+        employees = self.db.get_active_employees(employee_filter)
+        attendance_counts = self.db.get_attendance_counts(int(month), int(year))
+
+        employee_ids = [e['Employee_ID'] for e in employees]
+        factor = Decimal(str(salary_factor))
+        base_salaries = centavos_array([to_decimal(e.get('Salary')) * factor for e in employees])
+        present_days = [min(attendance_counts.get(emp_id, 0), 31) for emp_id in employee_ids]
+        count = len(employees)
+
+        net_salaries = calculate_net_centavos_array(
+            base_salaries, present_days,
+            centavos_array([bonus] * count), centavos_array([deductions] * count)
+        )
+
+        return {
+            'employee_count': count,
+            'total_net_salary': sum_centavos(net_salaries),
+            'net_salaries': dict(zip(employee_ids, (from_centavos(n) for n in net_salaries)))
+        }
+
     def calculate_total_payroll(self, payroll_records):
         """
         Calculate total payroll amount from records.
@@ -137,31 +299,33 @@ class PayrollController:
             payroll_records (list): List of payroll records
 
         Returns:
-            float: Total payroll amount
+            Decimal: Total payroll amount (exact, same as SQL SUM)
         """
-        total = 0.0
+        total_centavos = 0
         for record in payroll_records:
             try:
-                total += float(record.get('net_salary', 0))
+                total_centavos += to_centavos(record.get('net_salary', 0))
             except (ValueError, TypeError):
                 pass
-        return total
+        return from_centavos(total_centavos)
 
-    def get_payroll_summary(self):
+    def get_payroll_summary(self, month=None, year=None, department=None, status=None):
         """
         Get payroll summary statistics.
 
+        Computed by the database in one aggregate query, so memory use does
+        not grow with the number of payroll records.
+
+        Args:
+            month (int): Optional month number (1-12)
+            year (int): Optional year
+            department (str): Optional employee department
+            status (str): Optional payroll status
+
         Returns:
             dict: Summary statistics
         """
-        all_payroll = self.get_all_payroll()
-
-        return {
-            'total_records': len(all_payroll),
-            'total_amount': self.calculate_total_payroll(all_payroll),
-            'pending_count': len([p for p in all_payroll if p.get('status') == 'Pending']),
-            'released_count': len([p for p in all_payroll if p.get('status') == 'Released'])
-        }
+        return self.db.get_payroll_summary(month=month, year=year, department=department, status=status)
 
     def release_payroll(self, payroll_id):
         """
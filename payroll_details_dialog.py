@@ -6,6 +6,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont
+from Controller.utils.async_query import AsyncQueryRunner
 
 
 class PayrollDetailsWindow(QMainWindow):
@@ -20,6 +21,9 @@ class PayrollDetailsWindow(QMainWindow):
         self.user_info = user_info or {'name': 'Admin', 'role': 'admin'}
         self.db = db_manager
 
+        # Status updates run in the background so the window stays responsive
+        self.query_runner = AsyncQueryRunner(self)
+
         self.setWindowTitle("PayEase - Payroll Details")
         self.setMinimumSize(1200, 900)
 
@@ -554,46 +558,43 @@ class PayrollDetailsWindow(QMainWindow):
             QMessageBox.critical(self, "Error", "Cannot update status: Database not available")
             return
 
-        try:
-            # Update in database
-            payroll_id = self.payroll_data['id']
-
-            if not self.db.is_connected():
-                self.db.connect()
-
-            # Build update query
-            if released_date and new_status == 'Released':
-                query = "UPDATE payroll SET status = %s, released_date = %s WHERE id = %s"
-                self.db.cursor.execute(query, (new_status, released_date, payroll_id))
-            else:
-                query = "UPDATE payroll SET status = %s WHERE id = %s"
-                self.db.cursor.execute(query, (new_status, payroll_id))
-
-            self.db.connection.commit()
-
-            # Update local data
-            self.payroll_data['status'] = new_status
-            if released_date:
-                self.payroll_data['released_date'] = released_date
-
-            # Show success message
-            QMessageBox.information(
-                self,
-                "Status Updated",
-                f"Payroll status changed to: {new_status}"
-            )
-
-            # Refresh UI
-            self.refresh_ui()
-
-            # Emit signal to parent window
-            self.payroll_updated.emit()
-
-        except Exception as e:
-            print(f"[PAYROLL DETAILS] Error updating status: {e}")
-            import traceback
-            traceback.print_exc()
-            QMessageBox.critical(self, "Error", f"Failed to update status:\n{str(e)}")
+        # Update in database; buttons stay disabled until it finishes
+        for button in (self.pending_btn, self.release_btn, self.cancel_btn):
+            button.setEnabled(False)
+
+        self.query_runner.submit(
+            'status', self.db.update_payroll_status, self.payroll_data['id'], new_status, released_date,
+            on_result=lambda result: self.on_status_updated(result, new_status, released_date),
+            on_error=lambda message: self.on_status_updated((False, message), new_status, released_date),
+            supersede=False
+        )
+
+    def on_status_updated(self, result, new_status, released_date):
+        """Apply the outcome of a background status update"""
+        success, message = result
+        if not success:
+            print(f"[PAYROLL DETAILS] Error updating status: {message}")
+            self.update_button_states()
+            QMessageBox.critical(self, "Error", f"Failed to update status:\n{message}")
+            return
+
+        # Update local data
+        self.payroll_data['status'] = new_status
+        if released_date:
+            self.payroll_data['released_date'] = released_date
+
+        # Show success message
+        QMessageBox.information(
+            self,
+            "Status Updated",
+            f"Payroll status changed to: {new_status}"
+        )
+
+        # Refresh UI
+        self.refresh_ui()
+
+        # Emit signal to parent window
+        self.payroll_updated.emit()
 
     def refresh_ui(self):
         """Refresh the UI after status update"""
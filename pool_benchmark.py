@@ -0,0 +1,145 @@
+"""
+Connection Pool Benchmark for PayEase
+Concurrent query throughput of the pooled DatabaseConnection against the single shared connection
+
+With one shared connection every query waits for the one before it, so a
+slow payroll query holds up everything behind it, the login screen
+included. The pooled mode gives each operation its own connection. This
+runs the same mix of queries from several threads in both modes, and also
+times a quick lookup while a slow query is running.
+
+Usage:
+    python -m Model.pool_benchmark benchmark [--threads 1 4 8] [--queries 200] [--slow-seconds 0.5]
+"""
+
+import argparse
+import statistics
+import sys
+import threading
+import time
+
+from mysql.connector import Error
+
+
+def _run_queries(db, threads, queries):
+    """
+    Queries per second when threads each run queries lookups and summaries
+
+    Returns:
+        float: Queries per second over all threads
+    """
+    errors = []
+    barrier = threading.Barrier(threads)
+
+    def worker(index):
+        barrier.wait()
+        try:
+            for number in range(queries):
+                with db.checkout() as (connection, cursor):
+                    if number % 10 == 0:
+                        # One in ten is an aggregate over the payroll table
+                        cursor.execute("SELECT COUNT(*) AS total, COALESCE(SUM(net_salary), 0) AS amount "
+                                       "FROM payroll")
+                    else:
+                        cursor.execute("SELECT Employee_ID, FullName FROM employees WHERE Employee_ID = %s",
+                                       (f"E{(index * queries + number) % 1000:03d}",))
+                    cursor.fetchall()
+        except Error as e:
+            errors.append(str(e))
+
+    workers = [threading.Thread(target=worker, args=(index,)) for index in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    if errors:
+        raise Error(msg=f"{len(errors)} worker(s) failed, first error: {errors[0]}")
+    return threads * queries / elapsed if elapsed > 0 else 0.0
+
+
+def _lookup_during_slow_query(db, slow_seconds, lookups=20):
+    """
+    Median milliseconds of a quick lookup while another thread runs a slow query
+
+    Returns:
+        float: Median lookup latency
+    """
+    started = threading.Event()
+
+    def slow_query():
+        with db.checkout() as (connection, cursor):
+            started.set()
+            cursor.execute("SELECT SLEEP(%s) AS slept", (slow_seconds,))
+            cursor.fetchall()
+
+    slow = threading.Thread(target=slow_query)
+    slow.start()
+    started.wait()
+    time.sleep(0.01)  # Let the slow query reach the server
+
+    timings = []
+    for _ in range(lookups):
+        start = time.perf_counter()
+        with db.checkout() as (connection, cursor):
+            cursor.execute("SELECT 1 AS alive")
+            cursor.fetchall()
+        timings.append((time.perf_counter() - start) * 1000)
+        if not slow.is_alive():
+            break
+    slow.join()
+    return statistics.median(timings)
+
+
+def benchmark_pool(thread_counts=(1, 4, 8), queries=200, slow_seconds=0.5):
+    """
+    Throughput and blocking of the shared connection vs the pool
+
+    Returns:
+        list: (mode, threads, queries_per_second, lookup_ms_during_slow_query) tuples
+    """
+    from Model.database import DatabaseConnection
+
+    results = []
+    for mode in ('shared connection', 'pool'):
+        for threads in thread_counts:
+            # The pool gets one connection per thread plus one for the slow query test
+            db = DatabaseConnection(pool_size=threads + 1 if mode == 'pool' else None)
+            if not db.connect():
+                raise Error(msg="Could not connect to the database")
+            try:
+                rate = _run_queries(db, threads, queries)
+                blocked = _lookup_during_slow_query(db, slow_seconds)
+            finally:
+                db.disconnect()
+            results.append((mode, threads, rate, blocked))
+    return results
+
+
+def main(argv=None):
+    """Command line entry point; returns the process exit code"""
+    parser = argparse.ArgumentParser(description="Connection pool benchmark")
+    parser.add_argument('command', choices=['benchmark'])
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 4, 8])
+    parser.add_argument('--queries', type=int, default=200, help="Queries per thread")
+    parser.add_argument('--slow-seconds', type=float, default=0.5, help="Length of the slow query")
+    args = parser.parse_args(argv)
+
+    try:
+        results = benchmark_pool(args.threads, args.queries, args.slow_seconds)
+    except Error as e:
+        print(f"[POOL] Benchmark failed: {e}")
+        return 1
+
+    print(f"[POOL] {args.queries} queries per thread; lookup latency measured during a "
+          f"{args.slow_seconds:.1f}s query")
+    for mode, threads, rate, blocked in results:
+        print(f"[POOL]   {mode:<18} {threads:>3} threads: {rate:9.1f} queries/s   "
+              f"lookup during slow query {blocked:8.1f} ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,239 @@
+"""
+Row Records Module for PayEase
+Compact read-only rows for bulk reads, in place of one dict per row
+
+A dictionary cursor builds a new dict, with its own hash table, for every
+row. A Record is a tuple of the row's values. The column names live once,
+on a class made for that column list and cached, together with a
+name -> position index. Records answer the read side of the dict
+interface: record['FullName'], record.get('status', 'Present'),
+'id' in record, keys(), values(), items() and dict(record). So existing
+callers that only read rows work unchanged. A caller that needs to modify
+a row takes dict(record) first.
+
+Unlike a dict, a Record is still a tuple when iterated: list(record),
+tuple unpacking and json.dumps(record) give the values, not the column
+names. Iterate keys() or items() for names, or serialize dict(record).
+
+Usage:
+    python -m Model.row_records benchmark [--rows 1000000] [--database]
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from decimal import Decimal
+
+
+class Record(tuple):
+    """One row: a tuple of values (iterating gives values), readable by column name like a dict"""
+
+    __slots__ = ()
+    _fields = ()
+    _index = {}
+
+    def __getitem__(self, key):
+        if key.__class__ is str:
+            return tuple.__getitem__(self, self._index[key])
+        return tuple.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        """Value of a column, or default if the row has no such column"""
+        position = self._index.get(key)
+        return default if position is None else tuple.__getitem__(self, position)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def keys(self):
+        """Column names, in query order"""
+        return self._fields
+
+    def values(self):
+        """Values, in query order"""
+        return tuple(self)
+
+    def items(self):
+        """(column, value) pairs, in query order"""
+        return zip(self._fields, self)
+
+    def __repr__(self):
+        return f"Record({dict(self.items())!r})"
+
+    def __reduce__(self):
+        # Pickled as a plain dict, so no generated class has to exist on the other side
+        return (dict, (list(self.items()),))
+
+
+# Generated Record classes by column list, shared by every query with those columns
+_record_types = {}
+
+
+def record_type(columns):
+    """
+    Record class for a column list, created once and cached
+
+    Args:
+        columns (sequence): Column names as reported by cursor.column_names
+
+    Returns:
+        type: Record subclass
+    """
+    columns = tuple(columns)
+    cls = _record_types.get(columns)
+    if cls is None:
+        cls = type('Record', (Record,), {
+            '__slots__': (),
+            '_fields': columns,
+            '_index': {name: position for position, name in enumerate(columns)},
+        })
+        _record_types[columns] = cls
+    return cls
+
+
+def to_records(columns, rows):
+    """
+    Wrap tuple rows from a non-dictionary cursor
+
+    Args:
+        columns (sequence): cursor.column_names
+        rows (list): Tuples from fetchall() / fetchmany()
+
+    Returns:
+        list: Records
+    """
+    return list(map(record_type(columns), rows))
+
+
+# Benchmark: a payroll row as get_all_payroll() returns it (ALL_PAYROLL_QUERY over the
+# payroll table in payease_db.sql, plus the two joined employee columns)
+_PAYROLL_COLUMNS = ('id', 'employee_id', 'month', 'year', 'base_salary', 'bonus', 'deductions', 'net_salary',
+                    'present_days', 'status', 'notes', 'processed_date', 'created_at', 'released_date',
+                    'employee_name', 'position')
+
+
+def _sample_payroll_rows(count):
+    """Tuples shaped like payroll rows, as a plain cursor's fetchall() returns them"""
+    processed = datetime(2025, 12, 16, 16, 38, 28)
+    created = datetime(2025, 12, 16, 8, 38, 28)
+    released = datetime(2025, 12, 16, 16, 38, 44)
+    # base_salary, bonus, deductions, net_salary: DECIMAL(10,2)
+    amounts = [Decimal(value) for value in ('25000.00', '1500.00', '3370.50', '23129.50')]
+    for number in range(count):
+        yield (number, f"E{number % 5000:03d}", 'December', 2025, *amounts, '22 days', 'Released', '',
+               processed, created, released, f"Employee {number % 5000}", 'Staff')
+
+
+def _measure(build):
+    """
+    Time build() untraced, then run it again under tracemalloc
+
+    Returns:
+        tuple: (result, seconds, bytes still held by the result, peak bytes while building)
+    """
+    gc.collect()
+    start = time.perf_counter()
+    build()
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, held, peak
+
+
+def _scan(rows):
+    """Read three columns of every row, as a summary screen does; returns seconds"""
+    start = time.perf_counter()
+    total = Decimal(0)
+    released = 0
+    for row in rows:
+        total += row['net_salary']
+        if row.get('status') == 'Released':
+            released += 1
+        row['employee_name']
+    return time.perf_counter() - start
+
+
+def benchmark_rows(count=1_000_000):
+    """
+    Memory and throughput of dict rows vs Records for count payroll rows
+
+    Both sides start from the tuples a plain cursor returns; the dict side
+    builds what cursor(dictionary=True) builds per row. The values are
+    shared, so the memory figures are the row objects alone.
+
+    Returns:
+        list: (label, build_seconds, scan_seconds, held_bytes, peak_bytes) tuples
+    """
+    columns = _PAYROLL_COLUMNS
+    fetched = list(_sample_payroll_rows(count))
+
+    results = []
+    for label, build in (('dict rows', lambda: [dict(zip(columns, row)) for row in fetched]),
+                         ('records', lambda: to_records(columns, fetched))):
+        rows, build_seconds, held, peak = _measure(build)
+        results.append((label, build_seconds, _scan(rows), held, peak))
+        del rows
+    return results
+
+
+def benchmark_database(db):
+    """
+    get_all_payroll() with the dictionary cursor vs Records, on the real table
+
+    Memory here includes the values, which both sides hold alike.
+
+    Returns:
+        list: (label, fetch_seconds, scan_seconds, held_bytes, peak_bytes) tuples
+    """
+    from Model.database import ALL_PAYROLL_QUERY
+
+    def fetch_dicts():
+        with db.checkout() as (connection, cursor):
+            cursor.execute(ALL_PAYROLL_QUERY)
+            return cursor.fetchall()
+
+    results = []
+    for label, fetch in (('dict cursor', fetch_dicts), ('records', lambda: db.fetch_records(ALL_PAYROLL_QUERY))):
+        rows, fetch_seconds, held, peak = _measure(fetch)
+        results.append((f"{label} ({len(rows):,} rows)", fetch_seconds, _scan(rows), held, peak))
+        del rows
+    return results
+
+
+def main(argv=None):
+    """Command line entry point; returns the process exit code"""
+    parser = argparse.ArgumentParser(description="Row representation benchmark")
+    parser.add_argument('command', choices=['benchmark'])
+    parser.add_argument('--rows', type=int, default=1_000_000, help="Synthetic payroll rows")
+    parser.add_argument('--database', action='store_true', help="Read the payroll table instead")
+    args = parser.parse_args(argv)
+
+    if args.database:
+        from Model.database import DatabaseConnection
+        db = DatabaseConnection(pool_size=1)
+        if not db.connect():
+            print("[ROWS] Could not connect to the database")
+            return 2
+        try:
+            results = benchmark_database(db)
+        finally:
+            db.disconnect()
+    else:
+        print(f"[ROWS] {args.rows:,} synthetic payroll rows, {len(_PAYROLL_COLUMNS)} columns")
+        results = benchmark_rows(args.rows)
+
+    for label, build_seconds, scan_seconds, held, peak in results:
+        print(f"[ROWS]   {label:<24} build {build_seconds:6.2f}s   scan {scan_seconds:6.2f}s   "
+              f"held {held / 1024 / 1024:8.1f} MiB   peak {peak / 1024 / 1024:8.1f} MiB")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
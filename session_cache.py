@@ -0,0 +1,130 @@
+"""
+Session Cache for PayEase
+Keeps the logged-in employee's profile and payslips in memory for the session
+
+Self-service screens read from here instead of querying on every
+navigation. Entries are dropped as soon as a change event says they are
+stale: an edit to the employee record clears the profile (and the payslips,
+which carry the employee's name and position); a payroll added, deleted or
+re-statused for this employee clears the payslips. A TTL covers writes made
+by other clients, which this process never hears about.
+"""
+
+import threading
+import time
+
+from Model.database import get_db_connection
+
+
+class SessionCache:
+    """Profile and payslip history of one logged-in employee"""
+
+    def __init__(self, db, employee_id, ttl=300):
+        """
+        Initialize cache
+
+        Args:
+            db (DatabaseConnection): Database to read from and listen to
+            employee_id (str): Employee the session belongs to
+            ttl (float): Seconds an entry may be served without a change event
+        """
+        self.db = db
+        self.employee_id = employee_id
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = {}  # name -> (loaded_at, value)
+        self._generation = 0  # Bumped by every invalidation
+
+        self.db.add_change_listener(self.on_change)
+
+    def _get(self, name, load):
+        """Cached value for name, loading it when missing or expired"""
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry and time.monotonic() - entry[0] <= self.ttl:
+                return entry[1]
+            generation = self._generation
+
+        value = load()
+        with self._lock:
+            # Not kept if an invalidation arrived while loading; it may predate that write
+            if generation == self._generation:
+                self._entries[name] = (time.monotonic(), value)
+        return value
+
+    def profile(self):
+        """Employee record (dict) or None"""
+        return self._get('profile', lambda: self.db.get_employee_by_id(self.employee_id))
+
+    def payslips(self):
+        """Payroll records for the employee, newest first"""
+        return self._get('payslips', lambda: self.db.get_employee_payroll(self.employee_id))
+
+    def invalidate(self, *names):
+        """Drop the named entries ('profile', 'payslips'), or all of them"""
+        with self._lock:
+            self._generation += 1
+            if not names:
+                self._entries.clear()
+            for name in names:
+                self._entries.pop(name, None)
+
+    def _has_payslip(self, payroll_id):
+        """Check if a payroll id is among the cached payslips"""
+        with self._lock:
+            entry = self._entries.get('payslips')
+        return bool(entry) and any(record.get('id') == payroll_id for record in entry[1])
+
+    def on_change(self, event, details):
+        """Change listener: drop entries a committed write made stale"""
+        if event in ('employee_updated', 'employee_deleted'):
+            if details.get('employee_id') == self.employee_id:
+                self.invalidate('profile', 'payslips')
+
+        elif event == 'payroll_added':
+            if (details.get('record') or {}).get('employee_id') == self.employee_id:
+                self.invalidate('payslips')
+
+        elif event == 'payroll_batch_added':
+            if any(record.get('employee_id') == self.employee_id for record in details.get('records') or []):
+                self.invalidate('payslips')
+
+        elif event == 'payroll_deleted':
+            if (details.get('previous') or {}).get('employee_id') == self.employee_id:
+                self.invalidate('payslips')
+
+        elif event == 'payroll_status_changed':
+            if self._has_payslip(details.get('payroll_id')):
+                self.invalidate('payslips')
+
+    def close(self):
+        """Stop listening and forget everything"""
+        self.db.remove_change_listener(self.on_change)
+        self.invalidate()
+
+
+# Cache of the current session
+_session_instance = None
+
+
+def start_session(employee_id, db=None):
+    """
+    Get the cache for employee_id, replacing one left over from another user
+
+    Returns:
+        SessionCache: Cache for the logged-in employee
+    """
+    global _session_instance
+    if _session_instance is not None and _session_instance.employee_id != employee_id:
+        end_session()
+    if _session_instance is None:
+        _session_instance = SessionCache(db or get_db_connection(), employee_id)
+    return _session_instance
+
+
+def end_session():
+    """Discard the current session cache (on logout)"""
+    global _session_instance
+    if _session_instance is not None:
+        _session_instance.close()
+        _session_instance = None
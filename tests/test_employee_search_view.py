@@ -0,0 +1,53 @@
+"""
+The employee table shows a server search page as the server returned it
+"""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("mysql.connector")
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+
+from Controller.handlers.employee_management_controller import (
+    EmployeeFilterProxyModel, EmployeeManagementWindow, EmployeeTableModel
+)
+
+
+@pytest.fixture(scope='module')
+def app():
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def _employee(employee_id, name, email, department):
+    return {'Employee_ID': employee_id, 'FullName': name, 'Email': email, 'Role': 'Employee',
+            'Position': 'Staff', 'Department': department, 'is_archived': 0}
+
+
+# Matched by the server (department word, substring) but by no name/email word prefix
+SERVER_PAGES = {
+    'finance': [_employee('E002', 'Ana Cruz', 'ana@payease.ph', 'Finance'),
+                _employee('E001', 'Ben Santos', 'ben@payease.ph', 'Finance')],
+    'ria': [_employee('E003', 'Maria Reyes', 'maria@payease.ph', 'Operations')],
+}
+
+
+@pytest.mark.parametrize('search', sorted(SERVER_PAGES))
+def test_server_page_is_not_filtered_again(app, search):
+    model = EmployeeTableModel()
+    proxy = EmployeeFilterProxyModel()
+    proxy.setSourceModel(model)
+    model.reset([_employee('E009', 'Carl Lim', 'carl@payease.ph', 'Sales')])
+
+    # Typing narrows the loaded rows by the local rule straight away
+    proxy.set_search_text(search)
+    assert proxy.rowCount() == 0
+
+    # The debounced server page replaces them and is shown whole
+    window = SimpleNamespace(table_model=model, proxy_model=proxy, next_cursor=None, show_archived=False,
+                             update_empty_span=lambda: None)
+    EmployeeManagementWindow.display_employees(window, SERVER_PAGES[search])
+
+    assert proxy.rowCount() == len(SERVER_PAGES[search])
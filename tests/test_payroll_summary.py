@@ -0,0 +1,141 @@
+"""
+get_payroll_summary() against the Python three-pass summary it replaced
+
+The aggregate query runs on an in-memory SQLite copy of the payroll and
+employees tables, behind a cursor that speaks the mysql-connector
+interface the DatabaseConnection uses.
+"""
+
+import calendar
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+pytest.importorskip("mysql.connector")
+
+from Controller.utils.money import from_centavos, to_centavos
+from Model.database import DatabaseConnection
+
+
+EMPLOYEES = [
+    ('E001', 'Ana Cruz', 'Finance'),
+    ('E002', 'Ben Santos', 'Finance'),
+    ('E003', 'Maria Reyes', 'Operations'),
+    ('E1000', 'Carl Lim', 'Sales'),
+]
+
+# (employee_id, month, year, net_salary, status); amounts are exact in binary so SQLite's SUM stays exact.
+# Older rows store the month name, newer ones its number.
+PAYROLL = [
+    ('E001', 'December', 2025, '113456.00', 'Released'),
+    ('E001', '1', 2026, '25000.25', 'Pending'),
+    ('E002', '12', 2025, '1019800.50', 'Released'),
+    ('E002', 'January', 2026, '30000.75', 'Pending'),
+    ('E003', '12', 2025, '18000.00', 'Processed'),
+    ('E003', '1', 2026, '18250.25', 'Released'),
+    ('E1000', 'January', 2026, '5000100.00', 'Pending'),
+    ('E404', '1', 2026, '999.50', 'Pending'),  # Employee since deleted
+]
+
+
+class SqliteCursor:
+    """mysql-connector style cursor (%s placeholders, dict rows, column_names) over sqlite3"""
+
+    def __init__(self, connection, dictionary=True):
+        self._cursor = connection.cursor()
+        self._dictionary = dictionary
+
+    @property
+    def column_names(self):
+        return tuple(column[0] for column in self._cursor.description)
+
+    def execute(self, query, params=()):
+        self._cursor.execute(query.replace('%s', '?'), tuple(params))
+
+    def _row(self, row):
+        return dict(zip(self.column_names, row)) if self._dictionary else row
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        return None if row is None else self._row(row)
+
+    def fetchall(self):
+        return [self._row(row) for row in self._cursor.fetchall()]
+
+    def fetchmany(self, size):
+        return [self._row(row) for row in self._cursor.fetchmany(size)]
+
+    def close(self):
+        self._cursor.close()
+
+
+@pytest.fixture
+def db():
+    connection = sqlite3.connect(':memory:')
+    connection.executescript("""
+        CREATE TABLE employees (Employee_ID TEXT PRIMARY KEY, FullName TEXT, Position TEXT, Department TEXT);
+        CREATE TABLE payroll (id INTEGER PRIMARY KEY, employee_id TEXT, month TEXT, year INTEGER,
+                              net_salary REAL, status TEXT, processed_date TEXT);
+    """)
+    connection.executemany("INSERT INTO employees VALUES (?, ?, 'Staff', ?)", EMPLOYEES)
+    connection.executemany(
+        "INSERT INTO payroll (employee_id, month, year, net_salary, status, processed_date) VALUES (?, ?, ?, ?, ?, ?)",
+        [(employee_id, month, year, float(amount), status, datetime(year, 1, 1).isoformat())
+         for employee_id, month, year, amount, status in PAYROLL])
+
+    database = DatabaseConnection(pool_size=None)
+
+    @contextmanager
+    def checkout(dictionary=True):
+        cursor = SqliteCursor(connection, dictionary)
+        try:
+            yield connection, cursor
+        finally:
+            cursor.close()
+
+    database.checkout = checkout
+    yield database
+    connection.close()
+
+
+def python_summary(month=None, year=None, department=None, status=None):
+    """The summary as PayrollController built it: every row read, then three passes"""
+    departments = {employee_id: dept for employee_id, _, dept in EMPLOYEES}
+    rows = [
+        {'employee_id': employee_id, 'month': row_month, 'year': row_year,
+         'net_salary': Decimal(amount), 'status': row_status}
+        for employee_id, row_month, row_year, amount, row_status in PAYROLL
+        if (not month or row_month in (str(month), calendar.month_name[month]))
+        and (not year or row_year == year)
+        and (not department or departments.get(employee_id) == department)
+        and (not status or row_status == status)
+    ]
+    return {
+        'total_records': len(rows),
+        'total_amount': from_centavos(sum(to_centavos(row.get('net_salary', 0)) for row in rows)),
+        'pending_count': len([row for row in rows if row.get('status') == 'Pending']),
+        'released_count': len([row for row in rows if row.get('status') == 'Released'])
+    }
+
+
+@pytest.mark.parametrize('filters', [
+    {},
+    {'month': 12, 'year': 2025},
+    {'month': 1, 'year': 2026},
+    {'year': 2026},
+    {'status': 'Pending'},
+    {'status': 'Released'},
+    {'department': 'Finance'},
+    {'department': 'Sales', 'status': 'Pending'},
+    {'department': 'Finance', 'month': 1, 'year': 2026, 'status': 'Pending'},
+    {'department': 'Nobody'},
+])
+def test_summary_matches_python_result(db, filters):
+    assert db.get_payroll_summary(**filters) == python_summary(**filters)
+
+
+def test_check_payroll_summary_finds_no_differences(db):
+    assert db.check_payroll_summary() == []
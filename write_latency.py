@@ -0,0 +1,281 @@
+"""
+Write Latency Benchmark for PayEase
+Times employee writes the old way (look up, then write) against the current one
+
+The old add, update and delete paths asked the database first: a SELECT for
+the username and email before inserting, and a get_employee_by_id() before
+every UPDATE or DELETE, each on its own connection checkout. The current
+paths write straight away and read the outcome from the matched-row count or
+a duplicate-key error. Both are run here against throwaway BENCH rows, which
+are removed afterwards. Password hashing is left out of the add timings; it
+costs the same either way.
+
+Besides latency, each path reports its round trips per write, counted on
+the way through db.checkout(): statements, commits and rollbacks, plus the
+ping and session reset every pooled checkout costs.
+
+Usage:
+    python -m Model.write_latency benchmark [--rounds 200]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from mysql.connector import Error
+
+
+BENCH_PREFIX = 'BENCH'
+BENCH_HASH = '$2b$04$' + 'x' * 53  # Never matches a password; only its size matters
+
+
+def _bench_row(number):
+    """employees and accounts values for benchmark employee number"""
+    employee_id = f"{BENCH_PREFIX}{number:05d}"
+    return {
+        'employee': (employee_id, f"Bench Employee {number}", f"bench{number}@bench.invalid", 'Employee',
+                     'Tester', 1000, 'Benchmark', '', '', datetime.now().strftime('%Y-%m-%d')),
+        'account': (f"bench_{number}", BENCH_HASH, '', 'employee', employee_id, datetime.now()),
+        'employee_id': employee_id,
+        'username': f"bench_{number}",
+        'email': f"bench{number}@bench.invalid",
+    }
+
+
+EMPLOYEE_INSERT = """
+    INSERT INTO employees
+    (Employee_ID, FullName, Email, Role, Position, Salary, Department, Phone, Address, data_hired, is_archived)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 0)
+"""
+ACCOUNT_INSERT = """
+    INSERT INTO accounts (username, password_hash, salt, role, employee_id, password_changed_at)
+    VALUES (%s, %s, %s, %s, %s, %s)
+"""
+
+
+def legacy_add(db, row):
+    """Duplicate lookups, then employee and account inserts committed separately"""
+    with db.checkout() as (connection, cursor):
+        cursor.execute("SELECT username FROM accounts WHERE username = %s", (row['username'],))
+        cursor.fetchall()
+        cursor.execute("SELECT Email FROM employees WHERE Email = %s", (row['email'],))
+        cursor.fetchall()
+    with db.checkout() as (connection, cursor):
+        cursor.execute(EMPLOYEE_INSERT, row['employee'])
+        connection.commit()
+    with db.checkout() as (connection, cursor):
+        cursor.execute(ACCOUNT_INSERT, row['account'])
+        connection.commit()
+
+
+def current_add(db, row):
+    """Both inserts in one transaction; unique keys report duplicates"""
+    with db.checkout() as (connection, cursor):
+        cursor.execute(EMPLOYEE_INSERT, row['employee'])
+        cursor.execute(ACCOUNT_INSERT, row['account'])
+        connection.commit()
+
+
+def legacy_update(db, row):
+    """SELECT * on one checkout, UPDATE on another"""
+    with db.checkout() as (connection, cursor):
+        cursor.execute("SELECT * FROM employees WHERE Employee_ID = %s", (row['employee_id'],))
+        cursor.fetchone()
+    with db.checkout() as (connection, cursor):
+        cursor.execute("UPDATE employees SET Phone = %s WHERE Employee_ID = %s", ('555-0100', row['employee_id']))
+        connection.commit()
+
+
+def current_update(db, row):
+    """update_employee(): one UPDATE, checked by its matched-row count"""
+    db.update_employee(row['employee_id'], {'phone': '555-0100'})
+
+
+def legacy_archive(db, row):
+    """SELECT * on one checkout, UPDATE of is_archived on another"""
+    with db.checkout() as (connection, cursor):
+        cursor.execute("SELECT * FROM employees WHERE Employee_ID = %s", (row['employee_id'],))
+        cursor.fetchone()
+    with db.checkout() as (connection, cursor):
+        cursor.execute("UPDATE employees SET is_archived = 1 WHERE Employee_ID = %s", (row['employee_id'],))
+        connection.commit()
+
+
+def current_archive(db, row):
+    """archive_employee(): one conditional UPDATE"""
+    db.archive_employee(row['employee_id'])
+
+
+def legacy_delete(db, row):
+    """SELECT * on one checkout, DELETE on another"""
+    with db.checkout() as (connection, cursor):
+        cursor.execute("SELECT * FROM employees WHERE Employee_ID = %s", (row['employee_id'],))
+        cursor.fetchone()
+    with db.checkout() as (connection, cursor):
+        cursor.execute("DELETE FROM employees WHERE Employee_ID = %s", (row['employee_id'],))
+        connection.commit()
+
+
+def current_delete(db, row):
+    """delete_employee(): one DELETE, checked by its row count"""
+    db.delete_employee(row['employee_id'])
+
+
+class _CountingCursor:
+    """Cursor proxy counting the statements sent"""
+
+    def __init__(self, cursor, counter):
+        self._cursor = cursor
+        self._counter = counter
+
+    def execute(self, *args, **kwargs):
+        self._counter.round_trips += 1
+        return self._cursor.execute(*args, **kwargs)
+
+    def executemany(self, *args, **kwargs):
+        self._counter.round_trips += 1
+        return self._cursor.executemany(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class _CountingConnection:
+    """Connection proxy counting commits and rollbacks"""
+
+    def __init__(self, connection, counter):
+        self._connection = connection
+        self._counter = counter
+
+    def commit(self):
+        self._counter.round_trips += 1
+        return self._connection.commit()
+
+    def rollback(self):
+        self._counter.round_trips += 1
+        return self._connection.rollback()
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+
+class RoundTripCounter:
+    """Counts the round trips made through db.checkout() while installed"""
+
+    CHECKOUT_ROUND_TRIPS = 2  # Health-check ping on the way out, session reset on the way back
+
+    def __init__(self, db):
+        self.db = db
+        self.round_trips = 0
+        self._checkout = db.checkout
+
+    @contextmanager
+    def checkout(self, *args, **kwargs):
+        if self.db.pool is not None:
+            self.round_trips += self.CHECKOUT_ROUND_TRIPS
+        with self._checkout(*args, **kwargs) as (connection, cursor):
+            yield _CountingConnection(connection, self), _CountingCursor(cursor, self)
+
+    def __enter__(self):
+        self.db.checkout = self.checkout
+        return self
+
+    def __exit__(self, *exc):
+        del self.db.checkout  # Back to the class method
+
+
+def _time(func, db, rows):
+    """
+    Latency and round trips of func(db, row) for every row
+
+    Returns:
+        tuple: (milliseconds per call, round trips per call)
+    """
+    timings = []
+    with RoundTripCounter(db) as counter:
+        for row in rows:
+            start = time.perf_counter()
+            func(db, row)
+            timings.append((time.perf_counter() - start) * 1000)
+    return timings, counter.round_trips / max(len(rows), 1)
+
+
+def _cleanup(db):
+    """Remove every benchmark row"""
+    with db.checkout() as (connection, cursor):
+        cursor.execute("DELETE FROM accounts WHERE employee_id LIKE %s", (f"{BENCH_PREFIX}%",))
+        cursor.execute("DELETE FROM employees WHERE Employee_ID LIKE %s", (f"{BENCH_PREFIX}%",))
+        connection.commit()
+    db.employee_cache.clear()
+
+
+def benchmark_writes(db, rounds=200):
+    """
+    Median and 95th percentile latency of each write, old path vs current
+
+    Returns:
+        list: (operation, path, median_ms, p95_ms, round_trips) tuples
+    """
+    results = []
+
+    def record(operation, path, measured):
+        timings, round_trips = measured
+        timings = sorted(timings)
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        results.append((operation, path, statistics.median(timings), p95, round_trips))
+
+    _cleanup(db)
+    try:
+        legacy_rows = [_bench_row(number) for number in range(rounds)]
+        current_rows = [_bench_row(number) for number in range(rounds, 2 * rounds)]
+
+        record('add', 'lookup + write', _time(legacy_add, db, legacy_rows))
+        record('add', 'single transaction', _time(current_add, db, current_rows))
+
+        record('update', 'lookup + write', _time(legacy_update, db, legacy_rows))
+        record('update', 'rowcount', _time(current_update, db, current_rows))
+
+        record('archive', 'lookup + write', _time(legacy_archive, db, legacy_rows))
+        record('archive', 'conditional update', _time(current_archive, db, current_rows))
+
+        record('delete', 'lookup + write', _time(legacy_delete, db, legacy_rows))
+        record('delete', 'rowcount', _time(current_delete, db, current_rows))
+    finally:
+        _cleanup(db)
+    return results
+
+
+def main(argv=None):
+    """Command line entry point; returns the process exit code"""
+    from Model.database import DatabaseConnection
+
+    parser = argparse.ArgumentParser(description="Employee write latency benchmark")
+    parser.add_argument('command', choices=['benchmark'])
+    parser.add_argument('--rounds', type=int, default=200, help="Employees written per path")
+    args = parser.parse_args(argv)
+
+    db = DatabaseConnection(pool_size=2)
+    if not db.connect():
+        print("[BENCH] Could not connect to the database")
+        return 2
+
+    try:
+        results = benchmark_writes(db, args.rounds)
+    except Error as e:
+        print(f"[BENCH] Benchmark failed: {e}")
+        return 1
+    finally:
+        db.disconnect()
+
+    print(f"[BENCH] {args.rounds} writes per path (ms, round trips per write)")
+    for operation, path, median, p95, round_trips in results:
+        print(f"[BENCH]   {operation:<7} {path:<20} median {median:7.2f}   p95 {p95:7.2f}   "
+              f"round trips {round_trips:4.1f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())